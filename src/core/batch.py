@@ -0,0 +1,268 @@
+"""키워드 목록(CSV/JSONL)에 대한 대량 블로그 포스트 생성 기능입니다."""
+
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from src.core.content_generator import GENERATION_STATS
+from src.core.dedup import DuplicateRequestError, find_similar_within
+from src.core.options import DEFAULT_CONCURRENCY, DEFAULT_REQUESTS_PER_MINUTE
+from src.core.pipeline import run_blog_post_pipeline_async
+from src.utils.cache import get_response_cache
+from src.utils.rate_limit import AsyncRateLimiter
+from src.utils.telemetry import TELEMETRY, percentile
+
+
+def load_batch_rows(input_path: str) -> list[dict[str, any]]:
+    """CSV 또는 JSONL 파일에서 `user_input` 행 목록을 읽습니다.
+
+    Args:
+        input_path: `.csv` 또는 `.jsonl` 확장자의 입력 파일 경로.
+
+    Returns:
+        `run_blog_post_pipeline`에 그대로 전달할 수 있는 딕셔너리 목록.
+
+    Raises:
+        ValueError: 지원하지 않는 확장자인 경우.
+    """
+    extension = os.path.splitext(input_path)[1].lower()
+    rows = []
+
+    if extension == '.csv':
+        with open(input_path, newline='', encoding='utf-8') as f:
+            rows = [dict(row) for row in csv.DictReader(f)]
+    elif extension in ('.jsonl', '.ndjson'):
+        with open(input_path, encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        raise ValueError(f"지원하지 않는 입력 형식입니다: {input_path} (csv 또는 jsonl만 지원)")
+
+    for row in rows:
+        # CSV values are always strings
+        if row.get('num_subheadings') not in (None, ''):
+            row['num_subheadings'] = int(row['num_subheadings'])
+        else:
+            row.pop('num_subheadings', None)
+    return rows
+
+
+def row_key(user_input: dict[str, any]) -> str:
+    """재시작 시 완료 여부를 판별하기 위한 행의 고유 키를 계산합니다."""
+    canonical = json.dumps(user_input, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class BatchProgress:
+    """완료된 행을 JSONL 파일에 기록하여 중단된 배치를 이어서 실행할 수 있게 합니다.
+
+    Args:
+        progress_path: 진행 상황 파일 경로. None이면 진행 상황을 저장하지 않습니다.
+    """
+
+    def __init__(self, progress_path: str | None):
+        self.progress_path = progress_path
+        self.completed: set[str] = set()
+        if progress_path and os.path.exists(progress_path):
+            with open(progress_path, encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-write can leave a truncated last line
+                        continue
+                    if record.get('status') == 'done':
+                        self.completed.add(record['key'])
+
+    def is_done(self, key: str) -> bool:
+        return key in self.completed
+
+    def record(self, key: str, keyword: str, status: str, error: str | None = None) -> None:
+        """행 처리 결과를 진행 상황 파일에 추가합니다."""
+        if status == 'done':
+            self.completed.add(key)
+        if not self.progress_path:
+            return
+        record = {"key": key, "keyword": keyword, "status": status, "error": error}
+        with open(self.progress_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@dataclass
+class BatchSummary:
+    """배치 실행 결과 요약입니다."""
+
+    total: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+    latencies_seconds: list[float] = field(default_factory=list)
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """이번 실행에서 처리한 행 수 기준의 분당 처리량입니다."""
+        processed = self.succeeded + self.failed
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return processed / self.elapsed_seconds * 60
+
+    def format(self) -> str:
+        lines = [
+            "=== 배치 실행 요약 ===",
+            f"전체: {self.total}건 (건너뜀 {self.skipped}건, 중복으로 건너뜀 {self.duplicates}건)",
+            f"성공: {self.succeeded}건 / 실패: {self.failed}건",
+            f"소요 시간: {self.elapsed_seconds:.1f}초, 처리량: {self.throughput_per_minute:.1f}건/분",
+        ]
+        if self.latencies_seconds:
+            lines.append(
+                f"행별 소요 시간: p50 {percentile(self.latencies_seconds, 50):.2f}초, "
+                f"p95 {percentile(self.latencies_seconds, 95):.2f}초"
+            )
+        for keyword, error in self.failures:
+            lines.append(f"  - 실패 [{keyword}]: {error}")
+        return "\n".join(lines)
+
+
+async def run_batch_async(
+    rows: list[dict[str, any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    progress_path: str | None = None,
+    save_to_file: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    engine: str = "single",
+    duplicate_policy_default: str = "off",
+) -> BatchSummary:
+    """제한된 수의 비동기 워커로 여러 `user_input`에 대해 파이프라인을 실행합니다.
+
+    동시에 실행되는 행은 서로의 결과를 볼 수 없으므로, 같은 배치 안의 비슷한 요청은 실행 전에
+    행끼리 비교하여 `duplicate_policy`에 따라 경고하거나 건너뜁니다.
+
+    Args:
+        rows: 처리할 `user_input` 딕셔너리 목록.
+        concurrency: 동시에 실행할 최대 파이프라인 수.
+        requests_per_minute: 전체 워커가 공유하는 분당 Gemini 요청 예산.
+        progress_path: 완료 기록 파일 경로. 이미 완료된 행은 건너뜁니다.
+        save_to_file: 생성된 마크다운을 파일로 저장할지 여부.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+        engine: 콘텐츠 생성 방식 ("single" 또는 "fanout").
+        duplicate_policy_default: `duplicate_policy` 열이 없는 행에 적용할 중복 처리 방식.
+
+    Returns:
+        처리량과 실패 내역을 담은 `BatchSummary`.
+    """
+    summary = BatchSummary(total=len(rows))
+    progress = BatchProgress(progress_path)
+    rate_limiter = AsyncRateLimiter(requests_per_minute)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    pending_rows = []
+    for row in rows:
+        # The row key is computed before the default policy is applied so existing progress files still match
+        key = row_key(row)
+        if progress.is_done(key):
+            summary.skipped += 1
+        else:
+            pending_rows.append((key, {**row, 'duplicate_policy': row.get('duplicate_policy') or duplicate_policy_default}))
+
+    # Invalid policies are left to the pipeline so they fail only their own row
+    checked = [(key, row) for key, row in pending_rows if row['duplicate_policy'] in ("flag", "skip")]
+    within = find_similar_within([row for _, row in checked])
+    duplicate_keys = set()
+    for index, match in within.items():
+        key, row = checked[index]
+        message = f"같은 배치의 요청과 비슷합니다: {match.keyword} (유사도 {match.score:.2f})"
+        if row['duplicate_policy'] == "skip":
+            duplicate_keys.add(key)
+            summary.duplicates += 1
+            progress.record(key, row.get('keyword', ''), 'duplicate', message)
+        label = "중복으로 건너뜀" if key in duplicate_keys else "중복 요청"
+        print(f"[배치] {label}: {row.get('keyword', '')} - {message}")
+    for key, row in pending_rows:
+        if key not in duplicate_keys:
+            queue.put_nowait((key, row))
+
+    pending = queue.qsize()
+
+    async def worker() -> None:
+        while True:
+            try:
+                key, row = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            keyword = row.get('keyword', '')
+            row_start = time.perf_counter()
+            try:
+                if not keyword:
+                    raise ValueError("키워드가 비어 있습니다.")
+                await run_blog_post_pipeline_async(row, save_to_file, rate_limiter, use_cache, refresh_cache, engine)
+            except DuplicateRequestError as e:
+                summary.duplicates += 1
+                progress.record(key, keyword, 'duplicate', str(e))
+                print(f"[배치] 중복으로 건너뜀: {keyword} - {e}")
+            except Exception as e:
+                summary.failed += 1
+                summary.failures.append((keyword, str(e)))
+                progress.record(key, keyword, 'failed', str(e))
+                print(f"[배치] 실패: {keyword} - {e}")
+            else:
+                summary.succeeded += 1
+                summary.latencies_seconds.append(time.perf_counter() - row_start)
+                progress.record(key, keyword, 'done')
+                print(f"[배치] 완료 ({summary.succeeded + summary.failed}/{pending}): {keyword}")
+
+    start = time.perf_counter()
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    await asyncio.gather(*workers)
+    summary.elapsed_seconds = time.perf_counter() - start
+    return summary
+
+
+def run_batch(
+    input_path: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    progress_path: str | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    engine: str = "single",
+    duplicate_policy_default: str = "off",
+) -> BatchSummary:
+    """입력 파일을 읽어 배치를 실행하고 요약을 출력합니다.
+
+    진행 상황 파일을 지정하지 않으면 `<입력 파일>.progress.jsonl`을 사용합니다.
+    """
+    rows = load_batch_rows(input_path)
+    if progress_path is None:
+        progress_path = f"{input_path}.progress.jsonl"
+
+    print(f"배치 실행을 시작합니다: {len(rows)}건, 동시성 {concurrency}, 분당 요청 {requests_per_minute}회")
+    summary = asyncio.run(
+        run_batch_async(
+            rows,
+            concurrency,
+            requests_per_minute,
+            progress_path,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+            engine=engine,
+            duplicate_policy_default=duplicate_policy_default,
+        )
+    )
+    print(summary.format())
+    print(GENERATION_STATS.format())
+    print(TELEMETRY.format())
+    if use_cache:
+        cache_stats = get_response_cache().stats()
+        print(f"응답 캐시: 적중 {cache_stats['hits']}회 / 미스 {cache_stats['misses']}회")
+    return summary
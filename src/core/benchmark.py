@@ -0,0 +1,189 @@
+"""가짜 LLM 백엔드로 파이프라인 각 단계의 처리량, 지연 시간, 메모리 사용량을 측정합니다."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from src.core.batch import run_batch_async
+from src.core.content_generator import generate_blog_content, parse_blog_response
+from src.core.llm_backend import FakeBackend, configure_backend
+from src.core.options import DEFAULT_BENCHMARK_SIZES
+from src.core.renderer import get_renderer
+from src.utils.telemetry import percentile
+
+DEFAULT_BATCH_CONCURRENCY = 50
+# Single runs call the pipeline sequentially, so they are capped to keep the suite short
+MAX_SINGLE_RUNS = 200
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 시나리오 하나의 측정 결과입니다."""
+
+    scenario: str
+    size: int
+    elapsed_seconds: float
+    p50_ms: float
+    p95_ms: float
+    peak_memory_mb: float
+    failures: int = 0
+
+    @property
+    def throughput_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.size - self.failures) / self.elapsed_seconds
+
+    def format(self) -> str:
+        return (
+            f"{self.scenario:<12} {self.size:>6}건  {self.throughput_per_second:>10.1f}건/초  "
+            f"p50 {self.p50_ms:>8.2f}ms  p95 {self.p95_ms:>8.2f}ms  "
+            f"최대 메모리 {self.peak_memory_mb:>7.1f}MB  실패 {self.failures}건"
+        )
+
+
+def _sample_user_input(index: int) -> dict[str, any]:
+    return {"keyword": f"벤치마크 키워드 {index}", "num_subheadings": 3}
+
+
+def _measure(scenario: str, size: int, run: Callable[[], tuple[list[float], int]]) -> BenchmarkResult:
+    """`run`을 실행하며 경과 시간과 최대 메모리를 측정합니다. `run`은 (항목별 소요 시간, 실패 수)를 반환합니다."""
+    tracemalloc.start()
+    # Progress prints and retry warnings would otherwise dominate the timings of the cheap stages
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            latencies, failures = run()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        logging.disable(logging.NOTSET)
+        tracemalloc.stop()
+    return BenchmarkResult(
+        scenario=scenario,
+        size=size,
+        elapsed_seconds=elapsed,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p95_ms=percentile(latencies, 95) * 1000,
+        peak_memory_mb=peak / (1024 * 1024),
+        failures=failures,
+    )
+
+
+def _timed_each(items: list[any], function: Callable[[any], any]) -> tuple[list[float], int]:
+    latencies = []
+    failures = 0
+    for item in items:
+        start = time.perf_counter()
+        try:
+            function(item)
+        except Exception:
+            failures += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+    return latencies, failures
+
+
+def benchmark_single(size: int) -> BenchmarkResult:
+    """`generate_blog_content`를 순차적으로 호출합니다. (캐시 미사용)"""
+    inputs = [_sample_user_input(i) for i in range(size)]
+    return _measure("single", size, lambda: _timed_each(
+        inputs, lambda user_input: generate_blog_content(user_input, user_input["keyword"], use_cache=False)
+    ))
+
+
+def benchmark_batch(size: int, concurrency: int = DEFAULT_BATCH_CONCURRENCY) -> BenchmarkResult:
+    """`run_batch_async`로 비동기 워커 풀에서 파이프라인을 실행합니다. (캐시, 호출 빈도 제한, 파일 저장 미사용)"""
+    rows = [_sample_user_input(i) for i in range(size)]
+
+    def run() -> tuple[list[float], int]:
+        summary = asyncio.run(
+            run_batch_async(rows, concurrency, requests_per_minute=0, progress_path=None, save_to_file=False, use_cache=False)
+        )
+        return summary.latencies_seconds, summary.failed
+
+    return _measure("batch", size, run)
+
+
+def benchmark_parse(size: int) -> BenchmarkResult:
+    """가짜 백엔드가 만든 응답 텍스트를 `parse_blog_response`로 파싱합니다."""
+    backend = FakeBackend()
+    texts = [
+        backend.generate_content(f"**키워드:** 파싱 {i}\n본론(3개 소제목)").text
+        for i in range(size)
+    ]
+    return _measure("parse", size, lambda: _timed_each(texts, parse_blog_response))
+
+
+def benchmark_render(size: int, output_format: str = "markdown") -> BenchmarkResult:
+    """파싱된 게시물을 컴파일된 렌더러로 임시 파일에 단락 단위로 기록합니다."""
+    backend = FakeBackend()
+    posts = [
+        parse_blog_response(backend.generate_content(f"**키워드:** 렌더링 {i}\n본론(3개 소제목)").text)
+        for i in range(size)
+    ]
+    renderer = get_renderer(output_format)
+
+    def run() -> tuple[list[float], int]:
+        with tempfile.TemporaryFile("w", encoding="utf-8") as handle:
+            return _timed_each(posts, lambda post: renderer.render_to(post, handle))
+
+    return _measure(f"render:{output_format}" if output_format != "markdown" else "render", size, run)
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_BENCHMARK_SIZES,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    malformed_rate: float = 0.0,
+    rate_limit_rate: float = 0.0,
+    output_path: str | None = None,
+) -> list[BenchmarkResult]:
+    """가짜 백엔드를 설정하고 모든 시나리오를 크기별로 실행한 뒤 결과를 출력합니다.
+
+    Args:
+        sizes: 시나리오별로 처리할 게시물 수 목록.
+        latency: 가짜 백엔드 호출 하나의 평균 지연 시간(초).
+        jitter: 지연 시간 변동 폭(초).
+        malformed_rate: 형식이 잘못된 응답의 비율.
+        rate_limit_rate: 호출 한도 초과 오류의 비율.
+        output_path: 지정하면 결과를 JSON으로 저장합니다.
+
+    Returns:
+        측정 결과 목록.
+    """
+    configure_backend(
+        "fake", latency=latency, jitter=jitter, malformed_rate=malformed_rate, rate_limit_rate=rate_limit_rate
+    )
+    print(
+        f"벤치마크를 시작합니다 (가짜 백엔드 지연 {latency * 1000:.0f}±{jitter * 1000:.0f}ms, "
+        f"형식 오류 {malformed_rate:.0%}, 호출 한도 오류 {rate_limit_rate:.0%})"
+    )
+    results = []
+    for size in sizes:
+        scenarios = [benchmark_batch, benchmark_parse, benchmark_render, lambda size: benchmark_render(size, "html")]
+        if size <= MAX_SINGLE_RUNS:
+            scenarios.insert(0, benchmark_single)
+        for scenario in scenarios:
+            result = scenario(size)
+            print(result.format())
+            results.append(result)
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(
+                [dict(asdict(result), throughput_per_second=result.throughput_per_second) for result in results],
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"벤치마크 결과를 저장했습니다: {output_path}")
+    return results
@@ -3,8 +3,60 @@ import re
 import os
 from datetime import datetime
 from dotenv import load_dotenv
-import google.generativeai as genai
 import json
+import logging
+import threading
+from collections.abc import Iterable, Iterator
+
+from src.core.llm_backend import backend_model_name, get_backend
+from src.core.publisher import PUBLISH_PLATFORMS, enqueue_post
+from src.core.renderer import TemplateRenderer, get_renderer
+from src.utils.archive import GZIP_SUFFIX, atomic_write, get_post_archive, read_text
+from src.utils.cache import ResponseCache, get_response_cache
+from src.utils.json_repair import repair_json
+from src.utils.json_stream import IncrementalBlogParser
+from src.utils.rate_limit import AsyncRateLimiter
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'gemini-1.5-flash'
+# Optional larger model for long posts, e.g. gemini-1.5-pro
+LONG_MODEL_ENV = "GEMINI_LONG_MODEL"
+MAX_RETRIES = 1
+MIN_BODY_LENGTH = 300 # Minimum characters for the total body content
+POST_STATE_SUFFIX = ".post.json"
+POST_STATE_VERSION = 1
+
+_SECTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "subtitle": {"type": "string"},
+        "content": {"type": "string"},
+        "image_keyword": {"type": "string", "nullable": True},
+    },
+    "required": ["subtitle", "content", "image_keyword"],
+}
+BLOG_POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "meta_description": {"type": "string"},
+        "body": {"type": "array", "items": _SECTION_SCHEMA},
+        "tags": {"type": "string"},
+    },
+    "required": ["title", "meta_description", "body", "tags"],
+}
+# Schema-constrained JSON output removes most malformed-response retries
+GENERATION_CONFIG: dict[str, any] = {
+    "response_mime_type": "application/json",
+    "response_schema": BLOG_POST_SCHEMA,
+}
+# Continuation requests only return the missing keys, so nothing is required
+CONTINUATION_GENERATION_CONFIG: dict[str, any] = {
+    "response_mime_type": "application/json",
+    "response_schema": {key: value for key, value in BLOG_POST_SCHEMA.items() if key != "required"},
+}
 
 class WebContentError(Exception):
     """웹 콘텐츠 수집 관련 오류"""
@@ -14,25 +66,35 @@ class ContentGenerationError(Exception):
     """AI 콘텐츠 생성 관련 오류"""
     pass
 
-def configure_gemini():
-    """Gemini API를 설정합니다."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ContentGenerationError("GEMINI_API_KEY가 .env 파일에 설정되지 않았습니다.")
-    genai.configure(api_key=api_key)
+class GenerationStats:
+    """JSON 복구로 절약한 호출 수와 전체 재생성(재시도) 횟수를 집계합니다."""
 
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.direct = 0
+        self.repaired = 0
+        self.continued = 0
+        self.retries = 0
 
+    def record(self, outcome: str) -> None:
+        """"direct", "repaired", "continued", "retries" 중 하나의 횟수를 1 증가시킵니다."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
 
-def generate_blog_content(user_input: dict[str, any], context: str) -> dict[str, any]:
-    """수집된 정보를 바탕으로 Gemini를 사용하여 구조화된 블로그 콘텐츠를 생성합니다."""
-    print("Gemini를 사용하여 구조화된 블로그 콘텐츠 생성을 시작합니다...")
-    
-    try:
-        configure_gemini()
-        model = genai.GenerativeModel('gemini-1.5-flash')
-    except Exception as e:
-        raise ContentGenerationError(f"Gemini 모델 초기화 중 오류 발생: {e}")
+    def format(self) -> str:
+        with self._lock:
+            saved = self.repaired + self.continued
+            return (
+                f"응답 파싱: 정상 {self.direct}건, 복구 {self.repaired}건, "
+                f"누락 부분만 추가 요청 {self.continued}건, 전체 재생성 {self.retries}건 "
+                f"(복구로 절약한 전체 재생성 호출: {saved}회)"
+            )
+
+
+GENERATION_STATS = GenerationStats()
 
+def build_blog_prompt(user_input: dict[str, any], context: str) -> str:
+    """사용자 입력과 참고 자료로 블로그 생성 프롬프트를 만듭니다."""
     keyword = user_input.get('keyword', '')
     target_audience = user_input.get('target_audience', '전문가')
     tone_of_voice = user_input.get('tone_of_voice', '전문적')
@@ -41,7 +103,7 @@ def generate_blog_content(user_input: dict[str, any], context: str) -> dict[str,
     seo_optimization_level = user_input.get('seo_optimization_level', '강화')
     custom_instructions = user_input.get('custom_instructions', '')
 
-    prompt = f"""
+    return f"""
 당신은 SEO에 능숙한 전문 기술 블로거입니다.
 
 아래 제공된 '키워드'와 '참고 자료'를 바탕으로, 독자들이 읽기 쉽고 유용한 블로그 게시물을 작성해주세요.
@@ -93,121 +155,607 @@ def generate_blog_content(user_input: dict[str, any], context: str) -> dict[str,
 }}
 ```
 """
-    
-    MAX_RETRIES = 1
-    MIN_BODY_LENGTH = 300 # Minimum characters for the total body content
+
+
+def extract_json_object(response_text: str) -> dict[str, any]:
+    """응답 텍스트에서 JSON 객체를 추출합니다. ```json 코드 펜스도 허용합니다.
+
+    Raises:
+        ContentGenerationError: 유효한 JSON 객체를 찾을 수 없는 경우.
+    """
+    content_dict = None
+    try:
+        content_dict = json.loads(response_text)
+        logger.debug("Successfully parsed response as direct JSON.")
+    except json.JSONDecodeError:
+        logger.debug("Response is not direct JSON. Trying regex extraction.")
+        json_match = re.search(r'```json(.*?)```', response_text, re.DOTALL)
+        if json_match:
+            json_string = json_match.group(1).strip()
+            try:
+                content_dict = json.loads(json_string)
+                logger.debug("Successfully parsed extracted JSON string.")
+            except json.JSONDecodeError as e:
+                raise ContentGenerationError(f"추출된 JSON 문자열 파싱 실패: {e}. 추출된 문자열: {json_string[:200]}...")
+        else:
+            raise ContentGenerationError("Gemini 응답에서 유효한 JSON 형식을 찾을 수 없습니다.")
+
+    if not content_dict or not isinstance(content_dict, dict):
+        raise ContentGenerationError("Gemini 응답에서 유효한 JSON 콘텐츠를 생성하지 못했습니다.")
+    return content_dict
+
+
+def validate_blog_content(content_dict: dict[str, any]) -> dict[str, any]:
+    """블로그 콘텐츠의 태그 형식을 정리하고 본문 구조와 길이를 검증합니다.
+
+    Raises:
+        ContentGenerationError: 본문 구조가 유효하지 않거나 너무 짧은 경우.
+    """
+    with TELEMETRY.span("validate"):
+        if isinstance(content_dict.get('tags'), str):
+            content_dict['tags'] = [tag.strip() for tag in content_dict['tags'].split(',')]
+
+        # Validate body structure and content length
+        body_content = content_dict.get('body', [])
+        if not isinstance(body_content, list) or not all(isinstance(item, dict) for item in body_content):
+             raise ContentGenerationError("생성된 본문(body)이 유효한 배열 형식이 아닙니다.")
+
+        total_body_length = sum(len(item.get('content', '')) for item in body_content)
+        if total_body_length < MIN_BODY_LENGTH:
+            logger.warning(f"생성된 본문 총 길이가 너무 짧습니다 ({total_body_length}자).")
+            raise ContentGenerationError(f"유의미한 콘텐츠 생성에 실패했습니다. (최소 {MIN_BODY_LENGTH}자 필요)")
+
+        return content_dict
+
+
+def parse_blog_response(response_text: str) -> dict[str, any]:
+    """Gemini 응답 텍스트를 파싱하고 블로그 콘텐츠 구조를 검증합니다.
+
+    Args:
+        response_text: Gemini가 반환한 원본 응답 텍스트.
+
+    Returns:
+        title, meta_description, body, tags를 포함하는 딕셔너리.
+
+    Raises:
+        ContentGenerationError: JSON을 찾을 수 없거나 구조/길이가 유효하지 않은 경우.
+    """
+    return validate_blog_content(extract_json_object(response_text))
+
+
+def build_continuation_prompt(
+    user_input: dict[str, any],
+    partial_content: dict[str, any],
+    missing_sections: int,
+    missing_fields: list[str],
+) -> str:
+    """중단된 응답에서 누락된 단락과 필드만 요청하는 프롬프트를 만듭니다."""
+    written_subtitles = "\n".join(
+        f"- {section.get('subtitle', '')}" for section in partial_content.get('body', [])
+    ) or "- (없음)"
+    requests = []
+    if missing_sections:
+        requests.append(
+            f"-   **body:** 이미 작성된 단락 뒤에 이어질 단락 {missing_sections}개 "
+            "(subtitle, content, image_keyword). 마지막 단락은 결론이어야 합니다."
+        )
+    for field in missing_fields:
+        requests.append(f"-   **{field}**")
+
+    return f"""
+당신은 SEO에 능숙한 전문 기술 블로거입니다.
+아래 블로그 게시물을 작성하던 중 응답이 중단되었습니다. 이미 작성된 부분은 다시 쓰지 말고, 누락된 부분만 JSON으로 작성해주세요.
+
+**키워드:** {user_input.get('keyword', '')}
+**대상 독자:** {user_input.get('target_audience', '전문가')}
+**어조:** {user_input.get('tone_of_voice', '전문적')}
+**추가 지시사항:** {user_input.get('custom_instructions', '') or "없음"}
+**제목:** {partial_content.get('title', '(미정)')}
+
+**이미 작성된 단락 소제목:**
+{written_subtitles}
+
+**작성할 항목:**
+{chr(10).join(requests)}
+
+키(key)는 반드시 영어로 작성하고, 작성할 항목에 해당하는 키만 포함하세요. tags는 쉼표로 구분된 문자열입니다.
+"""
+
+
+def salvage_blog_response(
+    response_text: str,
+    user_input: dict[str, any],
+) -> tuple[dict[str, any], str | None]:
+    """파싱에 실패한 응답을 복구하고, 필요한 경우 누락된 부분만 요청할 프롬프트를 반환합니다.
+
+    후행 쉼표나 앞뒤 설명 문장처럼 내용이 온전한 경우에는 추가 호출 없이 복구하고,
+    출력이 잘린 경우에는 완성된 단락만 남긴 뒤 나머지 단락과 필드를 요청합니다.
+
+    Args:
+        response_text: 파싱에 실패한 원본 응답 텍스트.
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+
+    Returns:
+        `(콘텐츠 딕셔너리, 후속 요청 프롬프트)` 튜플. 후속 프롬프트가 None이면
+        콘텐츠는 검증이 끝난 상태이며, 아니면 `merge_continuation`으로 보완해야 합니다.
+
+    Raises:
+        ContentGenerationError: 복구할 수 없는 응답인 경우.
+    """
+    try:
+        repaired, truncated = repair_json(response_text)
+    except ValueError as e:
+        raise ContentGenerationError(f"Gemini 응답 복구 실패: {e}")
+    if not isinstance(repaired, dict):
+        raise ContentGenerationError("Gemini 응답 복구 실패: JSON 객체가 아닙니다.")
+
+    body = repaired.get('body')
+    body = body if isinstance(body, list) else []
+    # Sections cut off before their content finished are dropped and requested again
+    repaired['body'] = [section for section in body if isinstance(section, dict) and section.get('content')]
+
+    missing_fields = [key for key in ('title', 'meta_description', 'tags') if not repaired.get(key)]
+    missing_sections = 0
+    if truncated:
+        expected_sections = int(user_input.get('num_subheadings', 5)) + 2
+        missing_sections = max(0, expected_sections - len(repaired['body']))
+
+    if not missing_sections and not missing_fields:
+        return validate_blog_content(repaired), None
+    return repaired, build_continuation_prompt(user_input, repaired, missing_sections, missing_fields)
+
+
+def merge_continuation(partial_content: dict[str, any], continuation_text: str) -> dict[str, any]:
+    """후속 요청 응답을 부분 콘텐츠에 합치고 최종 검증합니다.
+
+    Raises:
+        ContentGenerationError: 합친 결과가 유효하지 않은 경우.
+    """
+    try:
+        continuation, _ = repair_json(continuation_text)
+    except ValueError as e:
+        raise ContentGenerationError(f"후속 응답 파싱 실패: {e}")
+    if not isinstance(continuation, dict):
+        raise ContentGenerationError("후속 응답이 JSON 객체가 아닙니다.")
+
+    merged = dict(partial_content)
+    extra_sections = continuation.get('body')
+    if isinstance(extra_sections, list):
+        merged['body'] = merged.get('body', []) + [
+            section for section in extra_sections if isinstance(section, dict) and section.get('content')
+        ]
+    for key in ('title', 'meta_description', 'tags'):
+        if not merged.get(key) and continuation.get(key):
+            merged[key] = continuation[key]
+    return validate_blog_content(merged)
+
+
+def select_model_name(user_input: dict[str, any] | None = None) -> str:
+    """희망 길이가 "길게"이고 `GEMINI_LONG_MODEL`이 설정되어 있으면 그 모델을, 아니면 `MODEL_NAME`을 반환합니다."""
+    long_model = os.getenv(LONG_MODEL_ENV, "").strip()
+    # Same default as the prompt builders, which ask for a long post when no length is given
+    if long_model and user_input is not None and user_input.get('desired_length', '길게 (1500+ 단어)').startswith('길게'):
+        return long_model
+    return MODEL_NAME
+
+
+def create_llm_model(model_name: str | None = None):
+    """설정된 LLM 백엔드(기본값 Gemini)의 생성 모델을 반환합니다. 모델은 모델 이름마다 한 번만 초기화됩니다.
+
+    Args:
+        model_name: 우선 사용할 모델 이름 (`select_model_name`의 결과). 없으면 `MODEL_NAME`입니다.
+    """
+    with TELEMETRY.span("model_init"):
+        try:
+            return get_backend(model_name or MODEL_NAME)
+        except Exception as e:
+            raise ContentGenerationError(f"LLM 모델 초기화 중 오류 발생: {e}")
+
+
+def current_model_name(model_name: str | None = None) -> str:
+    """응답 캐시 키에 사용할 현재 백엔드의 모델 이름을 반환합니다."""
+    return backend_model_name(model_name or MODEL_NAME)
+
+
+def served_model_name(response: any, model_name: str | None = None) -> str:
+    """응답을 실제로 만든 모델 이름입니다. 라우터가 다른 모델로 보냈으면 그 모델을 반환합니다."""
+    return getattr(response, "served_model_name", None) or current_model_name(model_name)
+
+
+def call_gemini(model, prompt: str, generation_config: dict[str, any], stage: str):
+    """모델을 호출하고 소요 시간과 토큰 사용량을 `stage` 이름으로 기록합니다."""
+    TELEMETRY.incr("llm_calls", stage=stage)
+    with TELEMETRY.span("llm_call", stage=stage):
+        response = model.generate_content(prompt, generation_config=generation_config or None)
+    TELEMETRY.record_usage(response, stage, served_model_name(response, getattr(model, "model_name", None)))
+    return response
+
+
+async def call_gemini_async(model, prompt: str, generation_config: dict[str, any], stage: str):
+    """`call_gemini`의 비동기 버전입니다."""
+    TELEMETRY.incr("llm_calls", stage=stage)
+    with TELEMETRY.span("llm_call", stage=stage):
+        response = await model.generate_content_async(prompt, generation_config=generation_config or None)
+    TELEMETRY.record_usage(response, stage, served_model_name(response, getattr(model, "model_name", None)))
+    return response
+
+
+def _served_cache_key(cache_key: str, prompt: str, response: any, model_name: str) -> str:
+    """다른 모델이 응답했으면 그 모델 이름으로 캐시 키를 다시 만듭니다. 요청한 모델의 키에 다른 모델의 응답이 저장되지 않게 합니다."""
+    served = served_model_name(response, model_name)
+    if served == current_model_name(model_name):
+        return cache_key
+    return ResponseCache.make_key(prompt, served, GENERATION_CONFIG)
+
+
+def _load_cached_content(cache_key: str, use_cache: bool, refresh_cache: bool) -> dict[str, any] | None:
+    """캐시에 저장된 응답이 있으면 파싱하여 반환합니다."""
+    if not use_cache or refresh_cache:
+        return None
+    cached_text = get_response_cache().get(cache_key)
+    if cached_text is None:
+        return None
+    try:
+        return parse_blog_response(cached_text)
+    except ContentGenerationError:
+        return None
+
+
+def _parse_or_salvage(
+    response_text: str,
+    user_input: dict[str, any],
+) -> tuple[dict[str, any], str | None, str]:
+    """응답을 파싱하고, 실패하면 복구를 시도합니다. 결과 집계용 구분값을 함께 반환합니다."""
+    with TELEMETRY.span("parse"):
+        try:
+            return parse_blog_response(response_text), None, "direct"
+        except ContentGenerationError as parse_error:
+            logger.debug(f"Parsing failed ({parse_error}). Trying JSON repair.")
+            content_dict, continuation_prompt = salvage_blog_response(response_text, user_input)
+            return content_dict, continuation_prompt, "continued" if continuation_prompt else "repaired"
+
+
+def generate_blog_content(
+    user_input: dict[str, any],
+    context: str,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> dict[str, any]:
+    """수집된 정보를 바탕으로 Gemini를 사용하여 구조화된 블로그 콘텐츠를 생성합니다.
+
+    동일한 프롬프트, 모델, 생성 설정으로 생성된 응답이 캐시에 있으면
+    Gemini 설정과 모델 생성 없이 바로 반환합니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        context: 프롬프트에 포함될 참고 자료.
+        use_cache: False이면 캐시를 조회하거나 저장하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 덮어씁니다.
+    """
+    with TELEMETRY.span("prompt_build"):
+        prompt = build_blog_prompt(user_input, context)
+    model_name = select_model_name(user_input)
+    cache_key = ResponseCache.make_key(prompt, current_model_name(model_name), GENERATION_CONFIG)
+    cached_content = _load_cached_content(cache_key, use_cache, refresh_cache)
+    if cached_content is not None:
+        print("캐시된 블로그 콘텐츠를 사용합니다.")
+        return cached_content
+
+    print("Gemini를 사용하여 구조화된 블로그 콘텐츠 생성을 시작합니다...")
+    model = create_llm_model(model_name)
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            print(f"DEBUG: Attempt {attempt + 1} - Sending prompt to Gemini...")
-            response = model.generate_content(prompt)
+            logger.debug(f"Attempt {attempt + 1} - Sending prompt to Gemini...")
+            response = call_gemini(model, prompt, GENERATION_CONFIG, "blog")
             response_text = response.text.strip()
-            print(f"DEBUG: Raw Gemini Response: {response_text}")
-
-            content_dict = None
-            try:
-                content_dict = json.loads(response_text)
-                print("DEBUG: Successfully parsed response as direct JSON.")
-            except json.JSONDecodeError:
-                print("DEBUG: Response is not direct JSON. Trying regex extraction.")
-                json_match = re.search(r'```json(.*?)```', response_text, re.DOTALL)
-                if json_match:
-                    json_string = json_match.group(1).strip()
-                    try:
-                        content_dict = json.loads(json_string)
-                        print("DEBUG: Successfully parsed extracted JSON string.")
-                    except json.JSONDecodeError as e:
-                        raise ContentGenerationError(f"추출된 JSON 문자열 파싱 실패: {e}. 추출된 문자열: {json_string[:200]}...")
-                else:
-                    raise ContentGenerationError("Gemini 응답에서 유효한 JSON 형식을 찾을 수 없습니다.")
-            
-            if not content_dict:
-                raise ContentGenerationError("Gemini 응답에서 유효한 JSON 콘텐츠를 생성하지 못했습니다.")
-            
-            if isinstance(content_dict.get('tags'), str):
-                content_dict['tags'] = [tag.strip() for tag in content_dict['tags'].split(',')]
-            
-            # Validate body structure and content length
-            body_content = content_dict.get('body', [])
-            if not isinstance(body_content, list) or not all(isinstance(item, dict) for item in body_content):
-                 raise ContentGenerationError("생성된 본문(body)이 유효한 배열 형식이 아닙니다.")
-
-            total_body_length = sum(len(item.get('content', '')) for item in body_content)
-            if total_body_length < MIN_BODY_LENGTH:
-                print(f"경고: 생성된 본문 총 길이가 너무 짧습니다 ({total_body_length}자). 재시도합니다.")
-                if attempt < MAX_RETRIES:
-                    continue
-                else:
-                    raise ContentGenerationError(f"유의미한 콘텐츠 생성에 실패했습니다. (최소 {MIN_BODY_LENGTH}자 필요)")
+            logger.debug(f"Received Gemini response ({len(response_text)} chars).")
 
+            content_dict, continuation_prompt, outcome = _parse_or_salvage(response_text, user_input)
+            if continuation_prompt:
+                print("응답이 중단되어 누락된 부분만 추가로 요청합니다...")
+                continuation = call_gemini(model, continuation_prompt, CONTINUATION_GENERATION_CONFIG, "continuation")
+                content_dict = merge_continuation(content_dict, continuation.text)
+            GENERATION_STATS.record(outcome)
+            if use_cache:
+                served_key = _served_cache_key(cache_key, prompt, response, model_name)
+                get_response_cache().put(served_key, json.dumps(content_dict, ensure_ascii=False))
             print("Gemini 블로그 콘텐츠 생성 완료.")
             return content_dict
 
         except Exception as e:
-            print(f"콘텐츠 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+            logger.warning(f"콘텐츠 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
             if attempt < MAX_RETRIES:
+                GENERATION_STATS.record("retries")
+                TELEMETRY.incr("llm_retries", stage="blog")
                 continue
             else:
                 raise ContentGenerationError(f"Gemini 콘텐츠 생성 중 최종 오류 발생: {e}")
 
 
+async def generate_blog_content_async(
+    user_input: dict[str, any],
+    context: str,
+    rate_limiter: AsyncRateLimiter | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> dict[str, any]:
+    """`generate_blog_content`의 비동기 버전으로, 대량 생성 시 이벤트 루프를 막지 않습니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        context: 프롬프트에 포함될 참고 자료.
+        rate_limiter: 지정된 경우 각 API 요청 전에 호출 예산을 확보합니다.
+        use_cache: False이면 캐시를 조회하거나 저장하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 덮어씁니다.
+
+    Returns:
+        구조화된 블로그 콘텐츠 딕셔너리.
+
+    Raises:
+        ContentGenerationError: 재시도 후에도 유효한 콘텐츠를 얻지 못한 경우.
+    """
+    with TELEMETRY.span("prompt_build"):
+        prompt = build_blog_prompt(user_input, context)
+    model_name = select_model_name(user_input)
+    cache_key = ResponseCache.make_key(prompt, current_model_name(model_name), GENERATION_CONFIG)
+    cached_content = _load_cached_content(cache_key, use_cache, refresh_cache)
+    if cached_content is not None:
+        return cached_content
+
+    model = create_llm_model(model_name)
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            response = await call_gemini_async(model, prompt, GENERATION_CONFIG, "blog")
+            response_text = response.text.strip()
+            content_dict, continuation_prompt, outcome = _parse_or_salvage(response_text, user_input)
+            if continuation_prompt:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                continuation = await call_gemini_async(
+                    model, continuation_prompt, CONTINUATION_GENERATION_CONFIG, "continuation"
+                )
+                content_dict = merge_continuation(content_dict, continuation.text)
+            GENERATION_STATS.record(outcome)
+            if use_cache:
+                served_key = _served_cache_key(cache_key, prompt, response, model_name)
+                get_response_cache().put(served_key, json.dumps(content_dict, ensure_ascii=False))
+            return content_dict
+        except Exception as e:
+            logger.warning(f"콘텐츠 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+            if attempt >= MAX_RETRIES:
+                raise ContentGenerationError(f"Gemini 콘텐츠 생성 중 최종 오류 발생: {e}")
+            GENERATION_STATS.record("retries")
+            TELEMETRY.incr("llm_retries", stage="blog")
+
+
+def generate_blog_content_stream(
+    user_input: dict[str, any],
+    context: str,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> Iterator[tuple[str, any]]:
+    """Gemini 스트리밍 응답을 사용해 완성되는 필드부터 순서대로 이벤트를 생성합니다.
+
+    각 본문 단락은 해당 JSON 객체가 닫히는 즉시 전달되므로, 긴 게시물에서도
+    첫 출력까지의 시간이 전체 생성 시간보다 크게 짧습니다. 이미 전달된 단락을
+    되돌릴 수 없으므로 스트리밍 모드에서는 재시도하지 않습니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        context: 프롬프트에 포함될 참고 자료.
+        use_cache: False이면 캐시를 조회하거나 저장하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 덮어씁니다.
+
+    Yields:
+        `("title" | "meta_description" | "section" | "tags", 값)` 이벤트.
+        마지막에는 검증된 전체 콘텐츠 딕셔너리를 담은 `("done", dict)`을 생성합니다.
+
+    Raises:
+        ContentGenerationError: API 호출 실패 또는 최종 응답이 유효하지 않은 경우.
+    """
+    with TELEMETRY.span("prompt_build"):
+        prompt = build_blog_prompt(user_input, context)
+    model_name = select_model_name(user_input)
+    cache_key = ResponseCache.make_key(prompt, current_model_name(model_name), GENERATION_CONFIG)
+    cached_text = get_response_cache().get(cache_key) if use_cache and not refresh_cache else None
+
+    response = None
+    model = None
+    if cached_text is not None:
+        chunks = [cached_text]
+    else:
+        model = create_llm_model(model_name)
+        try:
+            TELEMETRY.incr("llm_calls", stage="blog_stream")
+            response = model.generate_content(prompt, generation_config=GENERATION_CONFIG or None, stream=True)
+            chunks = (chunk.text for chunk in response)
+        except Exception as e:
+            raise ContentGenerationError(f"Gemini 스트리밍 요청 중 오류 발생: {e}")
+
+    parser = IncrementalBlogParser()
+    emitted_sections = 0
+    tags_emitted = False
+    # The span covers the whole stream, including time the consumer spends on each event
+    with TELEMETRY.span("llm_stream", cached=cached_text is not None):
+        try:
+            for chunk in chunks:
+                for kind, value in parser.feed(chunk):
+                    emitted_sections += kind == 'section'
+                    tags_emitted = tags_emitted or kind == 'tags'
+                    yield (kind, value)
+        except ContentGenerationError:
+            raise
+        except Exception as e:
+            raise ContentGenerationError(f"Gemini 스트리밍 응답 처리 중 오류 발생: {e}")
+    if response is not None:
+        TELEMETRY.record_usage(response, "blog_stream", served_model_name(response, model_name))
+
+    response_text = parser.text.strip()
+    content_dict, continuation_prompt, outcome = _parse_or_salvage(response_text, user_input)
+    if continuation_prompt:
+        try:
+            # A cached response can still be truncated, so the model may not exist yet
+            if model is None:
+                model = create_llm_model(model_name)
+            continuation = call_gemini(model, continuation_prompt, CONTINUATION_GENERATION_CONFIG, "continuation")
+            content_dict = merge_continuation(content_dict, continuation.text)
+        except ContentGenerationError:
+            raise
+        except Exception as e:
+            raise ContentGenerationError(f"누락된 부분 추가 요청 중 오류 발생: {e}")
+    # Sections the incremental parser could not repair, or that the continuation added
+    for section in content_dict['body'][emitted_sections:]:
+        yield ('section', section)
+    if not tags_emitted and content_dict.get('tags'):
+        yield ('tags', content_dict['tags'])
+    if cached_text is None:
+        GENERATION_STATS.record(outcome)
+        if use_cache:
+            served_key = _served_cache_key(cache_key, prompt, response, model_name)
+            get_response_cache().put(served_key, json.dumps(content_dict, ensure_ascii=False))
+    yield ('done', content_dict)
+
+
 def generate_markdown_content(blog_post_object: dict[str, any]) -> str:
     """구조화된 콘텐츠 객체를 최종 마크다운 문자열로 조합합니다."""
     print("마크다운 콘텐츠 생성을 시작합니다...")
-    
-    title = blog_post_object.get('title', '제목 없음')
-    meta_description = blog_post_object.get('meta_description', '')
-    body_sections = blog_post_object.get('body', [])
-    tags = blog_post_object.get('tags', [])
+    final_content = get_renderer("markdown").render(blog_post_object)
+    print("마크다운 콘텐츠 생성 완료.")
+    return final_content.strip()
 
-    # Format tags for display
-    tags_formatted = ", ".join([f"#{t}" for t in tags])
-    
-    # Build body from sections
-    body_formatted = ""
-    for section in body_sections:
-        subtitle = section.get('subtitle', '')
-        content = section.get('content', '')
-        image_keyword = section.get('image_keyword')
 
-        body_formatted += f"## {subtitle}\n\n"
-        body_formatted += f"{content}\n\n"
-        if image_keyword:
-            body_formatted += f"<!-- Recommended image query: \"{image_keyword}\" -->\n\n"
-        body_formatted += "---\n\n"
+def generate_markdown_stream(events: Iterable[tuple[str, any]]) -> Iterator[str]:
+    """`generate_blog_content_stream` 이벤트를 받아 마크다운 조각을 순서대로 생성합니다.
 
+    모든 조각을 이어 붙인 결과는 `generate_markdown_content`의 출력과 같습니다.
 
-    # Combine all parts
-    final_content = f"""# {title}
+    Args:
+        events: `(종류, 값)` 형태의 콘텐츠 이벤트 스트림.
 
-> **Meta Description:** {meta_description}
+    Yields:
+        제목/메타 설명 머리말, 각 단락, 태그 순서의 마크다운 조각.
+    """
+    renderer = get_renderer("markdown")
+    header = {'title': '제목 없음', 'meta_description': ''}
+    tags = []
+    header_written = False
+    section_count = 0
 
----
+    for kind, value in events:
+        if kind == 'title':
+            header['title'] = value
+            continue
+        if kind == 'meta_description':
+            header['meta_description'] = value
+        elif kind == 'tags':
+            tags = value
+        if not header_written:
+            yield renderer.render_header(header)
+            header_written = True
+        if kind == 'section':
+            section_count += 1
+            yield renderer.render_section(value, section_count)
 
-{body_formatted}
+    if not header_written:
+        yield renderer.render_header(header)
+    yield renderer.render_footer({'tags': tags})
 
-**Tags:** {tags_formatted}
-"""
-    print("마크다운 콘텐츠 생성 완료.")
-    return final_content.strip()
 
+def save_post_to_file(
+    blog_post_object: dict[str, any],
+    keyword: str,
+    publishing_platform: str,
+    renderer: TemplateRenderer | None = None,
+) -> str:
+    """구조화된 콘텐츠를 렌더러로 단락마다 보관소 파일에 바로 기록합니다. (전체 문서 문자열을 만들지 않음)
 
-def save_markdown_to_file(content: str, keyword: str, publishing_platform: str) -> str:
-    """마크다운 콘텐츠를 파일로 저장합니다."""
-    print(f"마크다운 파일 저장을 시작합니다. 발행 플랫폼: {publishing_platform}...")
-    
-    if publishing_platform == "Markdown File Only":
-        today = datetime.now().strftime("%Y%m%d")
-        # Sanitize keyword for filename
-        sanitized_keyword = re.sub(r'[\\/*?:\"<>|]', "", keyword).replace(' ', '_')
-        filename = f"{today}_{sanitized_keyword}.md"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"마크다운 파일 저장 완료: {filename}")
-        return os.path.abspath(filename)
-    else:
-        # 향후 Tistory, WordPress 등 API 연동 로직 추가 예정
-        print(f"경고: {publishing_platform} 플랫폼 발행은 아직 지원되지 않습니다. 마크다운 파일로 저장하지 않습니다.")
+    파일은 임시 파일에 기록한 뒤 원자적으로 이름을 바꾸며, 같은 날 같은 키워드로 다시 생성해도
+    기존 파일을 덮어쓰지 않습니다. Tistory, WordPress 플랫폼이면 파일 대신 발행 대기열에 추가합니다.
+    실제 업로드는 `run_publisher`(`--publish`)가 처리합니다.
+
+    Args:
+        blog_post_object: 구조화된 블로그 콘텐츠 딕셔너리.
+        keyword: 파일 이름과 색인에 사용할 키워드.
+        publishing_platform: 발행 플랫폼. "Markdown File Only"이면 파일로 저장합니다.
+        renderer: 사용할 렌더러. None이면 기본 마크다운 렌더러를 사용합니다.
+
+    Returns:
+        저장된 파일의 절대 경로, 발행 작업 ID 또는 저장하지 않은 이유.
+    """
+    renderer = renderer or get_renderer("markdown")
+    if publishing_platform in PUBLISH_PLATFORMS:
+        job_id = enqueue_post(blog_post_object, publishing_platform)
+        print(f"{publishing_platform} 발행 대기열에 추가했습니다: 작업 #{job_id}")
+        return f"발행 대기열에 추가됨 (작업 #{job_id})"
+    if publishing_platform != "Markdown File Only":
+        logger.warning(f"{publishing_platform} 플랫폼 발행은 아직 지원되지 않습니다. 파일로 저장하지 않습니다.")
         return f"발행되지 않음 (플랫폼: {publishing_platform})"
+
+    file_path = get_post_archive().save(
+        keyword,
+        renderer.extension,
+        lambda f: renderer.render_to(blog_post_object, f),
+        output_format=renderer.output_format,
+    )
+    print(f"{renderer.output_format} 파일 저장 완료: {file_path}")
+    return file_path
+
+
+def post_state_path(output_path: str) -> str:
+    """렌더링된 출력 파일 옆에 저장되는 구조화된 게시물 파일의 경로입니다. 압축된 출력이면 함께 압축합니다."""
+    if output_path.endswith((POST_STATE_SUFFIX, POST_STATE_SUFFIX + GZIP_SUFFIX)):
+        return output_path
+    if output_path.endswith(GZIP_SUFFIX):
+        return output_path[:-len(GZIP_SUFFIX)] + POST_STATE_SUFFIX + GZIP_SUFFIX
+    return output_path + POST_STATE_SUFFIX
+
+
+def save_post_state(
+    output_path: str,
+    user_input: dict[str, any],
+    context: str,
+    blog_post_object: dict[str, any],
+    usage: dict[str, int] | None = None,
+) -> str:
+    """구조화된 게시물과 이를 만든 `user_input`, 참고 자료를 출력 파일 옆에 JSON으로 저장합니다.
+
+    저장된 파일은 `regenerate_post`가 바뀐 부분만 다시 생성하는 데 사용합니다. 출력 파일이
+    보관소에 있으면 설정, 제목, 태그, 모델, 토큰 사용량을 색인에도 기록합니다.
+
+    Args:
+        usage: 이 게시물 생성에 사용한 토큰 수와 응답한 모델 (`TELEMETRY.track_usage()`의 결과).
+
+    Returns:
+        저장된 파일의 경로.
+    """
+    state = {
+        "version": POST_STATE_VERSION,
+        "output_path": os.path.abspath(output_path),
+        # The models that actually answered, which differ from the requested one after a failover
+        "model": ", ".join(usage["models"]) if usage and usage.get("models") else current_model_name(select_model_name(user_input)),
+        "saved_at": datetime.now().isoformat(timespec="seconds"),
+        "user_input": user_input,
+        "context": context,
+        "post": blog_post_object,
+    }
+    path = post_state_path(output_path)
+    atomic_write(path, lambda f: json.dump(state, f, ensure_ascii=False, indent=2))
+    get_post_archive().record(output_path, user_input, blog_post_object, state["model"], usage)
+    return path
+
+
+def load_post_state(path: str) -> dict[str, any]:
+    """`save_post_state`로 저장한 파일을 읽습니다. 렌더링된 출력 파일 경로를 주어도 됩니다.
+
+    Raises:
+        FileNotFoundError: 저장된 게시물 파일이 없는 경우.
+        ValueError: 지원하지 않는 형식의 파일인 경우.
+    """
+    state = json.loads(read_text(post_state_path(path)))
+    if state.get("version") != POST_STATE_VERSION or not isinstance(state.get("post"), dict):
+        raise ValueError(f"지원하지 않는 게시물 파일 형식입니다: {path}")
+    return state
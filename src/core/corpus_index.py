@@ -0,0 +1,216 @@
+"""로컬 문서 디렉터리에 대한 BM25 역색인과 토큰 예산 기반 컨텍스트 생성 기능입니다."""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+
+from src.core.options import DEFAULT_CONTEXT_TOKEN_BUDGET
+
+DEFAULT_INDEX_DIR = ".blog_genie_index"
+INDEXED_EXTENSIONS = (".md", ".markdown", ".txt")
+CHUNK_CHARS = 800
+SEARCH_CANDIDATES = 50
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?。])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """LLM 토큰 수를 보수적으로 추정합니다. (한글 등 3바이트 문자 1자당 1토큰, 그 외 4자당 1토큰)"""
+    # Hangul syllables take 3 bytes in UTF-8, so the extra bytes count them without a regex scan
+    wide = (len(text.encode("utf-8")) - len(text)) // 2
+    return wide + (len(text) - wide) // 4 + 1
+
+
+def _split_long_paragraph(paragraph: str, chunk_chars: int) -> list[str]:
+    """`chunk_chars`보다 긴 문단을 문장 경계에서, 문장도 너무 길면 글자 수 기준으로 자릅니다."""
+    pieces = []
+    current = ""
+    for sentence in _SENTENCE_END_PATTERN.split(paragraph):
+        while len(sentence) > chunk_chars:
+            pieces.append(sentence[:chunk_chars])
+            sentence = sentence[chunk_chars:]
+        if current and len(current) + 1 + len(sentence) > chunk_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_into_chunks(text: str, chunk_chars: int = CHUNK_CHARS) -> list[str]:
+    """빈 줄 기준 문단을 모아 최대 `chunk_chars` 글자 크기의 청크로 나눕니다.
+
+    한 문단이 `chunk_chars`보다 길면 문장 단위로(문장도 길면 글자 수로) 잘라 여러 청크로 만듭니다.
+    """
+    chunks = []
+    current = []
+    length = 0
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        for piece in _split_long_paragraph(paragraph, chunk_chars) if len(paragraph) > chunk_chars else [paragraph]:
+            if current and length + len(piece) > chunk_chars:
+                chunks.append("\n\n".join(current))
+                current, length = [], 0
+            current.append(piece)
+            length += len(piece)
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def build_match_query(query: str) -> str | None:
+    """검색어를 FTS5 MATCH 식으로 변환합니다.
+
+    각 단어를 접두사 검색으로 OR 결합하여, 본문의 "파이썬은", "파이썬을"처럼
+    조사가 붙은 한글 단어도 "파이썬"으로 찾을 수 있게 합니다.
+    """
+    words = _TOKEN_PATTERN.findall(query.lower())
+    if not words:
+        return None
+    return " OR ".join(f'"{word}"*' for word in dict.fromkeys(words))
+
+
+class CorpusIndex:
+    """SQLite FTS5 기반 청크 단위 BM25 역색인입니다.
+
+    색인과 순위 계산은 SQLite 내부에서 수행되므로 수십만 청크도 빠르게 색인하고
+    검색할 수 있습니다. 파일 변경 시각과 크기를 기준으로 증분 갱신됩니다.
+
+    Args:
+        index_path: 색인 데이터베이스 파일 경로. ":memory:"이면 메모리에만 유지합니다.
+    """
+
+    def __init__(self, index_path: str = ":memory:"):
+        self.index_path = index_path
+        if index_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        # A single connection guarded by a lock; FTS5 writes are serialized anyway
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS chunk_files (id INTEGER PRIMARY KEY, path TEXT NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_chunk_files_path ON chunk_files(path)")
+            self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5(body, tokenize='unicode61')")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunk_files").fetchone()[0]
+
+    def _remove(self, path: str) -> None:
+        self._conn.execute("DELETE FROM chunks WHERE rowid IN (SELECT id FROM chunk_files WHERE path = ?)", (path,))
+        self._conn.execute("DELETE FROM chunk_files WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _add(self, path: str, text: str, mtime: float, size: int) -> None:
+        self._remove(path)
+        self._conn.execute("INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)", (path, mtime, size))
+        for chunk in split_into_chunks(text):
+            chunk_id = self._conn.execute("INSERT INTO chunk_files (path) VALUES (?)", (path,)).lastrowid
+            self._conn.execute("INSERT INTO chunks (rowid, body) VALUES (?, ?)", (chunk_id, chunk))
+
+    def add_document(self, path: str, text: str, mtime: float = 0.0, size: int = 0) -> None:
+        """문서를 청크로 나눠 색인에 추가합니다. 같은 경로의 기존 청크는 먼저 제거합니다."""
+        with self._lock, self._conn:
+            self._add(path, text, mtime, size)
+
+    def remove_document(self, path: str) -> None:
+        """문서의 모든 청크를 색인에서 제거합니다."""
+        with self._lock, self._conn:
+            self._remove(path)
+
+    def update(self, directory: str) -> tuple[int, int]:
+        """디렉터리를 훑어 추가/변경된 문서는 다시 색인하고 삭제된 문서는 제거합니다.
+
+        Returns:
+            `(다시 색인한 문서 수, 제거한 문서 수)` 튜플.
+        """
+        with self._lock, self._conn:
+            known = {row[0]: (row[1], row[2]) for row in self._conn.execute("SELECT path, mtime, size FROM files")}
+            seen = set()
+            reindexed = 0
+            for root, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    if not filename.lower().endswith(INDEXED_EXTENSIONS):
+                        continue
+                    path = os.path.join(root, filename)
+                    stat = os.stat(path)
+                    seen.add(path)
+                    if known.get(path) == (stat.st_mtime, stat.st_size):
+                        continue
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        self._add(path, f.read(), stat.st_mtime, stat.st_size)
+                    reindexed += 1
+
+            removed = [path for path in known if path not in seen]
+            for path in removed:
+                self._remove(path)
+        return reindexed, len(removed)
+
+    def search(self, query: str, top_k: int = 10) -> list[tuple[float, str, str]]:
+        """BM25 점수가 높은 청크를 반환합니다.
+
+        Returns:
+            `(점수, 문서 경로, 청크 텍스트)` 튜플 목록. 점수 내림차순입니다.
+        """
+        match_query = build_match_query(query)
+        if match_query is None:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT -bm25(chunks), chunk_files.path, chunks.body
+                FROM chunks JOIN chunk_files ON chunk_files.id = chunks.rowid
+                WHERE chunks MATCH ? ORDER BY bm25(chunks) LIMIT ?""",
+                (match_query, top_k),
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def build_context(self, query: str, token_budget: int = DEFAULT_CONTEXT_TOKEN_BUDGET) -> str:
+        """검색 순위대로 청크를 모아 토큰 예산을 넘지 않는 컨텍스트를 만듭니다."""
+        sections = []
+        used_tokens = 0
+        for _, path, chunk in self.search(query, top_k=SEARCH_CANDIDATES):
+            section = f"--- [Source: {path}] ---\n{chunk}"
+            tokens = estimate_tokens(section)
+            if used_tokens + tokens > token_budget:
+                continue
+            sections.append(section)
+            used_tokens += tokens
+        return "\n\n".join(sections)
+
+
+_loaded_indexes: dict[str, CorpusIndex] = {}
+_loaded_indexes_lock = threading.Lock()
+
+
+def get_corpus_index(corpus_dir: str) -> CorpusIndex:
+    """디렉터리에 대한 색인을 열고 증분 갱신합니다.
+
+    색인은 프로세스당 한 번만 열지만, 호출(작업)마다 파일 변경 시각과 크기를 다시 확인하므로
+    상주 서버나 GUI가 실행 중일 때 추가/수정/삭제된 문서도 다음 작업부터 반영됩니다.
+    색인 파일은 `BLOG_GENIE_INDEX_DIR`(기본값 `.blog_genie_index`) 아래에 저장됩니다.
+    """
+    corpus_dir = os.path.abspath(corpus_dir)
+    with _loaded_indexes_lock:
+        index = _loaded_indexes.get(corpus_dir)
+        opened = index is None
+        if opened:
+            digest = hashlib.sha1(corpus_dir.encode("utf-8")).hexdigest()[:12]
+            index_dir = os.getenv("BLOG_GENIE_INDEX_DIR", DEFAULT_INDEX_DIR)
+            index = CorpusIndex(os.path.join(index_dir, f"{digest}.sqlite3"))
+            _loaded_indexes[corpus_dir] = index
+    reindexed, removed = index.update(corpus_dir)
+    if opened or reindexed or removed:
+        print(f"참고 문서 색인 준비 완료: 청크 {len(index)}개 (갱신 {reindexed}건, 제거 {removed}건)")
+    return index
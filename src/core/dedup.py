@@ -0,0 +1,403 @@
+"""MinHash 서명과 LSH 밴딩으로 비슷한 요청과 게시물을 찾아 중복 생성과 중복 발행을 막습니다.
+
+- 요청: 키워드의 단어와 글자 2-gram 집합으로 비교합니다. ("파이썬"과 "파이썬 입문"의 유사도 0.75)
+  한쪽 키워드의 토큰이 다른 쪽에 모두 들어 있고 대상 독자, 어조, 분량까지 같으면 생성 결과도
+  거의 같을 것으로 보고 중복 요청으로 판단합니다. ("파이썬 설치"와 "파이썬 문법"은 중복이 아님)
+- 게시물: 제목과 본문의 연속된 두 단어 집합으로 비교하여 겹치는 정도를 보고합니다.
+
+서명은 보관소의 `.similarity.sqlite3`에 밴드별 버킷으로 저장되므로, 조회할 때 전체 게시물이 아니라
+같은 버킷에 들어간 후보만 비교합니다.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.core.options import DUPLICATE_POLICIES
+from src.utils.archive import get_post_archive
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_INDEX_FILENAME = ".similarity.sqlite3"
+DEFAULT_NUM_PERMUTATIONS = 64
+# 32 bands of 2 rows: pairs above ~0.3 Jaccard almost always share a bucket, and candidates are scored exactly
+DEFAULT_BANDS = 32
+DEFAULT_REQUEST_THRESHOLD = 0.6
+DEFAULT_CONTENT_THRESHOLD = 0.5
+DEFAULT_MATCH_LIMIT = 5
+# 키워드가 비슷해도 이 설정이 다르면 다른 글이 생성되므로 중복 요청으로 보지 않음
+SIMILARITY_SETTING_FIELDS = ("target_audience", "tone_of_voice", "desired_length")
+
+_MAX_HASH = (1 << 32) - 1
+
+
+@dataclass
+class DuplicateMatch:
+    """비슷한 기존 게시물 하나입니다.
+
+    Attributes:
+        ref: 기존 게시물의 보관소 경로 또는 발행 작업 설명.
+        keyword: 기존 게시물의 키워드.
+        score: 유사도 (0~1, Jaccard 계수).
+        settings_match: 대상 독자, 어조, 분량 설정이 같은지 여부.
+    """
+
+    ref: str
+    keyword: str
+    score: float
+    settings_match: bool = True
+
+    def format(self) -> str:
+        return f"{self.keyword} (유사도 {self.score:.2f}, {self.ref})"
+
+
+class DuplicateRequestError(Exception):
+    """비슷한 게시물이 이미 있어 생성을 건너뜀 (`duplicate_policy`가 "skip"인 경우)"""
+
+    def __init__(self, message: str, matches: list[DuplicateMatch]):
+        super().__init__(message)
+        self.matches = matches
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def keyword_tokens(keyword: str) -> set[str]:
+    """키워드의 단어와 각 단어의 글자 2-gram 집합입니다. 조사가 붙거나 단어가 추가된 키워드도 비슷하게 나옵니다."""
+    tokens = set()
+    for word in _words(keyword):
+        tokens.add(word)
+        tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def post_shingles(blog_post_object: dict[str, any]) -> set[str]:
+    """제목, 메타 설명, 소제목, 본문에서 연속된 두 단어 집합을 만듭니다."""
+    parts = [blog_post_object.get('title') or "", blog_post_object.get('meta_description') or ""]
+    for section in blog_post_object.get('body') or []:
+        parts.append(section.get('subtitle') or "")
+        parts.append(section.get('content') or "")
+    words = _words(" ".join(parts))
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in itertools.pairwise(words)}
+
+
+def jaccard(first: set[str], second: set[str]) -> float:
+    if not first and not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def request_similarity(first: set[str], second: set[str]) -> float:
+    """한쪽 키워드 토큰이 다른 쪽에 모두 포함되면 Jaccard 계수를, 아니면 0을 반환합니다.
+
+    앞 단어만 같은 형제 키워드("파이썬 설치", "파이썬 문법")는 Jaccard 계수가 높아도 주제가 다릅니다.
+    """
+    if not (first <= second or second <= first):
+        return 0.0
+    return jaccard(first, second)
+
+
+def settings_fingerprint(user_input: dict[str, any]) -> str:
+    """`SIMILARITY_SETTING_FIELDS` 설정값을 비교 가능한 문자열로 만듭니다."""
+    return json.dumps([str(user_input.get(name) or "") for name in SIMILARITY_SETTING_FIELDS], ensure_ascii=False)
+
+
+class MinHasher:
+    """토큰 집합의 MinHash 서명과 LSH 밴드 버킷 키를 계산합니다.
+
+    토큰마다 SHAKE-128 출력을 `num_permutations`개의 32비트 해시값으로 나눠 사용하므로,
+    해시 함수를 서명 길이만큼 따로 계산하지 않습니다. 두 서명에서 값이 같은 위치의 비율은
+    두 집합의 Jaccard 계수의 추정치입니다.
+
+    Args:
+        num_permutations: 서명 길이.
+        bands: LSH 밴드 수. `num_permutations`의 약수여야 합니다.
+    """
+
+    def __init__(self, num_permutations: int = DEFAULT_NUM_PERMUTATIONS, bands: int = DEFAULT_BANDS):
+        if num_permutations % bands:
+            raise ValueError(f"밴드 수({bands})는 서명 길이({num_permutations})의 약수여야 합니다.")
+        self.num_permutations = num_permutations
+        self.bands = bands
+        self.rows = num_permutations // bands
+        self._values = struct.Struct(f"<{num_permutations}I")
+        self._band = struct.Struct(f"<{self.rows}I")
+
+    def signature(self, tokens: Iterable[str]) -> tuple[int, ...]:
+        """토큰 집합의 MinHash 서명을 계산합니다. 빈 집합은 모든 값이 최댓값인 서명입니다."""
+        digest_size = self._values.size
+        hashes = [self._values.unpack(hashlib.shake_128(token.encode("utf-8")).digest(digest_size)) for token in set(tokens)]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_permutations
+        return tuple(map(min, zip(*hashes)))
+
+    def band_keys(self, signature: tuple[int, ...]) -> list[int]:
+        """밴드별 버킷 키(부호 있는 64비트 정수)를 계산합니다."""
+        return [
+            int.from_bytes(
+                hashlib.blake2b(self._band.pack(*signature[band * self.rows:(band + 1) * self.rows]), digest_size=8).digest(),
+                "big",
+                signed=True,
+            )
+            for band in range(self.bands)
+        ]
+
+    def pack(self, signature: tuple[int, ...]) -> bytes:
+        return self._values.pack(*signature)
+
+    def unpack(self, data: bytes) -> tuple[int, ...]:
+        return self._values.unpack(data)
+
+    @staticmethod
+    def similarity(first: tuple[int, ...], second: tuple[int, ...]) -> float:
+        """두 서명으로 Jaccard 계수를 추정합니다."""
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+class SimilarityIndex:
+    """게시물의 요청/내용 서명을 SQLite에 저장하고 LSH 버킷으로 비슷한 게시물 후보를 찾습니다.
+
+    Args:
+        path: SQLite 데이터베이스 파일 경로.
+        hasher: 사용할 `MinHasher`. 같은 색인에는 항상 같은 설정을 사용해야 합니다.
+    """
+
+    def __init__(self, path: str, hasher: MinHasher | None = None):
+        self.path = path
+        self.hasher = hasher or MinHasher()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    ref TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    settings TEXT NOT NULL,
+                    signature BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    UNIQUE (kind, ref)
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS buckets (
+                    kind TEXT NOT NULL,
+                    band INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    document_id INTEGER NOT NULL,
+                    PRIMARY KEY (kind, band, bucket, document_id)
+                ) WITHOUT ROWID"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_buckets_document ON buckets(document_id)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per operation keeps the index usable from worker threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _add(self, conn: sqlite3.Connection, kind: str, ref: str, keyword: str, settings: str, signature: tuple[int, ...]) -> None:
+        row = conn.execute("SELECT id FROM documents WHERE kind = ? AND ref = ?", (kind, ref)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM buckets WHERE document_id = ?", (row[0],))
+            conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+        document_id = conn.execute(
+            "INSERT INTO documents (kind, ref, keyword, settings, signature, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, ref, keyword, settings, self.hasher.pack(signature), time.time()),
+        ).lastrowid
+        conn.executemany(
+            "INSERT OR IGNORE INTO buckets (kind, band, bucket, document_id) VALUES (?, ?, ?, ?)",
+            [(kind, band, bucket, document_id) for band, bucket in enumerate(self.hasher.band_keys(signature))],
+        )
+
+    def add_post(self, ref: str, user_input: dict[str, any], blog_post_object: dict[str, any]) -> None:
+        """게시물의 요청 서명과 내용 서명을 색인에 추가합니다. 같은 `ref`의 기존 서명은 교체됩니다."""
+        keyword = user_input.get('keyword', '')
+        settings = settings_fingerprint(user_input)
+        with TELEMETRY.span("dedup_index"):
+            request_signature = self.hasher.signature(keyword_tokens(keyword))
+            content_signature = self.hasher.signature(post_shingles(blog_post_object))
+            with self._connect() as conn:
+                self._add(conn, "request", ref, keyword, settings, request_signature)
+                self._add(conn, "content", ref, keyword, settings, content_signature)
+
+    def _candidates(self, kind: str, signature: tuple[int, ...]) -> list[tuple[str, str, str, bytes]]:
+        """서명과 같은 버킷에 하나라도 들어간 문서의 (ref, keyword, settings, signature) 목록입니다."""
+        keys = self.hasher.band_keys(signature)
+        values = ", ".join("(?, ?)" for _ in keys)
+        params = [value for band, bucket in enumerate(keys) for value in (band, bucket)]
+        with self._connect() as conn:
+            return conn.execute(
+                f"""WITH query(band, bucket) AS (VALUES {values})
+                SELECT d.ref, d.keyword, d.settings, d.signature FROM documents d
+                WHERE d.id IN (
+                    SELECT b.document_id FROM query q
+                    JOIN buckets b ON b.kind = ? AND b.band = q.band AND b.bucket = q.bucket
+                )""",
+                (*params, kind),
+            ).fetchall()
+
+    def find_similar_requests(
+        self,
+        user_input: dict[str, any],
+        threshold: float = DEFAULT_REQUEST_THRESHOLD,
+        limit: int = DEFAULT_MATCH_LIMIT,
+    ) -> list[DuplicateMatch]:
+        """키워드가 비슷한 요청으로 생성된 게시물을 유사도가 높은 순으로 찾습니다.
+
+        후보의 유사도는 저장된 키워드로 정확히 다시 계산합니다.
+        """
+        tokens = keyword_tokens(user_input.get('keyword', ''))
+        settings = settings_fingerprint(user_input)
+        matches = []
+        with TELEMETRY.span("dedup_lookup", kind="request"):
+            for ref, keyword, candidate_settings, _ in self._candidates("request", self.hasher.signature(tokens)):
+                score = request_similarity(tokens, keyword_tokens(keyword))
+                if score >= threshold:
+                    matches.append(DuplicateMatch(ref, keyword, score, candidate_settings == settings))
+        matches.sort(key=lambda match: (match.settings_match, match.score), reverse=True)
+        return matches[:limit]
+
+    def find_similar_posts(
+        self,
+        blog_post_object: dict[str, any],
+        threshold: float = 0.0,
+        limit: int = DEFAULT_MATCH_LIMIT,
+        exclude_ref: str | None = None,
+    ) -> list[DuplicateMatch]:
+        """내용이 겹치는 기존 게시물을 추정 유사도가 높은 순으로 찾습니다."""
+        signature = self.hasher.signature(post_shingles(blog_post_object))
+        matches = []
+        with TELEMETRY.span("dedup_lookup", kind="content"):
+            for ref, keyword, _, stored in self._candidates("content", signature):
+                if ref == exclude_ref:
+                    continue
+                score = MinHasher.similarity(signature, self.hasher.unpack(stored))
+                if score >= threshold:
+                    matches.append(DuplicateMatch(ref, keyword, score))
+        matches.sort(key=lambda match: match.score, reverse=True)
+        return matches[:limit]
+
+    def count(self) -> int:
+        """색인된 게시물 수를 반환합니다."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents WHERE kind = 'content'").fetchone()[0]
+
+
+def find_similar_within(
+    user_inputs: list[dict[str, any]],
+    threshold: float = DEFAULT_REQUEST_THRESHOLD,
+    hasher: MinHasher | None = None,
+) -> dict[int, DuplicateMatch]:
+    """입력 목록 안에서 앞선 요청과 비슷한 요청을 찾습니다. (동시에 생성되어 서로의 결과를 볼 수 없는 배치용)
+
+    Returns:
+        중복 요청의 인덱스별로, 비슷한 앞선 요청(`ref`는 "#행 번호")을 담은 딕셔너리.
+    """
+    hasher = hasher or MinHasher()
+    buckets: dict[tuple[int, int], list[int]] = {}
+    tokens = [keyword_tokens(user_input.get('keyword', '')) for user_input in user_inputs]
+    settings = [settings_fingerprint(user_input) for user_input in user_inputs]
+    duplicates = {}
+    for index, user_input in enumerate(user_inputs):
+        keys = list(enumerate(hasher.band_keys(hasher.signature(tokens[index]))))
+        candidates = {earlier for key in keys for earlier in buckets.get(key, [])}
+        best = None
+        for earlier in sorted(candidates):
+            score = request_similarity(tokens[index], tokens[earlier])
+            if settings[earlier] == settings[index] and score >= threshold and (best is None or score > best.score):
+                best = DuplicateMatch(f"#{earlier + 1}", user_inputs[earlier].get('keyword', ''), score)
+        if best is not None:
+            duplicates[index] = best
+        else:
+            # Only originals are indexed so a chain of near-duplicates all point at the first request
+            for key in keys:
+                buckets.setdefault(key, []).append(index)
+    return duplicates
+
+
+_default_index: SimilarityIndex | None = None
+_default_index_lock = threading.Lock()
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """게시물 보관소 디렉터리(`BLOG_GENIE_ARCHIVE_DIR`)에 있는 프로세스 공용 유사도 색인을 반환합니다."""
+    global _default_index
+    path = os.path.join(get_post_archive().root, SIMILARITY_INDEX_FILENAME)
+    with _default_index_lock:
+        if _default_index is None or _default_index.path != path:
+            _default_index = SimilarityIndex(path)
+        return _default_index
+
+
+def duplicate_policy(user_input: dict[str, any]) -> str:
+    """`user_input['duplicate_policy']`를 반환합니다. 없으면 "off"입니다.
+
+    Raises:
+        ValueError: 지원하지 않는 값인 경우.
+    """
+    policy = user_input.get('duplicate_policy') or "off"
+    if policy not in DUPLICATE_POLICIES:
+        raise ValueError(f"지원하지 않는 중복 처리 방식입니다: {policy} (지원: {', '.join(DUPLICATE_POLICIES)})")
+    return policy
+
+
+def screen_request(user_input: dict[str, any]) -> list[DuplicateMatch]:
+    """모델을 호출하기 전에 같은 설정의 비슷한 요청으로 생성된 게시물이 있는지 확인합니다.
+
+    Returns:
+        중복으로 판단한 기존 게시물 목록. `duplicate_policy`가 "off"이면 확인하지 않고 빈 목록을 반환합니다.
+
+    Raises:
+        DuplicateRequestError: 중복 게시물이 있고 `duplicate_policy`가 "skip"인 경우.
+    """
+    policy = duplicate_policy(user_input)
+    if policy == "off":
+        return []
+    matches = [match for match in get_similarity_index().find_similar_requests(user_input) if match.settings_match]
+    if not matches:
+        return []
+    TELEMETRY.incr("duplicate_requests", policy=policy)
+    message = f"'{user_input.get('keyword', '')}'와(과) 비슷한 게시물이 이미 있습니다: {matches[0].format()}"
+    if policy == "skip":
+        raise DuplicateRequestError(message, matches)
+    print(f"⚠️ {message}")
+    return matches
+
+
+def report_overlap(user_input: dict[str, any], blog_post_object: dict[str, any]) -> list[DuplicateMatch]:
+    """생성된 게시물과 내용이 겹치는 기존 게시물의 유사도를 출력합니다.
+
+    Returns:
+        `DEFAULT_CONTENT_THRESHOLD` 이상 겹치는 기존 게시물 목록. "off"이면 확인하지 않습니다.
+    """
+    if duplicate_policy(user_input) == "off":
+        return []
+    overlaps = get_similarity_index().find_similar_posts(blog_post_object)
+    if not overlaps:
+        print("내용이 겹치는 기존 게시물이 없습니다.")
+        return []
+    print("기존 게시물과의 내용 유사도: " + ", ".join(match.format() for match in overlaps))
+    duplicates = [match for match in overlaps if match.score >= DEFAULT_CONTENT_THRESHOLD]
+    if duplicates:
+        TELEMETRY.incr("duplicate_posts")
+        logger.warning(f"생성된 게시물이 기존 게시물과 겹칩니다: {duplicates[0].format()}")
+    return duplicates
+
+
+def index_post(ref: str, user_input: dict[str, any], blog_post_object: dict[str, any]) -> None:
+    """저장하거나 발행 대기열에 넣은 게시물을 유사도 색인에 추가합니다. (`duplicate_policy`와 무관)"""
+    get_similarity_index().add_post(ref, user_input, blog_post_object)
@@ -0,0 +1,300 @@
+"""개요를 먼저 생성한 뒤 각 단락을 병렬로 생성하는 콘텐츠 생성 엔진입니다."""
+
+import asyncio
+import logging
+
+from src.core.content_generator import (
+    MAX_RETRIES,
+    MIN_BODY_LENGTH,
+    ContentGenerationError,
+    call_gemini_async,
+    create_llm_model,
+    current_model_name,
+    extract_json_object,
+    select_model_name,
+    served_model_name,
+)
+from src.utils.cache import ResponseCache, get_response_cache
+from src.utils.rate_limit import AsyncRateLimiter
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLEL_SECTIONS = 4
+MIN_SECTION_LENGTH = 60
+
+OUTLINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "meta_description": {"type": "string"},
+        "sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "subtitle": {"type": "string"},
+                    "summary": {"type": "string"},
+                    "image_keyword": {"type": "string", "nullable": True},
+                },
+                "required": ["subtitle", "summary", "image_keyword"],
+            },
+        },
+        "tags": {"type": "string"},
+    },
+    "required": ["title", "meta_description", "sections", "tags"],
+}
+OUTLINE_GENERATION_CONFIG: dict[str, any] = {
+    "response_mime_type": "application/json",
+    "response_schema": OUTLINE_SCHEMA,
+}
+# Section bodies are plain Markdown, so no JSON constraint is applied
+SECTION_GENERATION_CONFIG: dict[str, any] = {}
+
+
+def build_outline_prompt(user_input: dict[str, any], context: str) -> str:
+    """제목, 메타 설명, 단락 개요, 태그만 요청하는 짧은 개요 프롬프트를 만듭니다."""
+    keyword = user_input.get('keyword', '')
+    target_audience = user_input.get('target_audience', '전문가')
+    tone_of_voice = user_input.get('tone_of_voice', '전문적')
+    num_subheadings = user_input.get('num_subheadings', 5)
+    seo_optimization_level = user_input.get('seo_optimization_level', '강화')
+    custom_instructions = user_input.get('custom_instructions', '')
+
+    return f"""
+당신은 SEO에 능숙한 전문 기술 블로거입니다.
+아래 '키워드'와 '참고 자료'로 블로그 게시물의 **개요만** 작성해주세요. 본문 내용은 작성하지 마세요.
+
+**사용자 요청 사항:**
+-   **대상 독자:** {target_audience}
+-   **어조:** {tone_of_voice}
+-   **구조:** 서론, 본론({num_subheadings}개 소제목), 결론 순서로 총 {num_subheadings + 2}개 단락
+-   **SEO 최적화 수준:** {seo_optimization_level}
+-   **추가 지시사항:** {custom_instructions if custom_instructions else "없음"}
+
+**생성 규칙:**
+1.  **title:** 키워드를 포함한 매력적인 제목 (Plain Text)
+2.  **meta_description:** 키워드를 포함한 150자 내외의 요약
+3.  **sections:** 단락 배열. 각 요소는 subtitle(Plain Text 소제목), summary(단락에서 다룰 핵심 내용 1~2문장), image_keyword(이미지가 효과적인 경우에만 한글 검색어, 아니면 null)를 가집니다.
+4.  **tags:** 쉼표로 구분된 5개 이상의 관련 태그 문자열
+
+**키워드:** {keyword}
+
+**참고 자료:**
+{context}
+
+**출력 형식 (JSON):**
+```json
+{{
+    "title": "생성된 제목",
+    "meta_description": "생성된 메타 설명",
+    "sections": [
+        {{"subtitle": "소제목", "summary": "다룰 내용", "image_keyword": null}}
+    ],
+    "tags": "태그1, 태그2, ..."
+}}
+```
+"""
+
+
+def build_section_prompt(
+    user_input: dict[str, any],
+    context: str,
+    outline: dict[str, any],
+    index: int,
+    instruction: str | None = None,
+    previous_content: str | None = None,
+) -> str:
+    """개요의 단락 하나에 대한 본문 내용만 요청하는 프롬프트를 만듭니다.
+
+    `instruction`이나 `previous_content`를 주면 기존 단락을 고쳐 쓰는 프롬프트가 됩니다.
+    """
+    sections = outline.get('sections', [])
+    section = sections[index]
+    outline_text = "\n".join(
+        f"{i + 1}. {item.get('subtitle', '')}" for i, item in enumerate(sections)
+    )
+    desired_length = user_input.get('desired_length', '길게 (1500+ 단어)')
+    # Appended right after the context so prompts without edits (and their cache keys) stay unchanged
+    edit_text = ""
+    if previous_content:
+        edit_text += f"\n\n**기존 단락 내용:**\n{previous_content}"
+    if instruction:
+        edit_text += f"\n\n**수정 요청:** {instruction}"
+
+    return f"""
+당신은 SEO에 능숙한 전문 기술 블로거입니다.
+블로그 게시물 "{outline.get('title', '')}"의 단락 하나를 작성하고 있습니다.
+
+**대상 독자:** {user_input.get('target_audience', '전문가')}
+**어조:** {user_input.get('tone_of_voice', '전문적')}
+**게시물 전체 희망 길이:** {desired_length} (전체 {len(sections)}개 단락 중 하나입니다)
+**추가 지시사항:** {user_input.get('custom_instructions', '') or "없음"}
+
+**전체 개요:**
+{outline_text}
+
+**작성할 단락:** {index + 1}. {section.get('subtitle', '')}
+**다룰 내용:** {section.get('summary', '')}
+
+**참고 자료:**
+{context}{edit_text}
+
+이 단락의 본문 내용만 Markdown으로 작성해주세요. 소제목, JSON, 코드 펜스 없이 본문만 반환하세요.
+'참고 자료'의 내용을 그대로 복사하지 말고, 자연스럽게 재구성하여 설명해야 합니다.
+"""
+
+
+class _TextGenerator:
+    """캐시 조회, 호출 빈도 제한, 지연 모델 생성을 묶어 프롬프트 하나를 처리합니다."""
+
+    def __init__(
+        self,
+        rate_limiter: AsyncRateLimiter | None,
+        use_cache: bool,
+        refresh_cache: bool,
+        model_name: str | None = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self.model_name = model_name
+        self._model = None
+        # Prompt -> model that answered it, so `store` caches under the model that actually served
+        self._served_models: dict[str, str] = {}
+
+    async def generate(self, prompt: str, generation_config: dict[str, any], stage: str) -> str:
+        if self.use_cache and not self.refresh_cache:
+            cache_key = ResponseCache.make_key(prompt, current_model_name(self.model_name), generation_config)
+            cached_text = get_response_cache().get(cache_key)
+            if cached_text is not None:
+                return cached_text
+
+        if self._model is None:
+            self._model = create_llm_model(self.model_name)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        response = await call_gemini_async(self._model, prompt, generation_config, stage)
+        self._served_models[prompt] = served_model_name(response, self.model_name)
+        return response.text.strip()
+
+    def store(self, prompt: str, generation_config: dict[str, any], response_text: str) -> None:
+        """검증을 통과한 응답만 캐시에 저장합니다."""
+        served = self._served_models.pop(prompt, None) or current_model_name(self.model_name)
+        if self.use_cache:
+            cache_key = ResponseCache.make_key(prompt, served, generation_config)
+            get_response_cache().put(cache_key, response_text)
+
+
+async def _generate_outline(generator: _TextGenerator, prompt: str) -> dict[str, any]:
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response_text = await generator.generate(prompt, OUTLINE_GENERATION_CONFIG, "outline")
+            outline = extract_json_object(response_text)
+            sections = outline.get('sections')
+            if not isinstance(sections, list) or not sections or not all(isinstance(s, dict) for s in sections):
+                raise ContentGenerationError("개요의 단락(sections)이 유효한 배열 형식이 아닙니다.")
+            generator.store(prompt, OUTLINE_GENERATION_CONFIG, response_text)
+            return outline
+        except Exception as e:
+            logger.warning(f"개요 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+            if attempt >= MAX_RETRIES:
+                raise ContentGenerationError(f"개요 생성 중 최종 오류 발생: {e}")
+            TELEMETRY.incr("llm_retries", stage="outline")
+
+
+async def _generate_section(
+    generator: _TextGenerator,
+    semaphore: asyncio.Semaphore,
+    prompt: str,
+    index: int,
+    min_length: int,
+) -> str:
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                content = await generator.generate(prompt, SECTION_GENERATION_CONFIG, "section")
+                if len(content) < min_length:
+                    raise ContentGenerationError(f"단락 내용이 너무 짧습니다 ({len(content)}자, 최소 {min_length}자).")
+                generator.store(prompt, SECTION_GENERATION_CONFIG, content)
+                return content
+            except Exception as e:
+                logger.warning(f"단락 {index + 1} 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+                if attempt >= MAX_RETRIES:
+                    raise ContentGenerationError(f"단락 {index + 1} 생성 중 최종 오류 발생: {e}")
+                TELEMETRY.incr("llm_retries", stage="section")
+
+
+async def generate_blog_content_fanout(
+    user_input: dict[str, any],
+    context: str,
+    max_parallel: int = DEFAULT_MAX_PARALLEL_SECTIONS,
+    rate_limiter: AsyncRateLimiter | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> dict[str, any]:
+    """짧은 개요 호출 후 각 단락을 병렬로 생성하여 `blog_post_object`를 조합합니다.
+
+    단일 프롬프트 방식과 달리 전체 소요 시간이 가장 느린 단락 하나의 생성 시간에
+    가까워지며, 실패하거나 너무 짧은 단락은 해당 단락만 다시 생성합니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        context: 프롬프트에 포함될 참고 자료.
+        max_parallel: 동시에 생성할 최대 단락 수.
+        rate_limiter: 지정된 경우 각 API 요청 전에 호출 예산을 확보합니다.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+
+    Returns:
+        `generate_blog_content`와 같은 구조의 블로그 콘텐츠 딕셔너리.
+
+    Raises:
+        ContentGenerationError: 개요 또는 어느 단락이 재시도 후에도 실패한 경우.
+    """
+    print("개요 기반 병렬 생성 방식으로 블로그 콘텐츠 생성을 시작합니다...")
+    generator = _TextGenerator(rate_limiter, use_cache, refresh_cache, select_model_name(user_input))
+    with TELEMETRY.span("prompt_build", stage="outline"):
+        outline_prompt = build_outline_prompt(user_input, context)
+    outline = await _generate_outline(generator, outline_prompt)
+    sections = outline['sections']
+
+    min_length = max(MIN_SECTION_LENGTH, MIN_BODY_LENGTH // len(sections))
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    tasks = [
+        asyncio.ensure_future(_generate_section(
+            generator,
+            semaphore,
+            build_section_prompt(user_input, context, outline, index),
+            index,
+            min_length,
+        ))
+        for index in range(len(sections))
+    ]
+    try:
+        contents = await asyncio.gather(*tasks)
+    except BaseException:
+        # One failed section fails the post, so stop the others from spending more calls and rate-limit budget
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    tags = outline.get('tags', [])
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(',')]
+
+    print("개요 기반 병렬 블로그 콘텐츠 생성 완료.")
+    return {
+        "title": outline.get('title', ''),
+        "meta_description": outline.get('meta_description', ''),
+        "body": [
+            {
+                "subtitle": section.get('subtitle', ''),
+                "content": content,
+                "image_keyword": section.get('image_keyword'),
+            }
+            for section, content in zip(sections, contents)
+        ],
+        "tags": tags,
+    }
@@ -0,0 +1,368 @@
+"""모델을 한 번만 초기화해 두고 로컬 HTTP/유닉스 소켓 API로 블로그 생성 작업을 받는 상주 서버입니다.
+
+API:
+    GET    /health                 서버 상태와 대기/실행 중인 작업 수, 키/모델 경로별 대기열과 사용률
+    GET    /metrics                Prometheus 형식의 지표
+    POST   /jobs                   작업 제출 ({"user_input": {...}, "engine": "single", ...})
+    GET    /jobs                   작업 목록
+    GET    /jobs/<id>?offset=N     작업 상태와 N번째 이후의 출력 조각
+    GET    /jobs/<id>/result       완료된 작업의 전체 마크다운
+    DELETE /jobs/<id>              작업 취소
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from src.core.content_generator import create_llm_model, current_model_name
+from src.core.model_router import get_model_router
+from src.core.options import DEFAULT_WORKERS, GENERATION_ENGINES
+from src.core.pipeline import (
+    PipelineCancelledError,
+    run_blog_post_pipeline_async,
+    run_blog_post_pipeline_stream,
+)
+from src.utils.job_client import (
+    DEFAULT_SERVER_ADDRESS,
+    FINISHED_JOB_STATES,
+    parse_server_address,
+)
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING_JOBS = 100
+# Finished jobs are kept for polling; the oldest are dropped beyond this so a long-lived server stays bounded
+MAX_FINISHED_JOBS = 1000
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class ServerBusyError(Exception):
+    """대기 중인 작업이 너무 많아 새 작업을 받을 수 없음"""
+
+
+@dataclass
+class ServerJob:
+    """서버에 제출된 생성 작업 하나의 상태와 출력입니다."""
+
+    id: str
+    user_input: dict[str, any]
+    engine: str = "single"
+    use_cache: bool = True
+    refresh_cache: bool = False
+    save_to_file: bool = True
+    status: str = "queued"
+    stage: str = ""
+    error: str | None = None
+    output: list[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Future | None = None
+
+    def to_dict(self, offset: int | None = None) -> dict[str, any]:
+        """API 응답용 딕셔너리를 만듭니다. `offset`을 주면 그 이후의 출력 조각을 포함합니다."""
+        data = {
+            "id": self.id,
+            "keyword": self.user_input.get("keyword", ""),
+            "engine": self.engine,
+            "status": self.status,
+            "stage": self.stage,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if offset is not None:
+            # Snapshot the length first; workers only ever append
+            end = len(self.output)
+            data["output"] = self.output[offset:end]
+            data["next_offset"] = end
+        return data
+
+
+class JobManager:
+    """제한된 수의 워커 스레드로 생성 작업을 실행하고 상태를 보관합니다.
+
+    Args:
+        workers: 동시에 실행할 최대 작업 수.
+        max_pending: 실행을 기다릴 수 있는 최대 작업 수. 초과하면 `ServerBusyError`가 발생합니다.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING_JOBS):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="blog-genie-job")
+        self.jobs: OrderedDict[str, ServerJob] = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        user_input: dict[str, any],
+        engine: str = "single",
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        save_to_file: bool = True,
+    ) -> ServerJob:
+        """작업을 대기열에 추가합니다.
+
+        Raises:
+            ValueError: 키워드가 없거나 알 수 없는 생성 방식인 경우.
+            ServerBusyError: 대기 중인 작업이 `max_pending`개 이상인 경우.
+        """
+        if not isinstance(user_input, dict) or not user_input.get("keyword"):
+            raise ValueError("user_input.keyword가 필요합니다.")
+        if engine not in GENERATION_ENGINES:
+            raise ValueError(f"알 수 없는 생성 방식입니다: {engine} (사용 가능: {', '.join(GENERATION_ENGINES)})")
+
+        with self._lock:
+            if self.stats()["queued"] >= self.max_pending:
+                raise ServerBusyError(f"대기 중인 작업이 너무 많습니다. (최대 {self.max_pending}건)")
+            job = ServerJob(
+                id=str(next(self._ids)),
+                user_input=user_input,
+                engine=engine,
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+                save_to_file=save_to_file,
+            )
+            self.jobs[job.id] = job
+            self._prune()
+        job.future = self.executor.submit(self._run, job)
+        TELEMETRY.incr("server_jobs", status="submitted")
+        return job
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.status in FINISHED_JOB_STATES]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id: str) -> ServerJob | None:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> ServerJob | None:
+        """작업을 취소합니다. 실행 중인 작업은 다음 출력 조각을 받기 전에(병렬 생성은 진행 중인 호출을 취소하고) 중단됩니다."""
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_JOB_STATES:
+            return job
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, "cancelled")
+        return job
+
+    def stats(self) -> dict[str, int]:
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0, "cancelled": 0}
+        for job in list(self.jobs.values()):
+            counts[job.status] += 1
+        return counts
+
+    def _finish(self, job: ServerJob, status: str, error: str | None = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+        TELEMETRY.incr("server_jobs", status=status)
+
+    def _set_stage(self, job: ServerJob, stage: str) -> None:
+        job.stage = stage
+
+    def _run(self, job: ServerJob) -> None:
+        if job.cancel_event.is_set():
+            self._finish(job, "cancelled")
+            return
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            with TELEMETRY.span("server_job", engine=job.engine):
+                if job.engine == "single":
+                    for chunk in run_blog_post_pipeline_stream(
+                        job.user_input,
+                        save_to_file=job.save_to_file,
+                        use_cache=job.use_cache,
+                        refresh_cache=job.refresh_cache,
+                        progress_callback=lambda stage: self._set_stage(job, stage),
+                        cancel_event=job.cancel_event,
+                    ):
+                        job.output.append(chunk)
+                else:
+                    self._set_stage(job, "콘텐츠 생성 중")
+                    job.output.append(asyncio.run(run_blog_post_pipeline_async(
+                        job.user_input,
+                        job.save_to_file,
+                        use_cache=job.use_cache,
+                        refresh_cache=job.refresh_cache,
+                        engine=job.engine,
+                        cancel_event=job.cancel_event,
+                    )))
+        except PipelineCancelledError:
+            self._finish(job, "cancelled")
+        except Exception as e:
+            logger.exception(f"작업 #{job.id} 실행 중 오류 발생")
+            self._finish(job, "failed", str(e))
+        else:
+            job.stage = "완료"
+            self._finish(job, "done")
+
+    def shutdown(self) -> None:
+        for job in self.jobs.values():
+            job.cancel_event.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """작업 API 요청을 `JobManager`로 전달합니다. 서버별 하위 클래스에서 `manager`를 지정합니다."""
+
+    manager: JobManager
+    server_version = "BlogGenie"
+
+    def _send(self, status: int, body: any, content_type: str = "application/json; charset=utf-8", headers: dict[str, str] | None = None):
+        data = body.encode("utf-8") if isinstance(body, str) else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, message: str, headers: dict[str, str] | None = None):
+        self._send(status, {"error": message}, headers=headers)
+
+    def _route(self) -> tuple[list[str], dict[str, str]]:
+        url = urlparse(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        return parts, query
+
+    def do_GET(self):
+        parts, query = self._route()
+        if parts == ["health"]:
+            router = get_model_router()
+            self._send(200, {
+                "status": "ok",
+                "pid": os.getpid(),
+                "model": current_model_name(),
+                "workers": self.manager.workers,
+                **self.manager.stats(),
+                **({"routes": router.stats()} if router is not None else {}),
+            })
+        elif parts == ["metrics"]:
+            self._send(200, TELEMETRY.to_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+        elif parts == ["jobs"]:
+            self._send(200, {"jobs": [job.to_dict() for job in list(self.manager.jobs.values())]})
+        elif len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.manager.get(parts[1])
+            if job is None:
+                self._error(404, f"작업을 찾을 수 없습니다: {parts[1]}")
+            elif len(parts) == 2:
+                try:
+                    offset = max(0, int(query.get("offset", 0)))
+                except ValueError:
+                    self._error(400, "offset은 정수여야 합니다.")
+                    return
+                self._send(200, job.to_dict(offset))
+            elif parts[2] == "result":
+                if job.status != "done":
+                    self._error(409, f"작업이 완료되지 않았습니다. (상태: {job.status})")
+                else:
+                    self._send(200, "".join(job.output).strip(), "text/markdown; charset=utf-8")
+            else:
+                self._error(404, "알 수 없는 경로입니다.")
+        else:
+            self._error(404, "알 수 없는 경로입니다.")
+
+    def do_POST(self):
+        parts, _ = self._route()
+        if parts != ["jobs"]:
+            self._error(404, "알 수 없는 경로입니다.")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._error(413, "요청 본문이 너무 큽니다.")
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            job = self.manager.submit(
+                body.get("user_input"),
+                body.get("engine", "single"),
+                bool(body.get("use_cache", True)),
+                bool(body.get("refresh_cache", False)),
+                bool(body.get("save_to_file", True)),
+            )
+        except (ValueError, AttributeError) as e:
+            self._error(400, str(e))
+        except ServerBusyError as e:
+            self._error(503, str(e), {"Retry-After": "5"})
+        else:
+            self._send(202, job.to_dict(), headers={"Location": f"/jobs/{job.id}"})
+
+    def do_DELETE(self):
+        parts, _ = self._route()
+        job = self.manager.cancel(parts[1]) if len(parts) == 2 and parts[0] == "jobs" else None
+        if job is None:
+            self._error(404, "작업을 찾을 수 없습니다.")
+        else:
+            self._send(202, job.to_dict())
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _ThreadingTCPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+def create_server(address: str, manager: JobManager) -> socketserver.BaseServer:
+    """주소 형식(`host:port` 또는 `unix:/path`)에 맞는 HTTP 서버를 만듭니다."""
+    kind, target = parse_server_address(address)
+    handler = type("BoundJobRequestHandler", (JobRequestHandler,), {"manager": manager})
+    if kind == "unix":
+        if os.path.exists(target):
+            # A stale socket from a crashed server would make bind fail
+            os.unlink(target)
+        server = _ThreadingUnixHTTPServer(target, handler)
+        os.chmod(target, 0o600)
+        return server
+    return _ThreadingTCPHTTPServer(target, handler)
+
+
+def serve(
+    address: str = DEFAULT_SERVER_ADDRESS,
+    workers: int = DEFAULT_WORKERS,
+    max_pending: int = DEFAULT_MAX_PENDING_JOBS,
+) -> None:
+    """모델을 미리 초기화하고 중단(Ctrl+C)될 때까지 작업 요청을 처리합니다."""
+    try:
+        create_llm_model()
+    except Exception as e:
+        # Keep serving: jobs will report the same error, and the server can still answer health checks
+        logger.warning(f"모델을 미리 초기화하지 못했습니다: {e}")
+
+    manager = JobManager(workers, max_pending)
+    server = create_server(address, manager)
+    print(f"Blog-Genie 서버가 시작되었습니다: {address} (작업자 {manager.workers}개, 대기 최대 {max_pending}건)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("서버를 종료합니다...")
+    finally:
+        server.server_close()
+        manager.shutdown()
+        kind, target = parse_server_address(address)
+        if kind == "unix" and os.path.exists(target):
+            os.unlink(target)
@@ -0,0 +1,332 @@
+"""콘텐츠 생성에 사용할 LLM 백엔드(Gemini, 로컬 가짜 모델)를 제공합니다.
+
+모든 백엔드는 `google.generativeai.GenerativeModel`과 같은 형태의
+`generate_content(prompt, generation_config=None, stream=False)`와
+`generate_content_async(prompt, generation_config=None)`를 제공하며, 응답 객체는
+`text`와 `usage_metadata` 속성을 가집니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+
+from src.core.corpus_index import estimate_tokens
+from src.core.options import BACKENDS
+
+FAKE_MODEL_NAME = "fake-blog-model"
+FAKE_STREAM_CHUNK_CHARS = 200
+
+_backend_lock = threading.Lock()
+_backend_name = "gemini"
+_backend_options: dict[str, any] = {}
+# Backends are expensive to build (SDK configuration, client setup), so one instance per model is reused
+_backend_instances: dict[str, any] = {}
+
+
+class GeminiBackend:
+    """`google.generativeai`의 Gemini 생성 모델을 감싸는 백엔드입니다.
+
+    `api_key`가 없으면 `GEMINI_API_KEY`로 SDK 전체를 설정하고 `GenerativeModel`을 사용합니다.
+    `api_key`가 있으면(여러 키를 나눠 쓰는 라우터) `genai.configure()`가 프로세스 전체에 적용되므로,
+    이 키만 사용하는 공개 `GenerativeServiceClient`를 따로 만들어 요청을 보냅니다.
+
+    Args:
+        model_name: 사용할 Gemini 모델 이름.
+        api_key: 이 백엔드만 사용할 API 키. 없으면 `GEMINI_API_KEY`로 SDK 전체를 설정합니다.
+
+    Raises:
+        ValueError: `api_key`가 없고 `GEMINI_API_KEY`도 설정되지 않은 경우.
+    """
+
+    def __init__(self, model_name: str, api_key: str | None = None):
+        # Imported here because the SDK takes over a second to import and only this backend needs it
+        import google.generativeai as genai
+        from google.ai import generativelanguage
+
+        self.model_name = model_name
+        self._genai = genai
+        self._generativelanguage = generativelanguage
+        self._client = None
+        if api_key is None:
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY가 .env 파일에 설정되지 않았습니다.")
+            genai.configure(api_key=api_key)
+            self._model = genai.GenerativeModel(model_name)
+        else:
+            self._model = None
+            self._api_key = api_key
+            self._client = generativelanguage.GenerativeServiceClient(client_options={"api_key": api_key})
+        # The SDK's async client is bound to the event loop that first used it
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _request(self, prompt: str, generation_config: dict[str, any] | None):
+        """`GenerativeModel`과 같은 방식으로 프롬프트와 생성 설정을 요청 메시지로 변환합니다."""
+        from google.generativeai.types import content_types, generation_types
+
+        contents = content_types.to_contents(prompt)
+        if contents and not contents[-1].role:
+            contents[-1].role = "user"
+        name = self.model_name if self.model_name.startswith(("models/", "tunedModels/")) else f"models/{self.model_name}"
+        return self._genai.protos.GenerateContentRequest(
+            model=name,
+            contents=contents,
+            generation_config=generation_types.to_generation_config_dict(generation_config),
+        )
+
+    def generate_content(self, prompt: str, generation_config: dict[str, any] | None = None, stream: bool = False):
+        if self._client is None:
+            return self._model.generate_content(prompt, generation_config=generation_config, stream=stream)
+        from google.generativeai.types import generation_types
+
+        request = self._request(prompt, generation_config)
+        if stream:
+            return generation_types.GenerateContentResponse.from_iterator(self._client.stream_generate_content(request))
+        return generation_types.GenerateContentResponse.from_response(self._client.generate_content(request))
+
+    async def generate_content_async(self, prompt: str, generation_config: dict[str, any] | None = None):
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            if self._client is None:
+                client = self._genai.GenerativeModel(self.model_name)
+            else:
+                client = self._generativelanguage.GenerativeServiceAsyncClient(client_options={"api_key": self._api_key})
+            client = self._async_clients.setdefault(loop, client)
+        if self._client is None:
+            return await client.generate_content_async(prompt, generation_config=generation_config)
+        from google.generativeai.types import generation_types
+
+        response = await client.generate_content(self._request(prompt, generation_config))
+        return generation_types.AsyncGenerateContentResponse.from_response(response)
+
+
+class FakeUsage:
+    """Gemini `usage_metadata`와 같은 속성을 가진 토큰 사용량입니다."""
+
+    def __init__(self, prompt: str, text: str):
+        self.prompt_token_count = estimate_tokens(prompt)
+        self.candidates_token_count = estimate_tokens(text)
+        self.total_token_count = self.prompt_token_count + self.candidates_token_count
+
+
+class FakeResponse:
+    def __init__(self, prompt: str, text: str):
+        self.text = text
+        self.usage_metadata = FakeUsage(prompt, text)
+
+
+class FakeStreamResponse:
+    """텍스트를 조각으로 나눠 지연 시간에 맞춰 전달하는 스트리밍 응답입니다."""
+
+    def __init__(self, prompt: str, text: str, delay: float):
+        self._chunks = [text[i:i + FAKE_STREAM_CHUNK_CHARS] for i in range(0, len(text), FAKE_STREAM_CHUNK_CHARS)] or [""]
+        self._delay_per_chunk = delay / len(self._chunks)
+        self.usage_metadata = FakeUsage(prompt, text)
+
+    def __iter__(self) -> Iterator[FakeResponse]:
+        for chunk in self._chunks:
+            time.sleep(self._delay_per_chunk)
+            yield FakeResponse("", chunk)
+
+
+_SENTENCE_TEMPLATES = (
+    "{keyword}은(는) 최근 많은 개발자와 기업이 주목하는 주제입니다.",
+    "이 단락에서는 {topic}에 대해 실제 사례를 중심으로 살펴봅니다.",
+    "{keyword}을(를) 처음 접하는 독자라면 기본 개념부터 차근차근 이해하는 것이 좋습니다.",
+    "특히 {topic}은(는) 실무에서 자주 마주치는 문제를 해결하는 데 큰 도움이 됩니다.",
+    "* {topic}의 핵심 요소를 정리하면 다음과 같습니다.",
+    "성능과 유지보수성을 함께 고려하면 {keyword} 도입 효과를 극대화할 수 있습니다.",
+    "다음 단락에서는 이를 바탕으로 한 단계 더 나아간 내용을 다룹니다.",
+)
+
+
+class FakeBackend:
+    """실제 API를 호출하지 않고 현실적인 블로그 JSON을 반환하는 결정적 가짜 백엔드입니다.
+
+    같은 시드와 프롬프트에 대해 항상 같은 결과를 반환하며, 같은 프롬프트를 다시 요청하면
+    (재시도) 다음 결과를 반환합니다. 지연 시간, 형식 오류, 호출 한도 초과 오류를
+    재현하여 실제 할당량을 쓰지 않고 파이프라인의 오버헤드와 오류 처리를 측정할 수 있습니다.
+
+    Args:
+        latency: 호출 하나의 평균 지연 시간(초).
+        jitter: 지연 시간에 더해지는 균등 분포 변동 폭(초).
+        malformed_rate: 잘리거나 후행 쉼표, 설명 문장이 섞인 응답을 반환할 확률.
+        rate_limit_rate: 429 `ResourceExhausted` 오류를 발생시킬 확률.
+        seed: 결과를 결정하는 난수 시드.
+        section_chars: 단락 하나의 대략적인 본문 길이(글자 수).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        malformed_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+        section_chars: int = 400,
+    ):
+        self.model_name = FAKE_MODEL_NAME
+        self.latency = latency
+        self.jitter = jitter
+        self.malformed_rate = malformed_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.seed = seed
+        self.section_chars = section_chars
+        self._lock = threading.Lock()
+        self._attempts: dict[str, int] = {}
+
+    def _rng(self, prompt: str) -> random.Random:
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            attempt = self._attempts.get(digest, 0)
+            self._attempts[digest] = attempt + 1
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+
+    def _delay(self, rng: random.Random) -> float:
+        return max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+
+    def _respond(self, prompt: str, rng: random.Random) -> str:
+        if rng.random() < self.rate_limit_rate:
+            from google.api_core.exceptions import ResourceExhausted
+
+            raise ResourceExhausted("Resource has been exhausted (e.g. check quota). [fake backend]")
+        text = self._build_response(prompt, rng)
+        if rng.random() < self.malformed_rate:
+            text = _malform(text, rng)
+        return text
+
+    def generate_content(self, prompt: str, generation_config: dict[str, any] | None = None, stream: bool = False):
+        rng = self._rng(prompt)
+        delay = self._delay(rng)
+        text = self._respond(prompt, rng)
+        if stream:
+            return FakeStreamResponse(prompt, text, delay)
+        time.sleep(delay)
+        return FakeResponse(prompt, text)
+
+    async def generate_content_async(self, prompt: str, generation_config: dict[str, any] | None = None):
+        rng = self._rng(prompt)
+        await asyncio.sleep(self._delay(rng))
+        return FakeResponse(prompt, self._respond(prompt, rng))
+
+    def _paragraph(self, keyword: str, topic: str, rng: random.Random) -> str:
+        sentences = []
+        length = 0
+        while length < self.section_chars:
+            sentence = rng.choice(_SENTENCE_TEMPLATES).format(keyword=keyword, topic=topic)
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        return " ".join(sentences)
+
+    def _sections(self, keyword: str, count: int, rng: random.Random) -> list[dict[str, any]]:
+        subtitles = [f"{keyword} 소개"] + [f"{keyword} 핵심 {i + 1}" for i in range(count - 2)] + [f"{keyword} 정리"]
+        return [
+            {
+                "subtitle": subtitle,
+                "content": self._paragraph(keyword, subtitle, rng),
+                "image_keyword": f"{subtitle} 다이어그램" if 0 < i < count - 1 and rng.random() < 0.5 else None,
+            }
+            for i, subtitle in enumerate(subtitles[:count])
+        ]
+
+    def _build_response(self, prompt: str, rng: random.Random) -> str:
+        keyword = _find(r"\*\*키워드:\*\* (.*)", prompt) or _find(r'블로그 게시물 "(.*?)"', prompt) or "블로그"
+        tags = ", ".join(dict.fromkeys([keyword, f"{keyword} 입문", f"{keyword} 활용", "개발", "프로그래밍"]))
+
+        if "**작성할 단락:**" in prompt:
+            topic = _find(r"\*\*작성할 단락:\*\* \d+\. (.*)", prompt) or keyword
+            return self._paragraph(keyword, topic, rng)
+
+        if "누락된 부분만" in prompt:
+            missing = int(_find(r"단락 (\d+)개", prompt) or 0)
+            sections = self._sections(keyword, missing + 2, rng)[-missing:] if missing else []
+            return json.dumps({"body": sections, "tags": tags}, ensure_ascii=False)
+
+        num_sections = int(_find(r"본론\((\d+)개 소제목\)", prompt) or 5) + 2
+        sections = self._sections(keyword, num_sections, rng)
+        post = {
+            "title": f"{keyword} 완벽 가이드: 기초부터 실전까지",
+            "meta_description": f"{keyword}의 핵심 개념과 실무 활용법을 단계별로 정리했습니다.",
+        }
+        if "개요만" in prompt:
+            post["sections"] = [
+                {"subtitle": s["subtitle"], "summary": f"{s['subtitle']}의 핵심 내용", "image_keyword": s["image_keyword"]}
+                for s in sections
+            ]
+        else:
+            post["body"] = sections
+        post["tags"] = tags
+        return json.dumps(post, ensure_ascii=False)
+
+
+def _find(pattern: str, text: str) -> str | None:
+    match = re.search(pattern, text)
+    return match.group(1).strip() if match else None
+
+
+def _malform(text: str, rng: random.Random) -> str:
+    """응답을 잘림, 후행 쉼표, 앞뒤 설명 문장 중 하나의 형태로 망가뜨립니다."""
+    kind = rng.choice(("truncated", "trailing_comma", "chatty"))
+    if kind == "truncated":
+        return text[:int(len(text) * rng.uniform(0.5, 0.9))]
+    if kind == "trailing_comma" and text.endswith("}"):
+        return text[:-1].rstrip() + ",\n}"
+    return f"네, 요청하신 내용입니다.\n```json\n{text}\n```\n도움이 되셨길 바랍니다!"
+
+
+def configure_backend(name: str, **options: any) -> None:
+    """이후 생성되는 모델이 사용할 백엔드를 설정합니다. `options`는 `FakeBackend` 인자로 전달됩니다.
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우.
+    """
+    global _backend_name, _backend_options
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 LLM 백엔드입니다: {name} (사용 가능: {', '.join(BACKENDS)})")
+    with _backend_lock:
+        _backend_name = name
+        _backend_options = dict(options)
+        _backend_instances.clear()
+
+
+def backend_model_name(model_name: str) -> str:
+    """캐시 키 등에 사용할 현재 백엔드의 모델 이름을 반환합니다."""
+    return model_name if _backend_name == "gemini" else FAKE_MODEL_NAME
+
+
+def create_backend(model_name: str):
+    """설정된 백엔드의 모델 인스턴스를 생성합니다.
+
+    여러 API 키나 모델이 설정되어 있으면(`GEMINI_API_KEYS`, `GEMINI_MODELS`) `model_name`을
+    우선하여 여유가 있는 키/모델로 호출을 나눠 보내는 라우터를 반환합니다.
+    """
+    with _backend_lock:
+        name, options = _backend_name, dict(_backend_options)
+    if name == "fake":
+        return FakeBackend(**options)
+    # Imported here because the router module builds its routes from this module's GeminiBackend
+    from src.core.model_router import RoutedBackend, get_model_router
+
+    router = get_model_router()
+    if router is not None:
+        return RoutedBackend(router, model_name)
+    return GeminiBackend(model_name)
+
+
+def get_backend(model_name: str):
+    """설정된 백엔드의 모델 인스턴스를 처음 한 번만 만들고 이후에는 재사용합니다."""
+    with _backend_lock:
+        backend = _backend_instances.get(model_name)
+    if backend is None:
+        backend = create_backend(model_name)
+        with _backend_lock:
+            backend = _backend_instances.setdefault(model_name, backend)
+    return backend
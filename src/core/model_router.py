@@ -0,0 +1,396 @@
+"""여러 Gemini API 키와 모델에 호출을 나눠 보내는 라우터입니다.
+
+부하가 커지면 CPU보다 키 하나의 분당 요청 수(RPM)와 분당 토큰 수(TPM) 한도에 먼저 걸립니다.
+라우터는 키와 모델의 조합(경로)마다 요청/토큰 버킷 예산을 두고 호출마다 여유가 있는 경로를
+고릅니다. 호출 한도 초과(429)나 서버 오류가 나면 해당 경로를 잠시 쉬게 하고 다른 경로로 다시
+보내므로, 살아 있는 경로가 하나라도 있으면 작업이 실패하지 않습니다.
+
+환경 변수:
+    GEMINI_API_KEYS: 쉼표로 구분한 API 키 목록. 없으면 `GEMINI_API_KEY` 하나를 사용합니다.
+    GEMINI_MODELS: `모델[:RPM[:TPM]]`을 쉼표로 구분한 목록. 앞의 모델일수록 우선합니다.
+        (예: gemini-1.5-flash:15:1000000,gemini-1.5-pro:2:32000)
+
+두 변수가 모두 없으면 라우터를 사용하지 않고 기존처럼 키 하나와 모델 하나로 호출합니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.core.corpus_index import estimate_tokens
+from src.core.llm_backend import GeminiBackend
+from src.utils.rate_limit import TokenBucket
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_MINUTE = 15
+DEFAULT_TOKENS_PER_MINUTE = 1_000_000
+# Free-tier budgets of the models this project uses; other models fall back to the defaults above
+MODEL_BUDGETS: dict[str, tuple[int, int]] = {
+    "gemini-1.5-flash": (15, 1_000_000),
+    "gemini-1.5-pro": (2, 32_000),
+}
+# Reserved for the response before the call and corrected with the real usage afterwards
+ESTIMATED_RESPONSE_TOKENS = 2048
+RATE_LIMIT_COOLDOWN_SECONDS = 30.0
+ERROR_COOLDOWN_SECONDS = 10.0
+KEY_ERROR_COOLDOWN_SECONDS = 600.0
+MAX_QUEUE_WAIT_SECONDS = 120.0
+
+
+class NoRouteAvailableError(Exception):
+    """모든 경로가 실패했거나 너무 오래 쉬어야 해서 호출을 보낼 경로가 없는 경우의 오류"""
+
+
+@dataclass(frozen=True)
+class ModelBudget:
+    """모델 하나의 키당 분당 요청 수와 토큰 수 예산입니다. 0 이하이면 제한하지 않습니다."""
+
+    name: str
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
+
+    @classmethod
+    def for_model(cls, name: str) -> "ModelBudget":
+        """알려진 모델이면 그 모델의 기본 예산, 아니면 공통 기본 예산을 반환합니다."""
+        requests_per_minute, tokens_per_minute = MODEL_BUDGETS.get(name, (DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_TOKENS_PER_MINUTE))
+        return cls(name, requests_per_minute, tokens_per_minute)
+
+
+def parse_model_budgets(text: str) -> list[ModelBudget]:
+    """`모델[:RPM[:TPM]]`을 쉼표로 구분한 문자열을 예산 목록으로 바꿉니다.
+
+    Raises:
+        ValueError: RPM 또는 TPM이 정수가 아닌 경우.
+    """
+    budgets = []
+    for item in text.split(","):
+        name, *limits = [part.strip() for part in item.strip().split(":")]
+        if not name:
+            continue
+        default = ModelBudget.for_model(name)
+        try:
+            requests_per_minute = int(limits[0]) if len(limits) > 0 and limits[0] else default.requests_per_minute
+            tokens_per_minute = int(limits[1]) if len(limits) > 1 and limits[1] else default.tokens_per_minute
+        except ValueError:
+            raise ValueError(f"GEMINI_MODELS 형식이 올바르지 않습니다: {item.strip()} (예: gemini-1.5-flash:15:1000000)")
+        budgets.append(ModelBudget(name, requests_per_minute, tokens_per_minute))
+    return budgets
+
+
+def key_label(api_key: str, index: int) -> str:
+    """지표와 로그에 키 전체를 남기지 않도록 순번과 마지막 네 글자만 보여주는 이름을 만듭니다."""
+    return f"key{index + 1}-{api_key[-4:]}"
+
+
+def failover_cooldown(error: Exception) -> float | None:
+    """다른 경로로 다시 보낼 오류이면 실패한 경로를 쉬게 할 시간(초)을, 아니면 None을 반환합니다.
+
+    잘못된 요청(400) 같은 오류는 어느 경로로 보내도 같으므로 다시 보내지 않습니다.
+    """
+    try:
+        from google.api_core import exceptions as api_exceptions
+    except ImportError:
+        api_exceptions = None
+    if api_exceptions is not None:
+        if isinstance(error, api_exceptions.TooManyRequests):
+            return RATE_LIMIT_COOLDOWN_SECONDS
+        if isinstance(error, (api_exceptions.PermissionDenied, api_exceptions.Unauthenticated)):
+            return KEY_ERROR_COOLDOWN_SECONDS
+        if isinstance(error, api_exceptions.ServerError):
+            return ERROR_COOLDOWN_SECONDS
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return ERROR_COOLDOWN_SECONDS
+    return None
+
+
+class Route:
+    """API 키 하나와 모델 하나의 조합입니다. 요청/토큰 버킷과 호출 상태를 가집니다."""
+
+    def __init__(self, key: str, budget: ModelBudget, backend_factory: Callable[[], any], clock: Callable[[], float]):
+        self.key = key
+        self.model_name = budget.name
+        self.requests = TokenBucket(budget.requests_per_minute, clock)
+        self.tokens = TokenBucket(budget.tokens_per_minute, clock)
+        self._backend_factory = backend_factory
+        self._backend = None
+        self._clock = clock
+        self.cooldown_until = 0.0
+        self.queued = 0
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def backend(self):
+        # Built on first use so routes that never get picked do not set up SDK clients
+        if self._backend is None:
+            self._backend = self._backend_factory()
+        return self._backend
+
+    def wait_time(self, tokens: int) -> float:
+        """요청 하나와 `tokens`개의 토큰 예산이 생기고 쉬는 시간이 끝날 때까지 남은 시간(초)입니다."""
+        return max(self.cooldown_until - self._clock(), self.requests.wait_time(1), self.tokens.wait_time(tokens))
+
+    def stats(self) -> dict[str, any]:
+        return {
+            "key": self.key,
+            "model": self.model_name,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "failures": self.failures,
+            "request_utilisation": round(self.requests.utilisation(), 3),
+            "token_utilisation": round(self.tokens.utilisation(), 3),
+            "cooldown_seconds": round(max(0.0, self.cooldown_until - self._clock()), 1),
+        }
+
+
+class ModelRouter:
+    """여러 키와 모델의 경로 중 여유가 있는 경로로 호출을 보내고, 실패하면 다른 경로로 다시 보냅니다.
+
+    경로는 남은 대기 시간, 요청한 모델인지와 `GEMINI_MODELS`에서의 순서, 대기열 길이, 예산 사용률
+    순으로 고릅니다. 즉 요청한 모델의 키가 모두 한도에 걸렸으면 기다리지 않고 다른 모델로 보내고, 모든
+    경로가 한도에 걸렸으면 가장 먼저 여유가 생기는 경로의 대기열에서 기다립니다.
+
+    Args:
+        api_keys: 사용할 API 키 목록.
+        budgets: 우선순위 순서의 모델별 예산 목록.
+        backend_factory: `(모델 이름, API 키)`로 경로 하나의 백엔드를 만드는 함수.
+        clock: 현재 시각(초)을 반환하는 함수.
+    """
+
+    def __init__(
+        self,
+        api_keys: list[str],
+        budgets: list[ModelBudget],
+        backend_factory: Callable[[str, str], any] = lambda model_name, api_key: GeminiBackend(model_name, api_key=api_key),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not api_keys:
+            raise ValueError("GEMINI_API_KEYS 또는 GEMINI_API_KEY가 .env 파일에 설정되지 않았습니다.")
+        self.api_keys = list(api_keys)
+        self.backend_factory = backend_factory
+        self.clock = clock
+        self.routes: list[Route] = []
+        self._model_order: list[str] = []
+        self._lock = threading.Lock()
+        for budget in budgets:
+            self.add_model(budget)
+
+    def add_model(self, budget: ModelBudget) -> None:
+        """모든 키에 대해 `budget` 모델의 경로를 가장 낮은 우선순위로 추가합니다. 이미 있으면 무시합니다."""
+        with self._lock:
+            if budget.name in self._model_order:
+                return
+            self._model_order.append(budget.name)
+            for index, api_key in enumerate(self.api_keys):
+                factory = lambda model_name=budget.name, api_key=api_key: self.backend_factory(model_name, api_key)
+                self.routes.append(Route(key_label(api_key, index), budget, factory, self.clock))
+
+    def _pick(self, model_name: str, tokens: int, tried: set[int]) -> tuple[Route | None, float]:
+        """보낼 경로와 대기 시간을 고릅니다. 바로 보낼 수 있으면 예산을 차감하고 대기 시간 0을 반환합니다."""
+        with self._lock:
+            candidates = [(index, route) for index, route in enumerate(self.routes) if index not in tried]
+            if not candidates:
+                return None, 0.0
+
+            def order(item: tuple[int, Route, float]) -> tuple:
+                index, route, wait = item
+                rank = 0 if route.model_name == model_name else 1 + self._model_order.index(route.model_name)
+                return (wait, rank, route.queued, route.requests.utilisation(), index)
+
+            _, route, wait = min(((index, route, route.wait_time(tokens)) for index, route in candidates), key=order)
+            if wait <= 0:
+                route.requests.consume(1)
+                route.tokens.consume(tokens)
+                route.in_flight += 1
+                route.calls += 1
+            elif wait <= MAX_QUEUE_WAIT_SECONDS:
+                route.queued += 1
+            return route, wait
+
+    def _leave_queue(self, route: Route) -> None:
+        with self._lock:
+            route.queued -= 1
+
+    def _finish(self, route: Route, reserved_tokens: int, response: object | None = None, error: Exception | None = None) -> float | None:
+        """호출을 마친 경로의 상태를 갱신하고, 다른 경로로 다시 보낼 오류이면 쉬는 시간을 반환합니다."""
+        cooldown = None
+        with self._lock:
+            route.in_flight -= 1
+            if error is not None:
+                route.failures += 1
+                cooldown = failover_cooldown(error)
+                if cooldown is not None:
+                    route.cooldown_until = max(route.cooldown_until, self.clock() + cooldown)
+        if error is not None:
+            reason = "rate_limit" if cooldown == RATE_LIMIT_COOLDOWN_SECONDS else type(error).__name__
+            TELEMETRY.incr("llm_route_errors", key=route.key, model=route.model_name, reason=reason)
+            return cooldown
+        TELEMETRY.incr("llm_route_calls", key=route.key, model=route.model_name)
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            used = (getattr(usage, "prompt_token_count", 0) or 0) + (getattr(usage, "candidates_token_count", 0) or 0)
+            if used:
+                route.tokens.consume(used - reserved_tokens)
+        return None
+
+    def _estimate_tokens(self, prompt: str, generation_config: dict[str, any] | None) -> int:
+        response_tokens = (generation_config or {}).get("max_output_tokens") or ESTIMATED_RESPONSE_TOKENS
+        return estimate_tokens(prompt) + response_tokens
+
+    def _no_route(self, model_name: str, wait: float, last_error: Exception | None) -> Exception:
+        if last_error is not None:
+            return last_error
+        return NoRouteAvailableError(f"{model_name} 호출을 보낼 수 있는 경로가 없습니다. (가장 빠른 경로도 {wait:.0f}초 뒤에 사용 가능)")
+
+    def _log_failover(self, route: Route, error: Exception, cooldown: float) -> None:
+        logger.warning(f"{route.key}/{route.model_name} 호출 실패, {cooldown:.0f}초 동안 제외하고 다른 경로로 다시 보냅니다: {error}")
+
+    def generate_content(
+        self,
+        model_name: str,
+        prompt: str,
+        generation_config: dict[str, any] | None = None,
+        stream: bool = False,
+    ):
+        """여유가 있는 경로로 호출하고, 한도 초과나 서버 오류가 나면 다른 경로로 다시 보냅니다.
+
+        스트리밍 응답은 전달을 시작한 뒤에는 다른 경로로 옮길 수 없으므로 요청 시점의 오류만 다시 보냅니다.
+
+        Raises:
+            NoRouteAvailableError: 모든 경로가 오래 쉬어야 하는 경우.
+            Exception: 다시 보낼 수 없는 오류이거나 모든 경로가 실패한 경우 마지막 오류.
+        """
+        tokens = self._estimate_tokens(prompt, generation_config)
+        tried: set[int] = set()
+        last_error = None
+        while True:
+            route, wait = self._pick(model_name, tokens, tried)
+            if route is None or wait > MAX_QUEUE_WAIT_SECONDS:
+                raise self._no_route(model_name, wait, last_error)
+            if wait > 0:
+                try:
+                    time.sleep(wait)
+                finally:
+                    self._leave_queue(route)
+                continue
+            try:
+                response = route.backend.generate_content(prompt, generation_config=generation_config, stream=stream)
+            except Exception as e:
+                cooldown = self._finish(route, tokens, error=e)
+                if cooldown is None:
+                    raise
+                self._log_failover(route, e, cooldown)
+                tried.add(self.routes.index(route))
+                last_error = e
+                continue
+            self._finish(route, tokens, None if stream else response)
+            _mark_served(response, route.model_name)
+            return response
+
+    async def generate_content_async(self, model_name: str, prompt: str, generation_config: dict[str, any] | None = None):
+        """`generate_content`의 비동기 버전으로, 대기열에서 기다리는 동안 이벤트 루프를 막지 않습니다."""
+        tokens = self._estimate_tokens(prompt, generation_config)
+        tried: set[int] = set()
+        last_error = None
+        while True:
+            route, wait = self._pick(model_name, tokens, tried)
+            if route is None or wait > MAX_QUEUE_WAIT_SECONDS:
+                raise self._no_route(model_name, wait, last_error)
+            if wait > 0:
+                try:
+                    await asyncio.sleep(wait)
+                finally:
+                    self._leave_queue(route)
+                continue
+            try:
+                response = await route.backend.generate_content_async(prompt, generation_config=generation_config)
+            except Exception as e:
+                cooldown = self._finish(route, tokens, error=e)
+                if cooldown is None:
+                    raise
+                self._log_failover(route, e, cooldown)
+                tried.add(self.routes.index(route))
+                last_error = e
+                continue
+            self._finish(route, tokens, response)
+            _mark_served(response, route.model_name)
+            return response
+
+    def stats(self) -> list[dict[str, any]]:
+        """경로(키/모델)별 대기열 길이, 진행 중인 호출 수, 예산 사용률을 반환합니다."""
+        with self._lock:
+            routes = list(self.routes)
+        return [route.stats() for route in routes]
+
+    def gauges(self) -> list[tuple[str, dict[str, any], float]]:
+        """`TELEMETRY.register_gauges`에 등록할 경로별 게이지 목록입니다."""
+        gauges = []
+        for stats in self.stats():
+            labels = {"key": stats["key"], "model": stats["model"]}
+            gauges.append(("route_queue_depth", labels, stats["queued"]))
+            gauges.append(("route_in_flight", labels, stats["in_flight"]))
+            gauges.append(("route_request_utilisation", labels, stats["request_utilisation"]))
+            gauges.append(("route_token_utilisation", labels, stats["token_utilisation"]))
+        return gauges
+
+
+def _mark_served(response: any, model_name: str) -> None:
+    """다른 모델로 다시 보냈을 수 있으므로 실제로 응답한 모델 이름을 응답에 남깁니다."""
+    try:
+        response.served_model_name = model_name
+    except AttributeError:
+        pass
+
+
+class RoutedBackend:
+    """`model_name`을 우선하여 라우터로 호출하는, 다른 백엔드와 같은 형태의 백엔드입니다.
+
+    예산 부족이나 장애로 다른 모델에 보낸 경우 응답의 `served_model_name`에 실제로 응답한 모델 이름이
+    담깁니다. 응답 캐시 키와 보관소 기록에는 요청한 `model_name` 대신 이 이름을 사용합니다.
+    """
+
+    def __init__(self, router: ModelRouter, model_name: str):
+        self.router = router
+        self.model_name = model_name
+        # A model requested only for routing (e.g. GEMINI_LONG_MODEL) still needs routes of its own
+        router.add_model(ModelBudget.for_model(model_name))
+
+    def generate_content(self, prompt: str, generation_config: dict[str, any] | None = None, stream: bool = False):
+        return self.router.generate_content(self.model_name, prompt, generation_config, stream)
+
+    async def generate_content_async(self, prompt: str, generation_config: dict[str, any] | None = None):
+        return await self.router.generate_content_async(self.model_name, prompt, generation_config)
+
+
+_router_lock = threading.Lock()
+_router: ModelRouter | None = None
+_router_settings: tuple[str, str] | None = None
+
+
+def get_model_router() -> ModelRouter | None:
+    """환경 변수 설정으로 만든 라우터를 반환합니다. 여러 키나 모델이 설정되지 않았으면 None입니다.
+
+    Raises:
+        ValueError: `GEMINI_MODELS` 형식이 올바르지 않거나 API 키가 없는 경우.
+    """
+    global _router, _router_settings
+    keys_text = os.getenv("GEMINI_API_KEYS", "")
+    models_text = os.getenv("GEMINI_MODELS", "")
+    if not keys_text.strip() and not models_text.strip():
+        return None
+    settings = (keys_text, models_text)
+    with _router_lock:
+        if _router is None or _router_settings != settings:
+            api_keys = [key.strip() for key in (keys_text or os.getenv("GEMINI_API_KEY", "")).split(",") if key.strip()]
+            _router = ModelRouter(api_keys, parse_model_budgets(models_text))
+            _router_settings = settings
+            TELEMETRY.register_gauges("model_router", _router.gauges)
+        return _router
@@ -0,0 +1,33 @@
+"""CLI와 GUI가 실행 모드를 고르기 전에 필요한 옵션 기본값과 선택지입니다.
+
+각 값은 이를 사용하는 모듈(batch, pipeline, job_server 등)에서 그대로 다시 내보냅니다. 이 모듈은
+아무것도 불러오지 않으므로, 인자를 해석할 때 생성 스택 전체를 불러오지 않아도 되고 서버에 작업만
+제출하는 씬 클라이언트도 빠르게 시작합니다.
+"""
+
+# 배치 모드
+DEFAULT_CONCURRENCY = 5
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+# 벤치마크
+DEFAULT_BENCHMARK_SIZES = (1, 100, 1000, 10000)
+
+# 로컬 문서 참고 자료
+DEFAULT_CONTEXT_TOKEN_BUDGET = 2000
+
+# "off": 확인하지 않음, "flag": 경고만 출력, "skip": 생성(또는 발행)을 건너뜀
+DUPLICATE_POLICIES = ("off", "flag", "skip")
+
+# LLM 백엔드 ("fake": API를 호출하지 않는 로컬 가짜 모델)
+BACKENDS = ("gemini", "fake")
+
+# "single": 하나의 프롬프트로 전체 게시물 생성, "fanout": 개요 생성 후 단락별 병렬 생성
+GENERATION_ENGINES = ("single", "fanout")
+
+OUTPUT_FORMATS = ("markdown", "html", "tistory", "wordpress")
+
+# GUI/CLI의 발행 플랫폼 이름 -> 요청 본문을 만드는 렌더러 출력 형식
+PUBLISH_PLATFORMS = {"Tistory": "tistory", "WordPress": "wordpress"}
+
+# 상주 서버의 동시 작업 수
+DEFAULT_WORKERS = 4
@@ -1,33 +1,315 @@
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Iterator
+
 from src.core.content_generator import (
     generate_blog_content,
+    generate_blog_content_async,
+    generate_blog_content_stream,
     generate_markdown_content,
-    save_markdown_to_file
+    generate_markdown_stream,
+    save_post_state,
+    save_post_to_file,
 )
+from src.core.corpus_index import DEFAULT_CONTEXT_TOKEN_BUDGET, get_corpus_index
+from src.core.dedup import DuplicateRequestError, duplicate_policy, index_post, report_overlap, screen_request
+from src.core.fanout import generate_blog_content_fanout
+from src.core.publisher import PUBLISH_PLATFORMS
+from src.core.renderer import TemplateRenderer, get_renderer
+from src.core.web_collector import collect_web_context, parse_source_urls, search_web_for_keyword
+from src.utils.rate_limit import AsyncRateLimiter
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+# How often the async pipeline checks its cancel_event while a generation call is in flight
+CANCEL_POLL_INTERVAL = 0.1
+
+class PipelineCancelledError(Exception):
+    """사용자 요청으로 파이프라인 실행이 취소됨"""
+    pass
+
+
+def _check_cancelled(cancel_event: threading.Event | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise PipelineCancelledError("사용자가 생성을 취소했습니다.")
+
+
+async def _run_cancellable(coro, cancel_event: threading.Event | None):
+    """`coro`를 실행하다가 `cancel_event`가 설정되면 작업을 취소하고 `PipelineCancelledError`를 발생시킵니다.
+
+    작업 자체를 취소하므로 병렬 생성 엔진의 진행 중인 단락 호출도 함께 중단됩니다.
+    """
+    if cancel_event is None:
+        return await coro
+    task = asyncio.ensure_future(coro)
+    while not task.done():
+        await asyncio.wait({task}, timeout=CANCEL_POLL_INTERVAL)
+        if cancel_event.is_set() and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            break
+    _check_cancelled(cancel_event)
+    return task.result()
+
+def build_corpus_context(user_input: dict[str, any]) -> str:
+    """`user_input['corpus_dir']`의 로컬 문서 색인에서 키워드와 관련된 청크를 토큰 예산만큼 가져옵니다."""
+    corpus_dir = user_input.get('corpus_dir')
+    if not corpus_dir:
+        return ""
+    token_budget = int(user_input.get('context_token_budget') or DEFAULT_CONTEXT_TOKEN_BUDGET)
+    return get_corpus_index(corpus_dir).build_context(user_input.get('keyword', ''), token_budget)
+
+
+def _merge_contexts(keyword: str, web_context: str | None, corpus_context: str) -> str:
+    sections = [context for context in (web_context, corpus_context) if context]
+    return "\n\n".join(sections) if sections else keyword
+
+
+def _record_events(events: Iterator[tuple[str, any]], blog_post_object: dict[str, any]) -> Iterator[tuple[str, any]]:
+    """스트림 이벤트를 그대로 전달하면서 발행에 필요한 구조화된 콘텐츠를 `blog_post_object`에 모읍니다.
+
+    마지막 `done` 이벤트의 검증된 전체 콘텐츠가 있으면 그 내용으로 `blog_post_object`를 바꿉니다.
+    """
+    for kind, value in events:
+        if kind == 'section':
+            blog_post_object['body'].append(value)
+        elif kind == 'done':
+            blog_post_object.clear()
+            blog_post_object.update(value)
+        else:
+            blog_post_object[kind] = value
+        yield kind, value
+
+
+def get_output_renderer(user_input: dict[str, any]) -> TemplateRenderer:
+    """`user_input`의 `output_format`과 사용자 템플릿 경로로 (캐시된) 렌더러를 가져옵니다."""
+    return get_renderer(
+        user_input.get('output_format') or "markdown",
+        user_input.get('document_template_path') or None,
+        user_input.get('section_template_path') or None,
+    )
+
+
+def save_output(
+    user_input: dict[str, any],
+    context: str,
+    blog_post_object: dict[str, any],
+    usage: dict[str, int] | None = None,
+) -> str:
+    """게시물을 출력 형식에 맞춰 보관소에 저장하거나 발행 대기열에 추가합니다.
+
+    파일로 저장한 경우 재생성에 필요한 구조화된 게시물도 출력 파일 옆에 함께 저장하고,
+    설정과 토큰 사용량(`usage`)을 보관소 색인에 기록합니다. 저장하기 전에 기존 게시물과의
+    내용 유사도를 보고하며, `duplicate_policy`가 "skip"이면 겹치는 게시물은 발행하지 않습니다.
+    """
+    publishing_platform = user_input.get('publishing_platform', 'Markdown File Only')
+    duplicates = report_overlap(user_input, blog_post_object)
+    if duplicates and publishing_platform in PUBLISH_PLATFORMS and duplicate_policy(user_input) == "skip":
+        result = f"발행하지 않음 (기존 게시물과 중복: {duplicates[0].format()})"
+        print(result)
+        return result
+
+    result = save_post_to_file(
+        blog_post_object, user_input.get('keyword', ''), publishing_platform, get_output_renderer(user_input)
+    )
+    if publishing_platform == "Markdown File Only":
+        save_post_state(result, user_input, context, blog_post_object, usage)
+    if publishing_platform == "Markdown File Only" or publishing_platform in PUBLISH_PLATFORMS:
+        index_post(result, user_input, blog_post_object)
+    return result
+
+
+def collect_context(user_input: dict[str, any]) -> str:
+    """`user_input['source_urls']`의 웹 자료와 `corpus_dir`의 로컬 문서에서 참고 자료를 모읍니다.
+
+    둘 다 없으면 키워드를 그대로 사용합니다.
+    """
+    keyword = user_input.get('keyword', '')
+    urls = parse_source_urls(user_input.get('source_urls'))
+    web_context = search_web_for_keyword(keyword, urls) if urls else None
+    return _merge_contexts(keyword, web_context, build_corpus_context(user_input))
+
 
-def run_blog_post_pipeline(user_input: dict[str, any], save_to_file: bool = True) -> str:
+async def collect_context_async(user_input: dict[str, any]) -> str:
+    """`collect_context`의 비동기 버전입니다."""
+    urls = parse_source_urls(user_input.get('source_urls'))
+    web_context = await collect_web_context(urls) if urls else None
+    corpus_context = await asyncio.to_thread(build_corpus_context, user_input) if user_input.get('corpus_dir') else ""
+    return _merge_contexts(user_input.get('keyword', ''), web_context, corpus_context)
+
+
+def run_blog_post_pipeline(
+    user_input: dict[str, any],
+    save_to_file: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    engine: str = "single",
+) -> str:
     """블로그 포스트 생성을 위한 전체 파이프라인을 실행하고 마크다운 콘텐츠를 반환합니다."""
     try:
-        keyword = user_input.get('keyword', '')
         publishing_platform = user_input.get('publishing_platform', 'Markdown File Only')
 
-        # 1. 키워드를 직접 컨텍스트로 사용 (웹 검색 단계 제거)
-        context_data = keyword # Use keyword directly as context
+        with TELEMETRY.span("pipeline", engine=engine):
+            # 0. (duplicate_policy) 비슷한 게시물이 이미 있으면 경고하거나 생성을 건너뜀
+            screen_request(user_input)
 
-        # 2. 구조화된 블로그 콘텐츠 생성
-        blog_post_object = generate_blog_content(user_input, context_data)
-        print("구조화된 블로그 콘텐츠가 생성되었습니다.")
+            # 1. 참고 자료 수집 (참고 URL과 로컬 문서가 없으면 키워드를 직접 컨텍스트로 사용)
+            with TELEMETRY.span("collect_context"):
+                context_data = collect_context(user_input)
 
-        # 3. 마크다운 콘텐츠 생성
-        markdown_content = generate_markdown_content(blog_post_object)
-        print("마크다운 콘텐츠가 생성되었습니다.")
+            # 2. 구조화된 블로그 콘텐츠 생성
+            with TELEMETRY.span("generate", engine=engine), TELEMETRY.track_usage() as usage:
+                if engine == "fanout":
+                    blog_post_object = asyncio.run(
+                        generate_blog_content_fanout(user_input, context_data, use_cache=use_cache, refresh_cache=refresh_cache)
+                    )
+                else:
+                    blog_post_object = generate_blog_content(user_input, context_data, use_cache, refresh_cache)
+            print("구조화된 블로그 콘텐츠가 생성되었습니다.")
+
+            # 3. 마크다운 콘텐츠 생성
+            with TELEMETRY.span("render"):
+                markdown_content = generate_markdown_content(blog_post_object)
+            print("마크다운 콘텐츠가 생성되었습니다.")
+
+            # 4. (선택) 출력 형식(output_format)에 맞춰 단락 단위로 파일 저장
+            if save_to_file:
+                with TELEMETRY.span("save"):
+                    file_path = save_output(user_input, context_data, blog_post_object, usage)
+                if publishing_platform in PUBLISH_PLATFORMS:
+                    print(f"\n🎉 성공! {file_path}")
+                else:
+                    print(f"\n🎉 성공! 파일이 다음 경로에 저장되었습니다: {file_path}")
 
-        # 4. (선택) 마크다운 파일 저장
-        if save_to_file:
-            file_path = save_markdown_to_file(markdown_content, keyword, publishing_platform)
-            print(f"\n🎉 성공! 마크다운 파일이 다음 경로에 저장되었습니다: {file_path}")
-        
         return markdown_content
 
+    except DuplicateRequestError as e:
+        print(f"생성을 건너뜁니다: {e}")
+        return f"# 생성 건너뜀\n\n{e}"
     except Exception as e:
-        print(f"오류 발생: 파이프라인 실행 중단 - {e}")
-        return f"# 오류 발생\n\n파이프라인 실행 중 다음과 같은 오류가 발생했습니다:\n\n```\n{e}\n```"
\ No newline at end of file
+        logger.exception("파이프라인 실행 중단")
+        return f"# 오류 발생\n\n파이프라인 실행 중 다음과 같은 오류가 발생했습니다:\n\n```\n{e}\n```"
+
+
+async def run_blog_post_pipeline_async(
+    user_input: dict[str, any],
+    save_to_file: bool = True,
+    rate_limiter: AsyncRateLimiter | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    engine: str = "single",
+    cancel_event: threading.Event | None = None,
+) -> str:
+    """비동기 Gemini 클라이언트로 파이프라인을 실행합니다.
+
+    동기 버전과 달리 오류를 마크다운으로 변환하지 않고 그대로 전파하여,
+    대량 생성 시 호출자가 실패 여부를 집계할 수 있도록 합니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        save_to_file: True이면 생성된 마크다운을 파일로 저장합니다.
+        rate_limiter: Gemini 요청에 적용할 호출 빈도 제한기.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+        engine: 콘텐츠 생성 방식. `GENERATION_ENGINES` 중 하나입니다.
+        cancel_event: 설정되면 진행 중인 생성 호출을 취소하고 저장하기 전에 실행을 중단합니다.
+
+    Returns:
+        생성된 마크다운 콘텐츠.
+
+    Raises:
+        PipelineCancelledError: `cancel_event`가 설정되어 실행이 중단된 경우.
+        DuplicateRequestError: 비슷한 게시물이 이미 있고 `duplicate_policy`가 "skip"인 경우.
+    """
+    with TELEMETRY.span("pipeline", engine=engine):
+        screen_request(user_input)
+        with TELEMETRY.span("collect_context"):
+            context_data = await _run_cancellable(collect_context_async(user_input), cancel_event)
+        with TELEMETRY.span("generate", engine=engine), TELEMETRY.track_usage() as usage:
+            if engine == "fanout":
+                generation = generate_blog_content_fanout(
+                    user_input, context_data, rate_limiter=rate_limiter, use_cache=use_cache, refresh_cache=refresh_cache
+                )
+            else:
+                generation = generate_blog_content_async(
+                    user_input, context_data, rate_limiter, use_cache, refresh_cache
+                )
+            blog_post_object = await _run_cancellable(generation, cancel_event)
+        with TELEMETRY.span("render"):
+            markdown_content = generate_markdown_content(blog_post_object)
+
+        if save_to_file:
+            with TELEMETRY.span("save"):
+                save_output(user_input, context_data, blog_post_object, usage)
+
+    return markdown_content
+
+
+def run_blog_post_pipeline_stream(
+    user_input: dict[str, any],
+    save_to_file: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    progress_callback: Callable[[str], None] | None = None,
+    cancel_event: threading.Event | None = None,
+) -> Iterator[str]:
+    """파이프라인을 스트리밍 모드로 실행하여 마크다운 조각을 생성되는 대로 반환합니다.
+
+    모든 조각이 생성된 뒤 구조화된 게시물을 `output_format`과 사용자 템플릿에 맞춰 저장합니다.
+    오류는 호출자에게 그대로 전파됩니다.
+
+    Args:
+        user_input: 블로그 생성 설정을 담은 사용자 입력 딕셔너리.
+        save_to_file: True이면 생성이 끝난 게시물을 출력 형식에 맞춰 저장합니다.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+        progress_callback: 단계가 바뀔 때마다 단계 설명과 함께 호출됩니다.
+        cancel_event: 설정되면 다음 조각을 받기 전에 실행을 중단합니다.
+
+    Yields:
+        제목/메타 설명, 각 단락, 태그 순서의 마크다운 조각.
+
+    Raises:
+        PipelineCancelledError: `cancel_event`가 설정되어 실행이 중단된 경우.
+        DuplicateRequestError: 비슷한 게시물이 이미 있고 `duplicate_policy`가 "skip"인 경우.
+    """
+    def report(stage: str) -> None:
+        _check_cancelled(cancel_event)
+        if progress_callback is not None:
+            progress_callback(stage)
+
+    publishing_platform = user_input.get('publishing_platform', 'Markdown File Only')
+
+    screen_request(user_input)
+    report("웹 자료 수집 중")
+    with TELEMETRY.span("collect_context"):
+        context_data = collect_context(user_input)
+    report("콘텐츠 생성 중")
+    events = generate_blog_content_stream(user_input, context_data, use_cache, refresh_cache)
+    blog_post_object = {'body': []}
+    markdown_chunks = []
+    try:
+        with TELEMETRY.track_usage() as usage:
+            for chunk in generate_markdown_stream(_record_events(events, blog_post_object)):
+                markdown_chunks.append(chunk)
+                report(f"콘텐츠 생성 중 ({len(markdown_chunks)}개 조각 수신)")
+                yield chunk
+    finally:
+        # Closing the generator also closes the underlying Gemini stream
+        events.close()
+
+    if save_to_file:
+        report("파일 저장 중")
+        with TELEMETRY.span("save"):
+            file_path = save_output(user_input, context_data, blog_post_object, usage)
+        if publishing_platform in PUBLISH_PLATFORMS:
+            print(f"\n🎉 성공! {file_path}")
+        else:
+            print(f"\n🎉 성공! 파일이 다음 경로에 저장되었습니다: {file_path}")
+    if progress_callback is not None:
+        progress_callback("완료")
@@ -0,0 +1,346 @@
+"""발행 대기열의 게시물을 Tistory/WordPress API로 업로드합니다.
+
+생성 파이프라인은 렌더링된 요청 본문을 `PublishQueue`에 넣기만 하고, 업로드는
+`run_publisher`가 별도로 처리합니다. 플랫폼마다 연결을 재사용하는 HTTP 세션 하나와
+동시 업로드 수 제한을 두며, 429/5xx 응답은 지수 백오프로 재시도합니다.
+멱등성 키로 재시도 시 같은 게시물이 두 번 올라가지 않도록 합니다.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.core.options import PUBLISH_PLATFORMS
+from src.core.renderer import get_renderer
+from src.utils.job_queue import PublishJob, PublishQueue, get_publish_queue
+from src.utils.telemetry import TELEMETRY
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PLATFORM_CONCURRENCY = {"tistory": 2, "wordpress": 4}
+DEFAULT_MAX_ATTEMPTS = 6
+DEFAULT_BACKOFF_BASE = 2.0
+DEFAULT_BACKOFF_MAX = 300.0
+DEFAULT_REQUEST_TIMEOUT = 30.0
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_TISTORY_API_URL = "https://www.tistory.com"
+
+
+class PublishError(Exception):
+    """게시물 발행 관련 오류
+
+    Attributes:
+        retryable: 나중에 다시 시도하면 성공할 수 있는 오류인지 여부. (429, 5xx, 네트워크 오류)
+        retry_after: 서버가 `Retry-After`로 알려준 대기 시간(초).
+    """
+
+    def __init__(self, message: str, retryable: bool = False, retry_after: float | None = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def enqueue_post(blog_post_object: dict[str, any], publishing_platform: str, queue: PublishQueue | None = None) -> int:
+    """게시물을 플랫폼 API 요청 본문으로 렌더링하여 발행 대기열에 추가하고 작업 ID를 반환합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 발행 플랫폼인 경우.
+    """
+    if publishing_platform not in PUBLISH_PLATFORMS:
+        raise ValueError(f"지원하지 않는 발행 플랫폼입니다: {publishing_platform}")
+    platform = PUBLISH_PLATFORMS[publishing_platform]
+    payload = json.loads(get_renderer(platform).render(blog_post_object))
+    job_id = (queue or get_publish_queue()).enqueue(platform, payload)
+    TELEMETRY.incr("publish_enqueued", platform=platform)
+    return job_id
+
+
+def _retry_after(response: "aiohttp.ClientResponse") -> float | None:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        # HTTP-date values are rare for these APIs; fall back to our own backoff
+        return None
+
+
+async def _read_json(response: "aiohttp.ClientResponse", action: str) -> any:
+    """응답 상태를 확인하고 JSON 본문을 반환합니다. 429/5xx는 재시도 가능한 `PublishError`가 됩니다."""
+    if response.status == 429 or response.status >= 500:
+        raise PublishError(
+            f"{action} 실패 (HTTP {response.status})", retryable=True, retry_after=_retry_after(response)
+        )
+    if response.status >= 400:
+        detail = (await response.text())[:200]
+        raise PublishError(f"{action} 실패 (HTTP {response.status}): {detail}")
+    return await response.json(content_type=None)
+
+
+class WordPressClient:
+    """WordPress REST API(`/wp-json/wp/v2`)로 게시물을 올립니다. 애플리케이션 비밀번호로 인증합니다.
+
+    멱등성 키로 만든 고정 slug를 함께 보내고, 재시도할 때는 같은 slug의 게시물이 이미
+    있는지 먼저 확인하여 응답을 받지 못한 요청이 실제로는 처리된 경우에도 중복 발행하지 않습니다.
+    """
+
+    platform = "wordpress"
+
+    def __init__(self, base_url: str, username: str, app_password: str):
+        self.api_url = base_url.rstrip("/") + "/wp-json/wp/v2"
+        credentials = base64.b64encode(f"{username}:{app_password}".encode()).decode("ascii")
+        self.headers = {"Authorization": f"Basic {credentials}"}
+        self._tag_ids: dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "WordPressClient":
+        base_url, username, app_password = (
+            os.getenv("WORDPRESS_URL"), os.getenv("WORDPRESS_USERNAME"), os.getenv("WORDPRESS_APP_PASSWORD")
+        )
+        if not (base_url and username and app_password):
+            raise ValueError("WORDPRESS_URL, WORDPRESS_USERNAME, WORDPRESS_APP_PASSWORD가 .env 파일에 설정되지 않았습니다.")
+        return cls(base_url, username, app_password)
+
+    @staticmethod
+    def slug(idempotency_key: str) -> str:
+        return f"blog-genie-{idempotency_key[:16]}"
+
+    async def find_existing(self, session: "aiohttp.ClientSession", payload: dict[str, any], idempotency_key: str) -> str | None:
+        params = {"slug": self.slug(idempotency_key), "status": "publish,future,draft,pending,private", "context": "edit"}
+        async with session.get(f"{self.api_url}/posts", params=params, headers=self.headers) as response:
+            posts = await _read_json(response, "WordPress 게시물 조회")
+        return posts[0].get("link") if posts else None
+
+    async def _tag_id(self, session: "aiohttp.ClientSession", name: str) -> int:
+        if name in self._tag_ids:
+            return self._tag_ids[name]
+        async with session.get(f"{self.api_url}/tags", params={"search": name}, headers=self.headers) as response:
+            found = [tag["id"] for tag in await _read_json(response, "WordPress 태그 조회") if tag.get("name") == name]
+        if found:
+            tag_id = found[0]
+        else:
+            async with session.post(f"{self.api_url}/tags", json={"name": name}, headers=self.headers) as response:
+                body = await response.json(content_type=None) if response.status == 400 else None
+                if body and body.get("code") == "term_exists":
+                    # Another upload created the tag between our search and create
+                    tag_id = body["data"]["term_id"]
+                else:
+                    tag_id = (await _read_json(response, "WordPress 태그 생성"))["id"]
+        self._tag_ids[name] = tag_id
+        return tag_id
+
+    async def create(self, session: "aiohttp.ClientSession", payload: dict[str, any], idempotency_key: str) -> str:
+        body = dict(payload, slug=self.slug(idempotency_key))
+        body["tags"] = [await self._tag_id(session, name) for name in payload.get("tags", [])]
+        headers = {**self.headers, "Idempotency-Key": idempotency_key}
+        async with session.post(f"{self.api_url}/posts", json=body, headers=headers) as response:
+            post = await _read_json(response, "WordPress 게시물 발행")
+        return post.get("link", "")
+
+
+class TistoryClient:
+    """Tistory Open API(`/apis/post/write`)로 게시물을 올립니다.
+
+    Tistory API는 멱등성 키를 지원하지 않으므로, 재시도할 때는 최근 게시물 목록에서
+    같은 제목을 찾아 이미 발행된 게시물을 다시 올리지 않습니다.
+    """
+
+    platform = "tistory"
+
+    def __init__(self, access_token: str, blog_name: str, api_url: str = DEFAULT_TISTORY_API_URL):
+        self.api_url = api_url.rstrip("/") + "/apis"
+        self.access_token = access_token
+        self.blog_name = blog_name
+
+    @classmethod
+    def from_env(cls) -> "TistoryClient":
+        access_token, blog_name = os.getenv("TISTORY_ACCESS_TOKEN"), os.getenv("TISTORY_BLOG_NAME")
+        if not (access_token and blog_name):
+            raise ValueError("TISTORY_ACCESS_TOKEN, TISTORY_BLOG_NAME이 .env 파일에 설정되지 않았습니다.")
+        return cls(access_token, blog_name, os.getenv("TISTORY_API_URL", DEFAULT_TISTORY_API_URL))
+
+    def _params(self, **params: any) -> dict[str, any]:
+        return {"access_token": self.access_token, "blogName": self.blog_name, "output": "json", **params}
+
+    async def find_existing(self, session: "aiohttp.ClientSession", payload: dict[str, any], idempotency_key: str) -> str | None:
+        async with session.get(f"{self.api_url}/post/list", params=self._params(page=1)) as response:
+            body = await _read_json(response, "Tistory 게시물 조회")
+        posts = body.get("tistory", {}).get("item", {}).get("posts") or []
+        return next((post.get("postUrl") for post in posts if post.get("title") == payload.get("title")), None)
+
+    async def create(self, session: "aiohttp.ClientSession", payload: dict[str, any], idempotency_key: str) -> str:
+        headers = {"Idempotency-Key": idempotency_key}
+        async with session.post(f"{self.api_url}/post/write", data=self._params(**payload), headers=headers) as response:
+            body = await _read_json(response, "Tistory 게시물 발행")
+        return body.get("tistory", {}).get("url", "")
+
+
+def create_publish_client(platform: str) -> WordPressClient | TistoryClient:
+    """환경 변수 설정으로 플랫폼의 발행 클라이언트를 만듭니다."""
+    if platform == "wordpress":
+        return WordPressClient.from_env()
+    if platform == "tistory":
+        return TistoryClient.from_env()
+    raise ValueError(f"지원하지 않는 발행 플랫폼입니다: {platform}")
+
+
+def backoff_delay(attempts: int, base: float = DEFAULT_BACKOFF_BASE, maximum: float = DEFAULT_BACKOFF_MAX) -> float:
+    """`attempts`번째 실패 뒤 기다릴 시간(초)입니다. 지수적으로 늘어나며 0.5~1배의 무작위 폭을 둡니다."""
+    return min(maximum, base * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+
+
+@dataclass
+class PublishSummary:
+    """`run_publisher` 실행 결과 요약입니다."""
+
+    published: int = 0
+    retried: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    failures: list[tuple[int, str]] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [
+            "=== 발행 요약 ===",
+            f"발행: {self.published}건 / 재시도 예약: {self.retried}회 / 실패: {self.failed}건",
+            f"소요 시간: {self.elapsed_seconds:.1f}초",
+        ]
+        for job_id, error in self.failures:
+            lines.append(f"  - 실패 [작업 #{job_id}]: {error}")
+        return "\n".join(lines)
+
+
+async def run_publisher(
+    queue: PublishQueue | None = None,
+    clients: dict[str, any] | None = None,
+    concurrency: dict[str, int] | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    backoff_base: float = DEFAULT_BACKOFF_BASE,
+    backoff_max: float = DEFAULT_BACKOFF_MAX,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+) -> PublishSummary:
+    """대기열이 빌 때까지 작업을 가져와 플랫폼별로 동시에 업로드합니다.
+
+    플랫폼마다 남은 동시 업로드 자리만큼만 작업을 한 번에 가져오므로, 가져온 작업이
+    임대 시간 동안 대기만 하다 만료되지 않습니다. 재시도가 예약된 작업이 남아 있으면
+    예정 시각까지 기다렸다가 다시 처리합니다.
+
+    Args:
+        queue: 발행 대기열. None이면 `get_publish_queue()`를 사용합니다.
+        clients: 플랫폼 이름별 발행 클라이언트. 없는 플랫폼은 환경 변수로 만듭니다.
+        concurrency: 플랫폼별 최대 동시 업로드 수. `DEFAULT_PLATFORM_CONCURRENCY`를 덮어씁니다.
+        max_attempts: 작업 하나의 최대 시도 횟수. 초과하면 실패로 기록합니다.
+        backoff_base: 첫 재시도 전 기본 대기 시간(초).
+        backoff_max: 재시도 대기 시간의 상한(초).
+        poll_interval: 재시도 예정 작업을 기다릴 때 대기열을 다시 확인하는 최대 간격(초).
+        request_timeout: HTTP 요청 하나의 제한 시간(초).
+
+    Returns:
+        발행 결과를 담은 `PublishSummary`.
+    """
+    import aiohttp
+
+    queue = queue or get_publish_queue()
+    clients = dict(clients or {})
+    limits = {**DEFAULT_PLATFORM_CONCURRENCY, **(concurrency or {})}
+    sessions: dict[str, aiohttp.ClientSession] = {}
+    in_flight = {platform: 0 for platform in limits}
+    tasks: set[asyncio.Task] = set()
+    summary = PublishSummary()
+
+    def session_for(platform: str) -> "aiohttp.ClientSession":
+        # One pooled session per platform; the connector limit matches the upload concurrency
+        if platform not in sessions:
+            sessions[platform] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=limits[platform]),
+                timeout=aiohttp.ClientTimeout(total=request_timeout),
+            )
+        return sessions[platform]
+
+    async def publish(job: PublishJob) -> None:
+        try:
+            with TELEMETRY.span("publish", platform=job.platform):
+                if job.platform not in clients:
+                    clients[job.platform] = create_publish_client(job.platform)
+                client, session = clients[job.platform], session_for(job.platform)
+                url = None
+                if job.attempts > 1:
+                    # A previous attempt may have succeeded without us seeing the response
+                    url = await client.find_existing(session, job.payload, job.idempotency_key)
+                if url is None:
+                    url = await client.create(session, job.payload, job.idempotency_key)
+        except (TimeoutError, aiohttp.ClientError) as e:
+            error = PublishError(f"네트워크 오류: {e!r}", retryable=True)
+        except PublishError as e:
+            error = e
+        except Exception as e:
+            error = PublishError(str(e))
+        else:
+            queue.complete(job.id, url)
+            summary.published += 1
+            TELEMETRY.incr("publish_jobs", platform=job.platform, status="done")
+            print(f"[발행] 완료 (작업 #{job.id}, {job.platform}): {url}")
+            return
+        finally:
+            in_flight[job.platform] -= 1
+
+        if error.retryable and job.attempts < max_attempts:
+            delay = max(error.retry_after or 0.0, backoff_delay(job.attempts, backoff_base, backoff_max))
+            queue.retry_later(job.id, str(error), delay)
+            summary.retried += 1
+            TELEMETRY.incr("publish_jobs", platform=job.platform, status="retry")
+            logger.warning(f"발행 재시도 예약 (작업 #{job.id}, {job.attempts}/{max_attempts}회, {delay:.1f}초 후): {error}")
+        else:
+            queue.fail(job.id, str(error))
+            summary.failed += 1
+            summary.failures.append((job.id, str(error)))
+            TELEMETRY.incr("publish_jobs", platform=job.platform, status="failed")
+            logger.warning(f"발행 실패 (작업 #{job.id}): {error}")
+
+    start = time.perf_counter()
+    try:
+        while True:
+            claimed = 0
+            for platform, limit in limits.items():
+                free = limit - in_flight[platform]
+                if free <= 0:
+                    continue
+                for job in queue.claim(free, platform):
+                    in_flight[platform] += 1
+                    claimed += 1
+                    task = asyncio.create_task(publish(job))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if claimed:
+                continue
+            if tasks:
+                await asyncio.wait(tasks, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            due_in = queue.next_due_in(limits)
+            if due_in is None:
+                break
+            await asyncio.sleep(min(due_in, poll_interval))
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for session in sessions.values():
+            await session.close()
+    summary.elapsed_seconds = time.perf_counter() - start
+    return summary
+
+
+def run_publish_queue(**options: any) -> PublishSummary:
+    """발행 대기열을 모두 처리하고 요약을 출력합니다. `options`는 `run_publisher`에 전달됩니다."""
+    queue = options.pop("queue", None) or get_publish_queue()
+    print(f"발행을 시작합니다: 대기 중인 작업 {queue.stats()['pending']}건")
+    summary = asyncio.run(run_publisher(queue, **options))
+    print(summary.format())
+    return summary
@@ -0,0 +1,340 @@
+"""저장된 구조화 게시물과 새 설정을 비교하여 바뀌어야 하는 부분만 다시 생성합니다."""
+
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass, field
+
+from src.core.content_generator import (
+    MAX_RETRIES,
+    MIN_BODY_LENGTH,
+    ContentGenerationError,
+    extract_json_object,
+    generate_blog_content_async,
+    load_post_state,
+    save_post_state,
+    select_model_name,
+    validate_blog_content,
+)
+from src.core.dedup import index_post
+from src.core.fanout import (
+    DEFAULT_MAX_PARALLEL_SECTIONS,
+    MIN_SECTION_LENGTH,
+    _generate_section,
+    _TextGenerator,
+    build_section_prompt,
+    generate_blog_content_fanout,
+)
+from src.core.pipeline import collect_context_async, get_output_renderer
+from src.utils.archive import get_post_archive, with_extension
+from src.utils.rate_limit import AsyncRateLimiter
+from src.utils.telemetry import TELEMETRY
+
+logger = logging.getLogger(__name__)
+
+# 게시물 구조나 참고 자료가 바뀌므로 전체를 다시 생성해야 하는 설정
+FULL_REGENERATION_FIELDS = ("keyword", "num_subheadings", "source_urls", "corpus_dir", "context_token_budget")
+# 단락 프롬프트에 들어가는 설정
+SECTION_FIELDS = ("target_audience", "tone_of_voice", "desired_length", "custom_instructions")
+# 제목/메타 설명에 영향을 주는 설정
+HEADER_FIELDS = ("target_audience", "tone_of_voice", "seo_optimization_level", "custom_instructions")
+# 태그에 영향을 주는 설정
+TAG_FIELDS = ("seo_optimization_level",)
+
+
+@dataclass
+class RegenerationPlan:
+    """다시 생성할 부분의 목록입니다.
+
+    Attributes:
+        full: 게시물 전체를 다시 생성해야 하는지 여부.
+        header: 제목과 메타 설명을 다시 생성할지 여부.
+        tags: 태그를 다시 생성할지 여부.
+        sections: 다시 생성할 단락 인덱스(0부터)와 수정 요청(없으면 None).
+        reasons: 각 부분을 다시 생성하는 이유.
+    """
+
+    full: bool = False
+    header: bool = False
+    tags: bool = False
+    sections: dict[int, str | None] = field(default_factory=dict)
+    reasons: list[str] = field(default_factory=list)
+
+    @property
+    def model_calls(self) -> int:
+        """예상 모델 호출 수입니다. (전체 재생성은 1회로 셉니다)"""
+        if self.full:
+            return 1
+        return len(self.sections) + (1 if self.header or self.tags else 0)
+
+    def format(self) -> str:
+        if self.full:
+            parts = ["전체"]
+        else:
+            parts = [f"단락 {', '.join(str(i + 1) for i in sorted(self.sections))}"] if self.sections else []
+            if self.header:
+                parts.append("제목/메타 설명")
+            if self.tags:
+                parts.append("태그")
+        target = ", ".join(parts) if parts else "없음 (다시 렌더링만 함)"
+        reasons = f" - {'; '.join(self.reasons)}" if self.reasons else ""
+        return f"재생성 계획: {target} (모델 호출 {self.model_calls}회){reasons}"
+
+
+def _changed(old: dict[str, any], new: dict[str, any], fields: tuple[str, ...]) -> list[str]:
+    return [name for name in fields if old.get(name) != new.get(name)]
+
+
+def plan_regeneration(
+    stored_input: dict[str, any],
+    new_input: dict[str, any],
+    num_sections: int,
+    section_edits: dict[int, str] | None = None,
+    regenerate_header: bool = False,
+    regenerate_tags: bool = False,
+) -> RegenerationPlan:
+    """저장된 설정과 새 설정, 수정 요청을 비교하여 다시 생성할 부분을 정합니다.
+
+    Args:
+        stored_input: 저장된 게시물을 만든 `user_input`.
+        new_input: 새 `user_input`.
+        num_sections: 저장된 게시물의 단락 수.
+        section_edits: 단락 인덱스(0부터)별 수정 요청.
+        regenerate_header: True이면 제목과 메타 설명을 다시 생성합니다.
+        regenerate_tags: True이면 태그를 다시 생성합니다.
+
+    Raises:
+        ValueError: 수정 요청의 단락 인덱스가 범위를 벗어난 경우.
+    """
+    plan = RegenerationPlan()
+    full_changes = _changed(stored_input, new_input, FULL_REGENERATION_FIELDS)
+    if full_changes:
+        plan.full = True
+        plan.reasons.append(f"{', '.join(full_changes)} 변경")
+        return plan
+
+    section_changes = _changed(stored_input, new_input, SECTION_FIELDS)
+    if section_changes:
+        plan.sections = {index: None for index in range(num_sections)}
+        plan.reasons.append(f"{', '.join(section_changes)} 변경으로 모든 단락")
+    for index, instruction in (section_edits or {}).items():
+        if not 0 <= index < num_sections:
+            raise ValueError(f"단락 번호가 범위를 벗어났습니다: {index + 1} (전체 {num_sections}개)")
+        plan.sections[index] = instruction
+    if section_edits:
+        plan.reasons.append(f"단락 {', '.join(str(i + 1) for i in sorted(section_edits))} 수정 요청")
+
+    header_changes = _changed(stored_input, new_input, HEADER_FIELDS)
+    plan.header = regenerate_header or bool(header_changes)
+    if header_changes:
+        plan.reasons.append(f"{', '.join(header_changes)} 변경으로 제목/메타 설명")
+    tag_changes = _changed(stored_input, new_input, TAG_FIELDS)
+    plan.tags = regenerate_tags or bool(tag_changes)
+    if tag_changes:
+        plan.reasons.append(f"{', '.join(tag_changes)} 변경으로 태그")
+    return plan
+
+
+def outline_from_post(blog_post_object: dict[str, any]) -> dict[str, any]:
+    """저장된 게시물을 `build_section_prompt`가 받는 개요 형태로 바꿉니다."""
+    return {
+        "title": blog_post_object.get('title', ''),
+        "sections": [
+            {
+                "subtitle": section.get('subtitle', ''),
+                "summary": section.get('summary') or section.get('subtitle', ''),
+                "image_keyword": section.get('image_keyword'),
+            }
+            for section in blog_post_object.get('body', [])
+        ],
+    }
+
+
+def build_metadata_prompt(user_input: dict[str, any], blog_post_object: dict[str, any], fields: list[str]) -> str:
+    """본문은 그대로 두고 제목, 메타 설명, 태그 중 `fields`만 요청하는 짧은 프롬프트를 만듭니다."""
+    outline_text = "\n".join(
+        f"{i + 1}. {section.get('subtitle', '')}" for i, section in enumerate(blog_post_object.get('body', []))
+    )
+    rules = {
+        "title": "키워드를 포함한 매력적인 제목 (Plain Text)",
+        "meta_description": "키워드를 포함한 150자 내외의 요약",
+        "tags": "쉼표로 구분된 5개 이상의 관련 태그 문자열",
+    }
+    rule_text = "\n".join(f"-   **{name}:** {rules[name]}" for name in fields)
+    example = ", ".join(f'"{name}": "..."' for name in fields)
+
+    return f"""
+당신은 SEO에 능숙한 전문 기술 블로거입니다.
+이미 작성된 블로그 게시물의 {', '.join(fields)}만 새로 작성해주세요. 본문은 작성하지 마세요.
+
+**대상 독자:** {user_input.get('target_audience', '전문가')}
+**어조:** {user_input.get('tone_of_voice', '전문적')}
+**SEO 최적화 수준:** {user_input.get('seo_optimization_level', '강화')}
+**추가 지시사항:** {user_input.get('custom_instructions', '') or "없음"}
+
+**기존 제목:** {blog_post_object.get('title', '')}
+**단락 구성:**
+{outline_text}
+
+**생성 규칙:**
+{rule_text}
+
+**키워드:** {user_input.get('keyword', '')}
+
+**출력 형식 (JSON):** {{{example}}}
+"""
+
+
+async def _generate_metadata(generator: _TextGenerator, prompt: str, fields: list[str]) -> dict[str, any]:
+    generation_config = {
+        "response_mime_type": "application/json",
+        "response_schema": {
+            "type": "object",
+            "properties": {name: {"type": "string"} for name in fields},
+            "required": fields,
+        },
+    }
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response_text = await generator.generate(prompt, generation_config, "metadata")
+            metadata = extract_json_object(response_text)
+            missing = [name for name in fields if not metadata.get(name)]
+            if missing:
+                raise ContentGenerationError(f"필수 항목이 누락되었습니다: {', '.join(missing)}")
+            generator.store(prompt, generation_config, response_text)
+            return {name: metadata[name] for name in fields}
+        except Exception as e:
+            logger.warning(f"제목/메타 설명/태그 생성 중 오류 발생 (시도 {attempt + 1}/{MAX_RETRIES + 1}): {e}")
+            if attempt >= MAX_RETRIES:
+                raise ContentGenerationError(f"제목/메타 설명/태그 생성 중 최종 오류 발생: {e}")
+            TELEMETRY.incr("llm_retries", stage="metadata")
+
+
+async def regenerate_blog_content(
+    state: dict[str, any],
+    user_input: dict[str, any],
+    plan: RegenerationPlan,
+    engine: str = "single",
+    max_parallel: int = DEFAULT_MAX_PARALLEL_SECTIONS,
+    rate_limiter: AsyncRateLimiter | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> tuple[dict[str, any], str]:
+    """`plan`에 있는 부분만 모델로 다시 생성하고 나머지는 저장된 게시물을 그대로 사용합니다.
+
+    Args:
+        state: `load_post_state`로 읽은 저장된 게시물.
+        user_input: 새 `user_input`.
+        plan: `plan_regeneration`이 만든 재생성 계획.
+        engine: 전체 재생성이 필요할 때 사용할 생성 방식.
+        max_parallel: 동시에 생성할 최대 단락 수.
+        rate_limiter: 지정된 경우 각 API 요청 전에 호출 예산을 확보합니다.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+
+    Returns:
+        (새 게시물, 사용한 참고 자료).
+    """
+    if plan.full:
+        context = await collect_context_async(user_input)
+        if engine == "fanout":
+            post = await generate_blog_content_fanout(
+                user_input, context, max_parallel, rate_limiter, use_cache, refresh_cache
+            )
+        else:
+            post = await generate_blog_content_async(user_input, context, rate_limiter, use_cache, refresh_cache)
+        return post, context
+
+    post = copy.deepcopy(state['post'])
+    context = state.get('context') or user_input.get('keyword', '')
+    generator = _TextGenerator(rate_limiter, use_cache, refresh_cache, select_model_name(user_input))
+    sections = post.get('body', [])
+    outline = outline_from_post(post)
+    min_length = max(MIN_SECTION_LENGTH, MIN_BODY_LENGTH // max(1, len(sections)))
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+    indexes = sorted(plan.sections)
+    tasks = [
+        _generate_section(
+            generator,
+            semaphore,
+            build_section_prompt(
+                user_input,
+                context,
+                outline,
+                index,
+                plan.sections[index],
+                sections[index].get('content') if plan.sections[index] else None,
+            ),
+            index,
+            min_length,
+        )
+        for index in indexes
+    ]
+    fields = (["title", "meta_description"] if plan.header else []) + (["tags"] if plan.tags else [])
+    if fields:
+        tasks.append(_generate_metadata(generator, build_metadata_prompt(user_input, post, fields), fields))
+
+    results = await asyncio.gather(*tasks)
+    for index, content in zip(indexes, results):
+        sections[index]['content'] = content
+    if fields:
+        post.update(results[-1])
+    return validate_blog_content(post), context
+
+
+def regenerate_post(
+    path: str,
+    overrides: dict[str, any] | None = None,
+    section_edits: dict[int, str] | None = None,
+    regenerate_header: bool = False,
+    regenerate_tags: bool = False,
+    engine: str = "single",
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> str:
+    """저장된 게시물에서 바뀌어야 하는 부분만 다시 생성하고 출력 파일과 저장 파일, 보관소 색인을 갱신합니다.
+
+    Args:
+        path: 출력 파일 또는 `.post.json` 파일 경로.
+        overrides: 저장된 `user_input`에 덮어쓸 설정.
+        section_edits: 단락 인덱스(0부터)별 수정 요청.
+        regenerate_header: True이면 제목과 메타 설명을 다시 생성합니다.
+        regenerate_tags: True이면 태그를 다시 생성합니다.
+        engine: 전체 재생성이 필요할 때 사용할 생성 방식.
+        use_cache: False이면 응답 캐시를 사용하지 않습니다.
+        refresh_cache: True이면 캐시를 무시하고 새로 생성한 결과로 갱신합니다.
+
+    Returns:
+        갱신된 출력 파일의 절대 경로.
+    """
+    state = load_post_state(path)
+    user_input = {**state['user_input'], **(overrides or {})}
+    plan = plan_regeneration(
+        state['user_input'],
+        user_input,
+        len(state['post'].get('body', [])),
+        section_edits,
+        regenerate_header,
+        regenerate_tags,
+    )
+    print(plan.format())
+
+    with TELEMETRY.span("regenerate", calls=plan.model_calls), TELEMETRY.track_usage() as usage:
+        post, context = asyncio.run(
+            regenerate_blog_content(state, user_input, plan, engine, use_cache=use_cache, refresh_cache=refresh_cache)
+        )
+
+    renderer = get_output_renderer(user_input)
+    with TELEMETRY.span("render"):
+        output_path = get_post_archive().save(
+            user_input.get('keyword', ''),
+            renderer.extension,
+            lambda f: renderer.render_to(post, f),
+            path=with_extension(state['output_path'], renderer.extension),
+            output_format=renderer.output_format,
+        )
+    save_post_state(output_path, user_input, context, post, usage)
+    index_post(output_path, user_input, post)
+    print(f"{renderer.output_format} 파일을 갱신했습니다: {output_path}")
+    return output_path
@@ -0,0 +1,310 @@
+"""구조화된 블로그 콘텐츠를 미리 컴파일한 템플릿으로 Markdown, HTML, 발행 API 페이로드로 변환합니다.
+
+템플릿은 `str.format`과 같은 `{필드}` 문법을 사용하며(`{{`, `}}`는 중괄호 문자),
+문서 템플릿의 `{sections}` 위치에 단락 템플릿이 단락마다 반복됩니다. 렌더링 결과는
+전체 문서 문자열을 만들지 않고 조각 단위로 파일 핸들이나 스트림에 바로 기록됩니다.
+
+- 문서 필드: title, meta_description, sections, tags
+- 단락 필드: index(1부터 시작), subtitle, content, image_keyword, image_comment
+"""
+
+import html
+import json
+import re
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from string import Formatter
+from typing import TextIO
+
+from src.core.options import OUTPUT_FORMATS
+
+FILE_EXTENSIONS = {"markdown": ".md", "html": ".html", "tistory": ".tistory.json", "wordpress": ".wordpress.json"}
+
+DOCUMENT_FIELDS = {"title", "meta_description", "sections", "tags"}
+SECTION_FIELDS = {"index", "subtitle", "content", "image_keyword", "image_comment"}
+
+MARKDOWN_DOCUMENT_TEMPLATE = "# {title}\n\n> **Meta Description:** {meta_description}\n\n---\n\n{sections}\n\n**Tags:** {tags}"
+MARKDOWN_SECTION_TEMPLATE = "## {subtitle}\n\n{content}\n\n{image_comment}---\n\n"
+HTML_DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta name="description" content="{meta_description}">
+</head>
+<body>
+<article>
+<h1>{title}</h1>
+{sections}<p class="tags">{tags}</p>
+</article>
+</body>
+</html>
+"""
+HTML_SECTION_TEMPLATE = "<section>\n<h2>{subtitle}</h2>\n{content}\n{image_comment}</section>\n"
+# Tistory Open API /apis/post/write parameters; access_token and blogName are added by the publisher
+TISTORY_DOCUMENT_TEMPLATE = '{{"title": {title}, "content": "{sections}", "tag": {tags}, "visibility": "0"}}\n'
+# WordPress REST API /wp/v2/posts body; tag names are resolved to term IDs by the publisher
+WORDPRESS_DOCUMENT_TEMPLATE = (
+    '{{"title": {title}, "content": "{sections}", "excerpt": {meta_description}, "status": "draft", "tags": {tags}}}\n'
+)
+
+# Compiled once; used by markdown_to_html for every section of every post
+_LIST_ITEM_PATTERN = re.compile(r"^\s*[*\-+]\s+(.*)$")
+_ORDERED_ITEM_PATTERN = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)$")
+_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+
+
+def _link_html(match: re.Match) -> str:
+    # The text is already escaped without quotes, so only quotes are left to escape inside the attribute
+    href = match.group(2).replace('"', "&quot;").replace("'", "&#x27;")
+    return f'<a href="{href}">{match.group(1)}</a>'
+
+
+def _inline_html(text: str) -> str:
+    text = html.escape(text, quote=False)
+    text = _CODE_PATTERN.sub(r"<code>\1</code>", text)
+    text = _BOLD_PATTERN.sub(r"<strong>\1</strong>", text)
+    return _LINK_PATTERN.sub(_link_html, text)
+
+
+def markdown_to_html(text: str) -> str:
+    """단락 본문에 쓰이는 Markdown(문단, 목록, 제목, 코드 블록, 굵게, 코드, 링크)을 HTML로 변환합니다."""
+    parts = []
+    paragraph: list[str] = []
+    list_tag = None
+    code_lines: list[str] | None = None
+
+    def close_blocks() -> None:
+        nonlocal list_tag
+        if paragraph:
+            parts.append("<p>" + "<br>\n".join(_inline_html(line) for line in paragraph) + "</p>")
+            paragraph.clear()
+        if list_tag:
+            parts.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in text.splitlines():
+        if code_lines is not None:
+            if line.strip().startswith("```"):
+                parts.append("<pre><code>" + html.escape("\n".join(code_lines), quote=False) + "</code></pre>")
+                code_lines = None
+            else:
+                code_lines.append(line)
+            continue
+        if line.strip().startswith("```"):
+            close_blocks()
+            code_lines = []
+            continue
+        if not line.strip():
+            close_blocks()
+            continue
+
+        heading = _HEADING_PATTERN.match(line)
+        item = _LIST_ITEM_PATTERN.match(line)
+        ordered_item = None if item else _ORDERED_ITEM_PATTERN.match(line)
+        if heading:
+            close_blocks()
+            level = min(6, len(heading.group(1)) + 2)
+            parts.append(f"<h{level}>{_inline_html(heading.group(2))}</h{level}>")
+        elif item or ordered_item:
+            tag = "ul" if item else "ol"
+            if paragraph or list_tag != tag:
+                close_blocks()
+                parts.append(f"<{tag}>")
+                list_tag = tag
+            parts.append(f"<li>{_inline_html((item or ordered_item).group(1))}</li>")
+        else:
+            if list_tag:
+                close_blocks()
+            paragraph.append(line.strip())
+
+    if code_lines is not None:
+        parts.append("<pre><code>" + html.escape("\n".join(code_lines), quote=False) + "</code></pre>")
+    close_blocks()
+    return "\n".join(parts)
+
+
+def compile_template(template: str, allowed_fields: set[str]) -> tuple[tuple[str, str | None], ...]:
+    """템플릿을 `(문자열 조각, 필드 이름 또는 None)` 목록으로 한 번만 파싱합니다.
+
+    Raises:
+        ValueError: 템플릿 문법이 잘못되었거나 허용되지 않은 필드, 변환, 서식 지정자를 사용한 경우.
+    """
+    compiled = []
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError as e:
+        raise ValueError(f"템플릿 문법 오류: {e}")
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None:
+            if field_name not in allowed_fields:
+                raise ValueError(f"템플릿에서 알 수 없는 필드입니다: {{{field_name}}} (사용 가능: {', '.join(sorted(allowed_fields))})")
+            if format_spec or conversion:
+                raise ValueError(f"템플릿 필드에는 변환이나 서식 지정자를 사용할 수 없습니다: {{{field_name}}}")
+        compiled.append((literal, field_name))
+    return tuple(compiled)
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def _json_string_body(text: str) -> str:
+    """JSON 문자열 리터럴 안에 들어갈 수 있도록 따옴표 없이 이스케이프합니다."""
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def _tags_of(blog_post_object: dict[str, any]) -> list[str]:
+    tags = blog_post_object.get('tags', [])
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(',')]
+    return tags
+
+
+def _markdown_document(post: dict[str, any]) -> dict[str, str]:
+    return {
+        "title": post.get('title', '제목 없음'),
+        "meta_description": post.get('meta_description', ''),
+        "tags": ", ".join(f"#{tag}" for tag in _tags_of(post)),
+    }
+
+
+def _markdown_section(section: dict[str, any], index: int) -> dict[str, str]:
+    image_keyword = section.get('image_keyword')
+    return {
+        "index": str(index),
+        "subtitle": section.get('subtitle', ''),
+        "content": section.get('content', ''),
+        "image_keyword": image_keyword or "",
+        "image_comment": f"<!-- Recommended image query: \"{image_keyword}\" -->\n\n" if image_keyword else "",
+    }
+
+
+def _html_document(post: dict[str, any]) -> dict[str, str]:
+    return {
+        "title": html.escape(post.get('title', '제목 없음')),
+        "meta_description": html.escape(post.get('meta_description', '')),
+        "tags": " ".join(f"#{html.escape(tag)}" for tag in _tags_of(post)),
+    }
+
+
+def _html_section(section: dict[str, any], index: int) -> dict[str, str]:
+    image_keyword = section.get('image_keyword')
+    # "--" would end the HTML comment early
+    comment_keyword = html.escape(image_keyword or "").replace("--", "- -")
+    return {
+        "index": str(index),
+        "subtitle": html.escape(section.get('subtitle', '')),
+        "content": markdown_to_html(section.get('content', '')),
+        "image_keyword": html.escape(image_keyword or ""),
+        "image_comment": f"<!-- Recommended image query: \"{comment_keyword}\" -->\n" if image_keyword else "",
+    }
+
+
+def _tistory_document(post: dict[str, any]) -> dict[str, str]:
+    return {
+        "title": json.dumps(post.get('title', '제목 없음'), ensure_ascii=False),
+        "meta_description": json.dumps(post.get('meta_description', ''), ensure_ascii=False),
+        "tags": json.dumps(",".join(_tags_of(post)), ensure_ascii=False),
+    }
+
+
+def _wordpress_document(post: dict[str, any]) -> dict[str, str]:
+    return {
+        "title": json.dumps(post.get('title', '제목 없음'), ensure_ascii=False),
+        "meta_description": json.dumps(post.get('meta_description', ''), ensure_ascii=False),
+        "tags": json.dumps(_tags_of(post), ensure_ascii=False),
+    }
+
+
+# format -> (document template, section template, document values, section values, section output filter)
+_FORMATS: dict[str, tuple[str, str, Callable, Callable, Callable[[str], str]]] = {
+    "markdown": (MARKDOWN_DOCUMENT_TEMPLATE, MARKDOWN_SECTION_TEMPLATE, _markdown_document, _markdown_section, _identity),
+    "html": (HTML_DOCUMENT_TEMPLATE, HTML_SECTION_TEMPLATE, _html_document, _html_section, _identity),
+    "tistory": (TISTORY_DOCUMENT_TEMPLATE, HTML_SECTION_TEMPLATE, _tistory_document, _html_section, _json_string_body),
+    "wordpress": (WORDPRESS_DOCUMENT_TEMPLATE, HTML_SECTION_TEMPLATE, _wordpress_document, _html_section, _json_string_body),
+}
+
+
+class TemplateRenderer:
+    """출력 형식 하나에 대해 컴파일된 문서/단락 템플릿으로 게시물을 조각 단위로 렌더링합니다.
+
+    Args:
+        output_format: `OUTPUT_FORMATS` 중 하나.
+        document_template: 기본 문서 템플릿 대신 사용할 템플릿. `{sections}`를 한 번 포함해야 합니다.
+        section_template: 기본 단락 템플릿 대신 사용할 템플릿.
+
+    Raises:
+        ValueError: 알 수 없는 형식이거나 템플릿이 유효하지 않은 경우.
+    """
+
+    def __init__(self, output_format: str = "markdown", document_template: str | None = None, section_template: str | None = None):
+        if output_format not in _FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format} (사용 가능: {', '.join(OUTPUT_FORMATS)})")
+        default_document, default_section, self._document_values, self._section_values, self._section_filter = _FORMATS[output_format]
+        self.output_format = output_format
+        self.extension = FILE_EXTENSIONS[output_format]
+
+        document = compile_template(document_template or default_document, DOCUMENT_FIELDS)
+        split_at = [i for i, (_, field) in enumerate(document) if field == "sections"]
+        if len(split_at) != 1:
+            raise ValueError("문서 템플릿에는 {sections} 필드가 정확히 한 번 있어야 합니다.")
+        # The literal before {sections} belongs to the header; the field itself is dropped
+        self._header = document[:split_at[0]] + ((document[split_at[0]][0], None),)
+        self._footer = document[split_at[0] + 1:]
+        self._section = compile_template(section_template or default_section, SECTION_FIELDS)
+
+    @staticmethod
+    def _fill(compiled: tuple[tuple[str, str | None], ...], values: dict[str, str]) -> Iterator[str]:
+        for literal, field in compiled:
+            if literal:
+                yield literal
+            if field is not None:
+                yield values[field]
+
+    def render_header(self, blog_post_object: dict[str, any]) -> str:
+        """`{sections}` 앞부분을 렌더링합니다."""
+        return "".join(self._fill(self._header, self._document_values(blog_post_object)))
+
+    def render_section(self, section: dict[str, any], index: int) -> str:
+        """단락 하나를 렌더링합니다. `index`는 1부터 시작합니다."""
+        return self._section_filter("".join(self._fill(self._section, self._section_values(section, index))))
+
+    def render_footer(self, blog_post_object: dict[str, any]) -> str:
+        """`{sections}` 뒷부분을 렌더링합니다."""
+        return "".join(self._fill(self._footer, self._document_values(blog_post_object)))
+
+    def iter_render(self, blog_post_object: dict[str, any]) -> Iterator[str]:
+        """문서 전체 문자열을 만들지 않고 머리말, 각 단락, 꼬리말 조각을 순서대로 생성합니다."""
+        document_values = self._document_values(blog_post_object)
+        yield from self._fill(self._header, document_values)
+        for index, section in enumerate(blog_post_object.get('body', []), start=1):
+            yield self.render_section(section, index)
+        yield from self._fill(self._footer, document_values)
+
+    def render_to(self, blog_post_object: dict[str, any], handle: TextIO) -> None:
+        """렌더링 조각을 파일 핸들이나 스트림에 바로 기록합니다."""
+        handle.writelines(self.iter_render(blog_post_object))
+
+    def render(self, blog_post_object: dict[str, any]) -> str:
+        return "".join(self.iter_render(blog_post_object))
+
+
+@lru_cache(maxsize=32)
+def get_renderer(
+    output_format: str = "markdown",
+    document_template_path: str | None = None,
+    section_template_path: str | None = None,
+) -> TemplateRenderer:
+    """템플릿 파일을 읽어 컴파일한 렌더러를 반환합니다. 같은 인자로는 한 번만 컴파일하여 배치 전체에서 재사용합니다."""
+    document_template = section_template = None
+    if document_template_path:
+        with open(document_template_path, encoding="utf-8") as f:
+            document_template = f.read()
+    if section_template_path:
+        with open(section_template_path, encoding="utf-8") as f:
+            section_template = f.read()
+    return TemplateRenderer(output_format, document_template, section_template)
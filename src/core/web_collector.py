@@ -0,0 +1,211 @@
+"""참고 자료 URL에서 본문 텍스트를 동시에 수집하여 프롬프트 컨텍스트를 만듭니다."""
+
+import asyncio
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+from src.core.content_generator import WebContentError
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOTAL_TIMEOUT = 20.0
+DEFAULT_REQUEST_TIMEOUT = 8.0
+DEFAULT_PER_HOST_LIMIT = 2
+DEFAULT_MAX_CONNECTIONS = 20
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+MAX_CHARS_PER_SOURCE = 6000
+MIN_PARAGRAPH_LENGTH = 40
+DUPLICATE_SIMILARITY = 0.8
+READ_CHUNK_SIZE = 16 * 1024
+
+_SKIPPED_TAGS = {"script", "style", "noscript", "svg", "template", "nav", "header", "footer", "aside", "form"}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "br", "li", "ul", "ol", "table", "tr",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "dd", "dt",
+}
+
+
+class HTMLTextExtractor(HTMLParser):
+    """HTML을 청크 단위로 입력받아 문단 텍스트를 추출하는 스트리밍 추출기입니다.
+
+    스크립트, 스타일, 내비게이션 등 본문이 아닌 요소는 건너뛰고,
+    블록 요소 경계마다 문단을 나눕니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs: list[str] = []
+        self._current: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._current.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        text = " ".join("".join(self._current).split())
+        self._current = []
+        if len(text) >= MIN_PARAGRAPH_LENGTH:
+            self.paragraphs.append(text)
+
+
+class ParagraphDeduplicator:
+    """단어 3-gram 자카드 유사도로 여러 출처 간의 거의 같은 문단을 걸러냅니다."""
+
+    def __init__(self, threshold: float = DUPLICATE_SIMILARITY):
+        self.threshold = threshold
+        self._shingle_sets: list[set[int]] = []
+        self._index: dict[int, list[int]] = {}
+
+    @staticmethod
+    def _shingles(paragraph: str) -> set[int]:
+        words = re.sub(r"[^\w\s]", " ", paragraph.lower()).split()
+        if len(words) < 3:
+            return {hash(" ".join(words))}
+        return {hash(" ".join(words[i:i + 3])) for i in range(len(words) - 2)}
+
+    def is_duplicate(self, paragraph: str) -> bool:
+        """이미 본 문단과 충분히 유사하면 True를, 아니면 문단을 등록하고 False를 반환합니다."""
+        shingles = self._shingles(paragraph)
+        overlaps: dict[int, int] = {}
+        for shingle in shingles:
+            for candidate in self._index.get(shingle, ()):
+                overlaps[candidate] = overlaps.get(candidate, 0) + 1
+
+        for candidate, overlap in overlaps.items():
+            union = len(shingles) + len(self._shingle_sets[candidate]) - overlap
+            if overlap / union >= self.threshold:
+                return True
+
+        paragraph_id = len(self._shingle_sets)
+        self._shingle_sets.append(shingles)
+        for shingle in shingles:
+            self._index.setdefault(shingle, []).append(paragraph_id)
+        return False
+
+
+def parse_source_urls(value: str | list[str] | None) -> list[str]:
+    """`user_input['source_urls']` 값을 URL 목록으로 변환합니다. 문자열은 공백, 쉼표, 줄바꿈으로 구분합니다."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = re.split(r"[\s,]+", value)
+    return [url.strip() for url in value if url.strip()]
+
+
+async def _fetch_paragraphs(session: "aiohttp.ClientSession", url: str) -> list[str]:
+    """페이지를 스트리밍으로 읽으면서 바로 문단을 추출합니다."""
+    async with session.get(url) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+        extractor = HTMLTextExtractor()
+        read_bytes = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            extractor.feed(decoder.decode(chunk))
+            read_bytes += len(chunk)
+            if read_bytes >= MAX_PAGE_BYTES:
+                break
+        extractor.feed(decoder.decode(b"", final=True))
+        extractor.close()
+        return extractor.paragraphs
+
+
+async def collect_web_context(
+    urls: list[str],
+    total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> str:
+    """여러 URL을 동시에 수집하여 출처 구분자로 연결된 컨텍스트 문자열을 만듭니다.
+
+    하나의 커넥션 풀을 공유하며 호스트별 동시 연결 수를 제한합니다. 응답하지 않는
+    출처가 있어도 `total_timeout`이 지나면 완료된 출처만으로 결과를 만듭니다.
+
+    Args:
+        urls: 수집할 페이지 URL 목록.
+        total_timeout: 전체 수집에 허용되는 최대 시간(초).
+        request_timeout: 페이지 하나에 허용되는 최대 시간(초).
+        per_host_limit: 같은 호스트에 대한 최대 동시 연결 수.
+
+    Returns:
+        `--- [Source: URL] ---` 구분자로 이어 붙인 출처별 본문 텍스트.
+
+    Raises:
+        WebContentError: URL이 없거나 모든 출처의 수집에 실패한 경우.
+    """
+    if not urls:
+        raise WebContentError("웹 검색 결과가 없습니다.")
+
+    # aiohttp takes a noticeable share of cold start, so it is only loaded when pages are fetched
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=DEFAULT_MAX_CONNECTIONS, limit_per_host=per_host_limit)
+    timeout = aiohttp.ClientTimeout(total=request_timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = {asyncio.create_task(_fetch_paragraphs(session, url)): url for url in urls}
+        done, pending = await asyncio.wait(tasks, timeout=total_timeout)
+        for task in pending:
+            logger.warning(f"시간 초과로 수집을 건너뜁니다: {tasks[task]}")
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    results = {}
+    for task in done:
+        url = tasks[task]
+        if task.exception() is not None:
+            logger.warning(f"수집 실패로 건너뜁니다: {url} - {task.exception()}")
+            continue
+        results[url] = task.result()
+
+    deduplicator = ParagraphDeduplicator()
+    sections = []
+    # Keep the caller's source order so the most relevant sources win deduplication
+    for url in urls:
+        if url not in results:
+            continue
+        kept = []
+        length = 0
+        for paragraph in results[url]:
+            if length >= MAX_CHARS_PER_SOURCE:
+                break
+            if deduplicator.is_duplicate(paragraph):
+                continue
+            kept.append(paragraph)
+            length += len(paragraph)
+        if kept:
+            sections.append(f"--- [Source: {url}] ---\n" + "\n\n".join(kept))
+
+    if not sections:
+        raise WebContentError("정보를 수집할 수 있는 유효한 웹 페이지가 없습니다.")
+    return "\n\n".join(sections)
+
+
+def search_web_for_keyword(keyword: str, urls: list[str]) -> str:
+    """키워드에 대한 참고 자료를 수집합니다. (`collect_web_context`의 동기 버전)"""
+    print(f"'{keyword}' 관련 웹 자료 {len(urls)}건 수집을 시작합니다...")
+    context = asyncio.run(collect_web_context(urls))
+    print(f"웹 자료 수집 완료 ({len(context)}자).")
+    return context
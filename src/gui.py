@@ -1,16 +1,48 @@
+import itertools
+import queue
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 from tkinter import scrolledtext
 
+MAX_CONCURRENT_JOBS = 2
+EVENT_POLL_INTERVAL_MS = 100
+
+
+class GenerationJob:
+    """GUI에서 요청한 블로그 생성 작업 하나의 상태를 보관합니다."""
+
+    def __init__(self, job_id: int, user_input: dict[str, any], refresh_cache: bool):
+        self.job_id = job_id
+        self.user_input = user_input
+        self.refresh_cache = refresh_cache
+        self.status = "대기 중"
+        self.output = []
+        self.cancel_event = threading.Event()
+        self.future = None
+        # Set when the job runs on a Blog-Genie server instead of in this process
+        self.remote_id = None
+
 class BlogGenieGUI:
-    def __init__(self, master):
+    def __init__(self, master, server_address: str | None = None):
         self.master = master
+        self.server_address = server_address
         master.title("Blog Genie - 자동 블로그 포스팅 프로그램")
 
         # Configure grid for better resizing
         self.master.columnconfigure(1, weight=1)
 
+        # Worker threads only put events on this queue; widgets are touched on the Tk thread
+        self.events = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS)
+        self.jobs: dict[int, GenerationJob] = {}
+        self.job_ids = itertools.count(1)
+        self.selected_job_id = None
+
         self.create_widgets()
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.master.after(EVENT_POLL_INTERVAL_MS, self.drain_events)
 
     def create_widgets(self):
         row_idx = 0
@@ -91,9 +123,38 @@ class BlogGenieGUI:
         self.custom_instructions_text.grid(row=row_idx, column=1, sticky="ew", padx=5, pady=5)
         row_idx += 1
 
-        # Generate Button
-        self.generate_button = ttk.Button(self.master, text="블로그 게시물 생성", command=self.generate_blog_post)
-        self.generate_button.grid(row=row_idx, column=0, columnspan=2, pady=10)
+        # Source URLs
+        self.source_urls_label = ttk.Label(self.master, text="참고 URL (선택, 줄마다 하나):")
+        self.source_urls_label.grid(row=row_idx, column=0, sticky="nw", padx=5, pady=5)
+        self.source_urls_text = scrolledtext.ScrolledText(self.master, width=40, height=3, wrap=tk.NONE)
+        self.source_urls_text.grid(row=row_idx, column=1, sticky="ew", padx=5, pady=5)
+        row_idx += 1
+
+        # Cache Option
+        self.refresh_cache_var = tk.BooleanVar(value=False)
+        self.refresh_cache_check = ttk.Checkbutton(self.master, text="캐시 무시하고 새로 생성", variable=self.refresh_cache_var)
+        self.refresh_cache_check.grid(row=row_idx, column=1, sticky="w", padx=5, pady=5)
+        row_idx += 1
+
+        # Generate / Cancel Buttons
+        self.button_frame = ttk.Frame(self.master)
+        self.button_frame.grid(row=row_idx, column=0, columnspan=2, pady=10)
+        self.generate_button = ttk.Button(self.button_frame, text="블로그 게시물 생성", command=self.generate_blog_post)
+        self.generate_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(self.button_frame, text="선택한 작업 취소", command=self.cancel_selected_job)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        row_idx += 1
+
+        # Job List
+        self.jobs_label = ttk.Label(self.master, text="작업 목록:")
+        self.jobs_label.grid(row=row_idx, column=0, sticky="nw", padx=5, pady=5)
+        self.jobs_tree = ttk.Treeview(self.master, columns=("keyword", "status"), height=5)
+        self.jobs_tree.heading("#0", text="#")
+        self.jobs_tree.heading("keyword", text="키워드")
+        self.jobs_tree.heading("status", text="상태")
+        self.jobs_tree.column("#0", width=40, stretch=False)
+        self.jobs_tree.grid(row=row_idx, column=1, sticky="ew", padx=5, pady=5)
+        self.jobs_tree.bind("<<TreeviewSelect>>", self.on_job_selected)
         row_idx += 1 # Increment row_idx for the new output area
 
         # Output Display Area
@@ -108,9 +169,6 @@ class BlogGenieGUI:
         self.output_text.see(tk.END) # Scroll to the end
 
     def generate_blog_post(self):
-        self.update_output("블로그 게시물 생성을 시작합니다...")
-        self.generate_button.config(state=tk.DISABLED) # Disable button during processing
-
         user_input = {
             "keyword": self.keyword_entry.get(),
             "target_audience": self.target_audience_combobox.get(),
@@ -120,29 +178,134 @@ class BlogGenieGUI:
             "seo_optimization_level": self.seo_level_combobox.get(),
             "image_suggestion_preference": self.image_pref_combobox.get(),
             "publishing_platform": self.publishing_platform_combobox.get(),
-            "custom_instructions": self.custom_instructions_text.get("1.0", tk.END).strip()
+            "custom_instructions": self.custom_instructions_text.get("1.0", tk.END).strip(),
+            "source_urls": self.source_urls_text.get("1.0", tk.END).split()
         }
-        self.update_output("수집된 사용자 입력:")
+        if not user_input["keyword"]:
+            self.update_output("키워드를 입력해주세요.")
+            return
+
+        job = GenerationJob(next(self.job_ids), user_input, self.refresh_cache_var.get())
+        self.jobs[job.job_id] = job
+        self.jobs_tree.insert("", tk.END, iid=str(job.job_id), text=str(job.job_id), values=(user_input["keyword"], job.status))
+        job.output.append("수집된 사용자 입력:\n")
         for key, value in user_input.items():
-            self.update_output(f"  {key}: {value}")
+            job.output.append(f"  {key}: {value}\n")
 
-        from src.core.pipeline import run_blog_post_pipeline
-        
-        # content_filepath is no longer needed as web search is integrated
-        
+        job.future = self.executor.submit(self.run_job, job)
+        self.jobs_tree.selection_set(str(job.job_id))
+
+    def run_job(self, job):
+        """워커 스레드에서 파이프라인을 실행하고 결과를 이벤트 큐로 전달합니다."""
+        if self.server_address:
+            self.run_remote_job(job)
+            return
+        from src.core.pipeline import (
+            PipelineCancelledError,
+            run_blog_post_pipeline_stream,
+        )
+
+        if job.cancel_event.is_set():
+            self.events.put((job.job_id, "status", "취소됨"))
+            return
+        try:
+            # Show each section as soon as it is parsed from the streamed response
+            for chunk in run_blog_post_pipeline_stream(
+                user_input=job.user_input,
+                refresh_cache=job.refresh_cache,
+                progress_callback=lambda stage: self.events.put((job.job_id, "status", stage)),
+                cancel_event=job.cancel_event,
+            ):
+                self.events.put((job.job_id, "output", chunk))
+            self.events.put((job.job_id, "output", "\n\n블로그 게시물 생성이 완료되었습니다!\n"))
+        except PipelineCancelledError:
+            self.events.put((job.job_id, "status", "취소됨"))
+        except Exception as e:
+            self.events.put((job.job_id, "status", "오류"))
+            self.events.put((job.job_id, "output", f"\n오류 발생: {e}\n"))
+
+    def run_remote_job(self, job):
+        """Blog-Genie 서버에 작업을 제출하고 출력 조각을 받아 이벤트 큐로 전달합니다."""
+        from src.utils.job_client import JobClient, JobClientError
+
+        if job.cancel_event.is_set():
+            self.events.put((job.job_id, "status", "취소됨"))
+            return
+        client = JobClient(self.server_address)
         try:
-            self.update_output("파이프라인 실행 중...")
-            result = run_blog_post_pipeline(user_input=user_input)
-            self.update_output(f"파이프라인 결과: {result}")
-            self.update_output("블로그 게시물 생성이 완료되었습니다!")
+            job.remote_id = client.submit(job.user_input, refresh_cache=job.refresh_cache)["id"]
+            for chunk in client.stream(
+                job.remote_id, progress_callback=lambda stage: self.events.put((job.job_id, "status", stage))
+            ):
+                self.events.put((job.job_id, "output", chunk))
+                if job.cancel_event.is_set():
+                    client.cancel(job.remote_id)
+            self.events.put((job.job_id, "output", "\n\n블로그 게시물 생성이 완료되었습니다!\n"))
+        except JobClientError as e:
+            if e.status == "cancelled":
+                self.events.put((job.job_id, "status", "취소됨"))
+                return
+            self.events.put((job.job_id, "status", "오류"))
+            self.events.put((job.job_id, "output", f"\n오류 발생: {e}\n"))
         except Exception as e:
-            self.update_output(f"오류 발생: {e}")
-        finally:
-            self.generate_button.config(state=tk.NORMAL) # Re-enable button
+            self.events.put((job.job_id, "status", "오류"))
+            self.events.put((job.job_id, "output", f"\n오류 발생: {e}\n"))
+
+    def drain_events(self):
+        """워커가 보낸 이벤트를 Tk 메인 스레드에서 위젯에 반영합니다."""
+        try:
+            while True:
+                job_id, kind, payload = self.events.get_nowait()
+                job = self.jobs[job_id]
+                if kind == "status":
+                    job.status = payload
+                    self.jobs_tree.set(str(job_id), "status", payload)
+                elif kind == "output":
+                    job.output.append(payload)
+                    if job_id == self.selected_job_id:
+                        self.output_text.insert(tk.END, payload)
+                        self.output_text.see(tk.END)
+        except queue.Empty:
+            pass
+        self.master.after(EVENT_POLL_INTERVAL_MS, self.drain_events)
+
+    def on_job_selected(self, event=None):
+        selection = self.jobs_tree.selection()
+        if not selection:
+            return
+        self.selected_job_id = int(selection[0])
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, "".join(self.jobs[self.selected_job_id].output))
+        self.output_text.see(tk.END)
+
+    def cancel_selected_job(self):
+        job = self.jobs.get(self.selected_job_id)
+        if job is None or job.status in ("완료", "오류", "취소됨"):
+            return
+        job.cancel_event.set()
+        if job.remote_id is not None:
+            from src.utils.job_client import JobClient, JobClientError
+
+            try:
+                JobClient(self.server_address).cancel(job.remote_id)
+            except JobClientError as e:
+                self.update_output(f"작업 취소 요청 실패: {e}")
+        if job.future is not None and job.future.cancel():
+            # Still queued, so the worker never starts
+            self.events.put((job.job_id, "status", "취소됨"))
+        else:
+            self.events.put((job.job_id, "status", "취소 중"))
+
+    def on_close(self):
+        for job in self.jobs.values():
+            job.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
 
-def run_gui():
+def run_gui(server_address: str | None = None):
+    """GUI를 실행합니다. `server_address`를 지정하면 작업을 Blog-Genie 서버에서 실행합니다."""
     root = tk.Tk()
-    app = BlogGenieGUI(root)
+    app = BlogGenieGUI(root, server_address)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -1,17 +1,213 @@
+import argparse
+import cProfile
+import json
 import sys
 import os
+from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.pipeline import run_blog_post_pipeline
-from src.gui import run_gui
+# Only option defaults are imported here; each mode imports what it runs (the GUI pulls in
+# tkinter, the Gemini SDK is loaded on first use) so a thin client to the server starts quickly
+from src.core.options import (
+    BACKENDS,
+    DEFAULT_BENCHMARK_SIZES,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_CONTEXT_TOKEN_BUDGET,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_WORKERS,
+    DUPLICATE_POLICIES,
+    GENERATION_ENGINES,
+    OUTPUT_FORMATS,
+    PUBLISH_PLATFORMS,
+)
+from src.utils.archive import DEFAULT_FIND_LIMIT
+from src.utils.job_client import DEFAULT_SERVER_ADDRESS, get_server_address
+from src.utils.telemetry import TELEMETRY, configure_logging
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="Blog-Genie: 자동 블로그 포스팅 프로그램")
+    parser.add_argument("--gui", action="store_true", help="GUI 모드로 실행합니다.")
+    parser.add_argument("--batch", metavar="PATH", help="user_input 행이 담긴 CSV/JSONL 파일로 대량 생성을 실행합니다.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="배치 모드의 동시 실행 수")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_REQUESTS_PER_MINUTE, help="배치 모드의 분당 Gemini 요청 예산 (0이면 제한 없음)")
+    parser.add_argument("--progress", metavar="PATH", help="배치 진행 상황 파일 경로 (기본값: <입력 파일>.progress.jsonl)")
+    parser.add_argument("--stream", action="store_true", help="생성되는 단락을 즉시 출력하는 스트리밍 모드로 실행합니다.")
+    parser.add_argument("--engine", choices=GENERATION_ENGINES, default="single", help="콘텐츠 생성 방식 (fanout: 개요 생성 후 단락별 병렬 생성)")
+    parser.add_argument("--source-url", action="append", default=[], metavar="URL", help="참고 자료로 수집할 웹 페이지 URL (여러 번 지정 가능)")
+    parser.add_argument("--corpus", metavar="DIR", help="참고 자료로 검색할 로컬 문서(.md/.txt) 디렉터리")
+    parser.add_argument("--context-budget", type=int, default=DEFAULT_CONTEXT_TOKEN_BUDGET, metavar="N", help="로컬 문서에서 가져올 참고 자료의 최대 토큰 수")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="markdown", help="저장할 출력 형식 (tistory/wordpress: 발행 API 요청 본문 JSON)")
+    parser.add_argument("--template", metavar="PATH", help="문서 템플릿 파일 ({title}, {meta_description}, {sections}, {tags} 사용)")
+    parser.add_argument("--section-template", metavar="PATH", help="단락 템플릿 파일 ({index}, {subtitle}, {content}, {image_keyword}, {image_comment} 사용)")
+    parser.add_argument("--platform", choices=["Markdown File Only", *PUBLISH_PLATFORMS], default="Markdown File Only", help="발행 플랫폼 (Tistory/WordPress: 발행 대기열에 추가)")
+    parser.add_argument("--publish", action="store_true", help="발행 대기열의 게시물을 Tistory/WordPress로 업로드합니다.")
+    parser.add_argument("--duplicates", choices=DUPLICATE_POLICIES, default="flag", help="비슷한 게시물이 이미 있을 때의 처리 (flag: 경고만, skip: 생성과 발행을 건너뜀, off: 확인하지 않음)")
+    parser.add_argument("--no-cache", action="store_true", help="Gemini 응답 캐시를 사용하지 않습니다.")
+    parser.add_argument("--refresh-cache", action="store_true", help="캐시를 무시하고 새로 생성한 응답으로 갱신합니다.")
+    parser.add_argument("--backend", choices=BACKENDS, default="gemini", help="콘텐츠 생성에 사용할 LLM 백엔드 (fake: API를 호출하지 않는 로컬 가짜 모델)")
+    parser.add_argument("--fake-latency", type=float, default=0.5, metavar="SEC", help="가짜 백엔드 호출 하나의 평균 지연 시간(초)")
+    parser.add_argument("--fake-jitter", type=float, default=0.2, metavar="SEC", help="가짜 백엔드 지연 시간의 변동 폭(초)")
+    parser.add_argument("--fake-malformed-rate", type=float, default=0.0, metavar="RATE", help="가짜 백엔드가 형식이 잘못된 응답을 반환할 비율 (0~1)")
+    parser.add_argument("--fake-rate-limit-rate", type=float, default=0.0, metavar="RATE", help="가짜 백엔드가 호출 한도 초과(429) 오류를 낼 비율 (0~1)")
+    parser.add_argument("--benchmark", nargs="?", const=",".join(map(str, DEFAULT_BENCHMARK_SIZES)), metavar="SIZES", help="가짜 백엔드로 벤치마크를 실행합니다. (예: 1,100,1000,10000)")
+    parser.add_argument("--benchmark-output", metavar="PATH", help="벤치마크 결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--regenerate", metavar="PATH", help="저장된 게시물(출력 파일 또는 .post.json)에서 바뀐 부분만 다시 생성합니다.")
+    parser.add_argument("--edit-section", action="append", default=[], metavar="N:요청", help="재생성 시 N번째 단락(1부터)을 수정 요청에 맞춰 다시 작성합니다. (여러 번 지정 가능)")
+    parser.add_argument("--regenerate-title", action="store_true", help="재생성 시 제목과 메타 설명을 다시 작성합니다.")
+    parser.add_argument("--regenerate-tags", action="store_true", help="재생성 시 태그를 다시 작성합니다.")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="재생성 시 저장된 user_input 설정을 바꿉니다. (예: tone_of_voice=친근한)")
+    parser.add_argument("--list-posts", nargs="?", const="", metavar="KEYWORD", help="게시물 보관소 색인에서 게시물을 찾습니다. 키워드를 주면 그 키워드로 생성된 게시물만 찾습니다.")
+    parser.add_argument("--tag", help="--list-posts에서 이 태그가 붙은 게시물만 찾습니다.")
+    parser.add_argument("--since", metavar="YYYY-MM-DD", help="--list-posts에서 이 날짜부터 생성된 게시물만 찾습니다.")
+    parser.add_argument("--until", metavar="YYYY-MM-DD", help="--list-posts에서 이 날짜 전까지 생성된 게시물만 찾습니다.")
+    parser.add_argument("--limit", type=int, default=DEFAULT_FIND_LIMIT, help="--list-posts에서 보여줄 최대 게시물 수 (0이면 제한 없음)")
+    parser.add_argument("--serve", action="store_true", help="모델을 미리 초기화해 두고 작업 API를 제공하는 상주 서버로 실행합니다.")
+    parser.add_argument("--server", metavar="ADDRESS", default=get_server_address(), help=f"서버 주소 (host:port 또는 unix:/path.sock). 지정하면 CLI/GUI가 서버에 작업을 제출합니다. (기본값: BLOG_GENIE_SERVER, 서버 모드는 {DEFAULT_SERVER_ADDRESS})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="서버 모드의 동시 작업 수")
+    parser.add_argument("-v", "--verbose", action="store_true", help="DEBUG 로그를 콘솔에 출력합니다.")
+    parser.add_argument("--log-jsonl", metavar="PATH", help="단계별 소요 시간, 토큰 사용량 등 구조화 로그를 JSONL 파일에 기록합니다.")
+    parser.add_argument("--metrics", metavar="PATH", help="실행 후 지표 요약을 저장합니다. (.prom/.txt이면 Prometheus 형식, 그 외 JSON)")
+    parser.add_argument("--profile", metavar="PATH", help="실행 전체의 cProfile 결과를 저장합니다. (pstats로 확인)")
+    return parser.parse_args(argv)
+
+def parse_overrides(values: list[str]) -> dict[str, any]:
+    """`KEY=VALUE` 목록을 딕셔너리로 바꿉니다. 값은 JSON으로 해석할 수 있으면 해석합니다. (예: 숫자, 목록)"""
+    overrides = {}
+    for item in values:
+        key, separator, value = item.partition("=")
+        if not separator or not key.strip():
+            sys.exit(f"--set 값은 KEY=VALUE 형식이어야 합니다: {item}")
+        try:
+            overrides[key.strip()] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[key.strip()] = value
+    return overrides
+
+def parse_section_edits(values: list[str]) -> dict[int, str]:
+    """`N:요청` 목록을 단락 인덱스(0부터)별 수정 요청으로 바꿉니다."""
+    edits = {}
+    for item in values:
+        number, separator, instruction = item.partition(":")
+        if not separator or not number.strip().isdigit() or int(number) < 1:
+            sys.exit(f"--edit-section 값은 N:요청 형식이어야 합니다: {item}")
+        edits[int(number) - 1] = instruction.strip()
+    return edits
+
+def parse_date(value: str | None, option: str) -> datetime | None:
+    """`YYYY-MM-DD` 형식의 날짜를 해석합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        sys.exit(f"{option} 값은 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+def list_posts(args: argparse.Namespace) -> None:
+    """게시물 보관소 색인에서 조건에 맞는 게시물을 최신순으로 출력합니다."""
+    from src.utils.archive import get_post_archive
+
+    archive = get_post_archive()
+    entries = archive.find(
+        keyword=args.list_posts or None,
+        tag=args.tag,
+        since=parse_date(args.since, "--since"),
+        until=parse_date(args.until, "--until"),
+        limit=args.limit,
+    )
+    for entry in entries:
+        created = datetime.fromtimestamp(entry.created_at).strftime("%Y-%m-%d %H:%M")
+        tags = ", ".join(entry.tags)
+        print(f"{created}  {entry.keyword}  {entry.title or '(제목 없음)'}  [{tags}]  {entry.path}")
+    stats = archive.stats()
+    print(f"{len(entries)}개 게시물 (보관소 전체 {stats['posts']}개, {archive.root})")
 
 def main() -> None:
     """프로그램의 메인 로직을 실행합니다."""
+    args = parse_args()
+    if args.stream and args.engine != "single":
+        sys.exit("--stream 옵션은 single 생성 방식에서만 사용할 수 있습니다.")
+    configure_logging(args.verbose, args.log_jsonl)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"프로파일 결과를 저장했습니다: {args.profile}")
+        if args.metrics:
+            TELEMETRY.export(args.metrics)
+            print(f"지표 요약을 저장했습니다: {args.metrics}")
+
+def run(args: argparse.Namespace) -> None:
+    """파싱된 인자에 따라 벤치마크, 보관소 조회, 서버, 재생성, 발행, GUI, 배치, CLI 모드 중 하나를 실행합니다."""
+    fake_options = {
+        "latency": args.fake_latency,
+        "jitter": args.fake_jitter,
+        "malformed_rate": args.fake_malformed_rate,
+        "rate_limit_rate": args.fake_rate_limit_rate,
+    }
+    if args.benchmark:
+        from src.core.benchmark import run_benchmarks
+
+        sizes = tuple(int(size) for size in args.benchmark.split(",") if size.strip())
+        run_benchmarks(sizes, output_path=args.benchmark_output, **fake_options)
+        return
+    if args.list_posts is not None:
+        list_posts(args)
+        return
+    from src.core.llm_backend import configure_backend
+
+    configure_backend(args.backend, **(fake_options if args.backend == "fake" else {}))
+
+    if args.serve:
+        from src.core.job_server import serve
+
+        serve(args.server or DEFAULT_SERVER_ADDRESS, args.workers)
+    elif args.regenerate:
+        from src.core.regenerate import regenerate_post
+
+        print("Regenerating a saved Blog-Genie post...")
+        regenerate_post(
+            args.regenerate,
+            parse_overrides(args.set),
+            parse_section_edits(args.edit_section),
+            args.regenerate_title,
+            args.regenerate_tags,
+            engine=args.engine,
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh_cache,
+        )
+    elif args.publish:
+        from src.core.publisher import run_publish_queue
+
+        print("Publishing queued Blog-Genie posts...")
+        run_publish_queue()
+    elif args.gui:
+        from src.gui import run_gui
 
-    if "--gui" in sys.argv:
         print("Starting Blog-Genie GUI...")
-        run_gui()
+        run_gui(args.server)
+    elif args.batch:
+        from src.core.batch import run_batch
+
+        print("Running Blog-Genie in batch mode...")
+        run_batch(
+            args.batch,
+            args.concurrency,
+            args.rpm,
+            args.progress,
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh_cache,
+            engine=args.engine,
+            duplicate_policy_default=args.duplicates,
+        )
     else:
         print("Running Blog-Genie in CLI mode...")
         # For CLI mode, create a dummy user_input for testing purposes
@@ -23,11 +219,58 @@ def main() -> None:
             "num_subheadings": 5,
             "seo_optimization_level": "강화",
             "image_suggestion_preference": "검색어만 추천",
-            "publishing_platform": "Markdown File Only",
-            "custom_instructions": ""
+            "publishing_platform": args.platform,
+            "custom_instructions": "",
+            "source_urls": args.source_url,
+            "corpus_dir": args.corpus,
+            "context_token_budget": args.context_budget,
+            "output_format": args.format,
+            "document_template_path": args.template,
+            "section_template_path": args.section_template,
+            "duplicate_policy": args.duplicates,
         }
         # content_file is no longer needed as web search is integrated
-        run_blog_post_pipeline(user_input=user_input)
+        if args.server:
+            run_on_server(args.server, user_input, args)
+            return
+
+        from src.core.content_generator import GENERATION_STATS
+        from src.core.pipeline import (
+            run_blog_post_pipeline,
+            run_blog_post_pipeline_stream,
+        )
+
+        if args.stream:
+            for chunk in run_blog_post_pipeline_stream(
+                user_input=user_input,
+                use_cache=not args.no_cache,
+                refresh_cache=args.refresh_cache,
+            ):
+                print(chunk, end="", flush=True)
+            print()
+            return
+        run_blog_post_pipeline(
+            user_input=user_input,
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh_cache,
+            engine=args.engine,
+        )
+        print(GENERATION_STATS.format())
+        print(TELEMETRY.format())
+
+def run_on_server(address: str, user_input: dict[str, any], args: argparse.Namespace) -> None:
+    """작업을 서버에 제출하고 생성되는 출력 조각을 그대로 출력합니다."""
+    from src.utils.job_client import JobClient, JobClientError
+
+    client = JobClient(address)
+    try:
+        job = client.submit(user_input, args.engine, not args.no_cache, args.refresh_cache)
+        print(f"서버({address})에 작업 #{job['id']}을(를) 제출했습니다.")
+        for chunk in client.stream(job["id"]):
+            print(chunk, end="", flush=True)
+        print()
+    except JobClientError as e:
+        sys.exit(f"서버 작업 실패: {e}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,437 @@
+"""생성된 게시물을 날짜별 디렉터리에 원자적으로 저장하고 SQLite로 색인하는 보관소입니다.
+
+게시물은 `<root>/YYYY/MM/YYYYMMDD_키워드.확장자`에 저장되며, 같은 날 같은 키워드로 다시
+생성하면 `_2`, `_3`처럼 번호를 붙여 기존 파일을 덮어쓰지 않습니다. 색인(`<root>/.index.sqlite3`)에는
+키워드, 설정, 제목, 태그, 토큰 사용량, 시각, 내용 해시가 저장되어 파일 시스템을 훑지 않고 조회할 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TextIO
+
+DEFAULT_ARCHIVE_DIR = "blog_genie_posts"
+INDEX_FILENAME = ".index.sqlite3"
+GZIP_SUFFIX = ".gz"
+DEFAULT_FIND_LIMIT = 100
+
+_ENTRY_COLUMNS = (
+    "id", "path", "keyword", "content_hash", "size", "created_at", "updated_at",
+    "output_format", "title", "tags", "settings", "model", "prompt_tokens", "response_tokens",
+)
+
+
+@dataclass
+class ArchiveEntry:
+    """색인에 저장된 게시물 하나입니다. `path`는 절대 경로입니다."""
+
+    id: int
+    path: str
+    keyword: str
+    content_hash: str
+    size: int
+    created_at: float
+    updated_at: float
+    output_format: str | None = None
+    title: str | None = None
+    tags: list[str] = field(default_factory=list)
+    settings: dict[str, any] | None = None
+    model: str | None = None
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+
+
+def sanitize_keyword(keyword: str) -> str:
+    """파일 이름에 쓸 수 없는 문자를 제거하고 공백을 밑줄로 바꿉니다."""
+    return re.sub(r'[\\/*?:\"<>|]', "", keyword).replace(' ', '_')
+
+
+def normalize_keyword(keyword: str) -> str:
+    """색인 조회에 사용할 키워드 형태(앞뒤 공백 제거, 연속 공백은 하나로)입니다."""
+    return " ".join(keyword.split())
+
+
+def with_extension(path: str, extension: str) -> str:
+    """`path`의 확장자를 바꿉니다. gzip으로 압축된 경로(`.md.gz`)는 압축을 유지합니다."""
+    compressed = path.endswith(GZIP_SUFFIX)
+    base = path[:-len(GZIP_SUFFIX)] if compressed else path
+    return os.path.splitext(base)[0] + extension + (GZIP_SUFFIX if compressed else "")
+
+
+def open_text(path: str, mode: str = "r") -> TextIO:
+    """UTF-8 텍스트 파일을 엽니다. 경로가 `.gz`로 끝나면 gzip으로 압축된 파일로 다룹니다."""
+    if path.endswith(GZIP_SUFFIX):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_text(path: str) -> str:
+    """`open_text`로 파일 전체를 읽습니다."""
+    with open_text(path) as f:
+        return f.read()
+
+
+class _HashingWriter:
+    """기록되는 텍스트를 그대로 전달하면서 압축 전 내용의 SHA-256 해시와 크기(바이트)를 계산합니다."""
+
+    def __init__(self, handle: TextIO):
+        self.handle = handle
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        self.digest.update(data)
+        self.size += len(data)
+        return self.handle.write(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+
+def _write_temp(directory: str, compress: bool, write: Callable[[TextIO], None]) -> tuple[str, str, int]:
+    """`directory` 안의 임시 파일에 내용을 기록하고 디스크에 반영합니다.
+
+    Returns:
+        (임시 파일 경로, 내용 해시, 압축 전 크기).
+    """
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            # mtime=0 keeps the compressed bytes identical for identical content
+            stream = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) if compress else raw
+            handle = io.TextIOWrapper(stream, encoding="utf-8")
+            writer = _HashingWriter(handle)
+            write(writer)
+            handle.flush()
+            handle.detach()
+            if compress:
+                stream.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return temp_path, writer.digest.hexdigest(), writer.size
+
+
+def atomic_write(path: str, write: Callable[[TextIO], None]) -> tuple[str, int]:
+    """임시 파일에 기록한 뒤 이름을 바꿔 `path`를 원자적으로 교체합니다.
+
+    중간에 실패하거나 프로세스가 중단되어도 기존 파일은 그대로 남고, 읽는 쪽은 반쯤 기록된
+    파일을 보지 않습니다. `path`가 `.gz`로 끝나면 gzip으로 압축합니다.
+
+    Args:
+        path: 기록할 파일 경로.
+        write: 텍스트 핸들을 받아 내용을 기록하는 함수.
+
+    Returns:
+        (압축 전 내용의 SHA-256 해시, 압축 전 크기).
+    """
+    temp_path, content_hash, size = _write_temp(
+        os.path.dirname(os.path.abspath(path)), path.endswith(GZIP_SUFFIX), write
+    )
+    os.replace(temp_path, path)
+    return content_hash, size
+
+
+def atomic_create(directory: str, stem: str, extension: str, write: Callable[[TextIO], None]) -> tuple[str, str, int]:
+    """`stem + extension` 이름으로 새 파일을 원자적으로 만듭니다. 이미 있으면 `_2`, `_3`을 붙입니다.
+
+    기록을 마친 임시 파일을 하드 링크로 연결하므로, 동시에 같은 이름을 만들려는 다른 프로세스와도
+    파일을 덮어쓰지 않습니다.
+
+    Returns:
+        (만든 파일 경로, 압축 전 내용의 SHA-256 해시, 압축 전 크기).
+    """
+    temp_path, content_hash, size = _write_temp(directory, extension.endswith(GZIP_SUFFIX), write)
+    try:
+        number = 1
+        while True:
+            path = os.path.join(directory, f"{stem}{'' if number == 1 else f'_{number}'}{extension}")
+            try:
+                os.link(temp_path, path)
+                return path, content_hash, size
+            except FileExistsError:
+                number += 1
+            except OSError:
+                # Filesystems without hard links: reserve the name exclusively, then replace it
+                try:
+                    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    number += 1
+                    continue
+                os.replace(temp_path, path)
+                return path, content_hash, size
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def _to_timestamp(value: datetime | float | None) -> float | None:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+class PostArchive:
+    """게시물 파일을 보관소 디렉터리에 저장하고 SQLite 색인을 관리합니다.
+
+    Args:
+        root: 보관소 최상위 디렉터리.
+        compress: True이면 새 게시물을 gzip으로 압축하여 저장합니다. (`.md.gz` 등)
+    """
+
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR, compress: bool = False):
+        self.root = os.path.abspath(root)
+        self.compress = compress
+        self.index_path = os.path.join(self.root, INDEX_FILENAME)
+
+        os.makedirs(self.root, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL UNIQUE,
+                    keyword TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    output_format TEXT,
+                    title TEXT,
+                    tags TEXT NOT NULL DEFAULT '[]',
+                    settings TEXT,
+                    model TEXT,
+                    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                    response_tokens INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            # Tags are denormalised with created_at so "tag X in this period" is a single index range scan
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS post_tags (
+                    tag TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    post_id INTEGER NOT NULL,
+                    PRIMARY KEY (tag, created_at, post_id)
+                ) WITHOUT ROWID"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_keyword ON posts(keyword, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_created ON posts(created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_hash ON posts(content_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_post_tags_post ON post_tags(post_id)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per operation keeps the index usable from worker threads and processes
+        return sqlite3.connect(self.index_path, timeout=30)
+
+    def _relative(self, path: str) -> str | None:
+        """보관소 안의 경로이면 색인에 저장하는 상대 경로를, 바깥이면 None을 반환합니다."""
+        absolute = os.path.abspath(path)
+        if os.path.commonpath([self.root, absolute]) != self.root:
+            return None
+        return os.path.relpath(absolute, self.root)
+
+    def _entry(self, row: tuple) -> ArchiveEntry:
+        values = dict(zip(_ENTRY_COLUMNS, row))
+        values["path"] = os.path.join(self.root, values["path"])
+        values["tags"] = json.loads(values["tags"])
+        values["settings"] = json.loads(values["settings"]) if values["settings"] else None
+        return ArchiveEntry(**values)
+
+    def save(
+        self,
+        keyword: str,
+        extension: str,
+        write: Callable[[TextIO], None],
+        path: str | None = None,
+        output_format: str | None = None,
+    ) -> str:
+        """게시물 파일을 원자적으로 기록하고 색인에 추가(또는 갱신)합니다.
+
+        Args:
+            keyword: 게시물 키워드. 파일 이름과 색인에 사용합니다.
+            extension: 출력 형식의 확장자 (예: ".md"). 압축 설정이면 `.gz`가 붙습니다.
+            write: 텍스트 핸들을 받아 내용을 기록하는 함수.
+            path: 지정하면 새 파일 대신 이 파일을 교체합니다. (재생성) 보관소 밖의 경로는 색인하지 않습니다.
+            output_format: 색인에 기록할 출력 형식 이름.
+
+        Returns:
+            저장된 파일의 절대 경로.
+        """
+        now = time.time()
+        if path is None:
+            day = datetime.fromtimestamp(now)
+            path, content_hash, size = atomic_create(
+                os.path.join(self.root, day.strftime("%Y"), day.strftime("%m")),
+                f"{day:%Y%m%d}_{sanitize_keyword(keyword)}",
+                extension + (GZIP_SUFFIX if self.compress else ""),
+                write,
+            )
+        else:
+            content_hash, size = atomic_write(path, write)
+
+        relative = self._relative(path)
+        if relative is not None:
+            with self._connect() as conn:
+                conn.execute(
+                    """INSERT INTO posts (path, keyword, content_hash, size, created_at, updated_at, output_format)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        keyword = excluded.keyword,
+                        content_hash = excluded.content_hash,
+                        size = excluded.size,
+                        updated_at = excluded.updated_at,
+                        output_format = excluded.output_format""",
+                    (relative, normalize_keyword(keyword), content_hash, size, now, now, output_format),
+                )
+        return os.path.abspath(path)
+
+    def record(
+        self,
+        path: str,
+        user_input: dict[str, any] | None = None,
+        post: dict[str, any] | None = None,
+        model: str | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> bool:
+        """색인된 게시물에 생성 설정, 제목, 태그, 모델, 토큰 사용량을 기록합니다.
+
+        토큰 사용량은 누적되므로 재생성에 쓴 토큰도 같은 게시물에 더해집니다.
+
+        Returns:
+            색인에 있는 게시물이어서 기록했으면 True.
+        """
+        relative = self._relative(path)
+        if relative is None:
+            return False
+        updates = {}
+        if user_input is not None:
+            updates["settings = ?"] = json.dumps(user_input, ensure_ascii=False, sort_keys=True, default=str)
+        tags = None
+        if post is not None:
+            tags = list(dict.fromkeys(str(tag).strip().lstrip("#") for tag in post.get("tags") or [] if str(tag).strip()))
+            updates["title = ?"] = post.get("title")
+            updates["tags = ?"] = json.dumps(tags, ensure_ascii=False)
+        if model:
+            updates["model = ?"] = model
+        if usage:
+            updates["prompt_tokens = prompt_tokens + ?"] = int(usage.get("prompt_tokens", 0))
+            updates["response_tokens = response_tokens + ?"] = int(usage.get("response_tokens", 0))
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT id, created_at FROM posts WHERE path = ?", (relative,)).fetchone()
+            if row is None:
+                return False
+            post_id, created_at = row
+            if updates:
+                conn.execute(f"UPDATE posts SET {', '.join(updates)} WHERE id = ?", (*updates.values(), post_id))
+            if tags is not None:
+                conn.execute("DELETE FROM post_tags WHERE post_id = ?", (post_id,))
+                conn.executemany(
+                    "INSERT INTO post_tags (tag, created_at, post_id) VALUES (?, ?, ?)",
+                    [(tag, created_at, post_id) for tag in tags],
+                )
+        return True
+
+    def get(self, path: str) -> ArchiveEntry | None:
+        """경로로 색인 항목을 찾습니다."""
+        relative = self._relative(path)
+        if relative is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM posts WHERE path = ?", (relative,)).fetchone()
+        return self._entry(row) if row else None
+
+    def find(
+        self,
+        keyword: str | None = None,
+        tag: str | None = None,
+        since: datetime | float | None = None,
+        until: datetime | float | None = None,
+        limit: int = DEFAULT_FIND_LIMIT,
+    ) -> list[ArchiveEntry]:
+        """조건에 맞는 게시물을 최신순으로 반환합니다. 모든 조건은 색인으로 처리됩니다.
+
+        Args:
+            keyword: 키워드가 정확히 일치하는 게시물만 찾습니다.
+            tag: 이 태그가 붙은 게시물만 찾습니다.
+            since: 이 시각 이후(포함)에 처음 생성된 게시물만 찾습니다.
+            until: 이 시각 이전(미포함)에 처음 생성된 게시물만 찾습니다.
+            limit: 반환할 최대 개수. 0 이하이면 제한하지 않습니다.
+        """
+        columns = ", ".join(f"p.{column}" for column in _ENTRY_COLUMNS)
+        # With a tag the (tag, created_at) key drives the scan, otherwise the posts indexes do
+        time_column, id_column = ("t.created_at", "t.post_id") if tag is not None else ("p.created_at", "p.id")
+        sql = f"SELECT {columns} FROM posts p"
+        conditions, params = [], []
+        if tag is not None:
+            sql = f"SELECT {columns} FROM post_tags t JOIN posts p ON p.id = t.post_id"
+            conditions.append("t.tag = ?")
+            params.append(tag.strip().lstrip("#"))
+        if keyword is not None:
+            conditions.append("p.keyword = ?")
+            params.append(normalize_keyword(keyword))
+        if since is not None:
+            conditions.append(f"{time_column} >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            conditions.append(f"{time_column} < ?")
+            params.append(_to_timestamp(until))
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {time_column} DESC, {id_column} DESC LIMIT ?"
+        params.append(limit if limit > 0 else -1)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def has_keyword(self, keyword: str) -> bool:
+        """이 키워드로 생성된 게시물이 보관소에 있는지 확인합니다."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM posts WHERE keyword = ? LIMIT 1", (normalize_keyword(keyword),)
+            ).fetchone()
+        return row is not None
+
+    def stats(self) -> dict[str, int]:
+        """보관된 게시물 수, 압축 전 전체 크기, 누적 토큰 사용량을 반환합니다."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(prompt_tokens), 0), "
+                "COALESCE(SUM(response_tokens), 0) FROM posts"
+            ).fetchone()
+        return dict(zip(("posts", "bytes", "prompt_tokens", "response_tokens"), row))
+
+
+_default_archive: PostArchive | None = None
+_default_archive_lock = threading.Lock()
+
+
+def get_post_archive() -> PostArchive:
+    """환경 변수 설정을 반영한 프로세스 공용 보관소 인스턴스를 반환합니다.
+
+    `BLOG_GENIE_ARCHIVE_DIR`로 보관소 디렉터리를, `BLOG_GENIE_ARCHIVE_COMPRESS=1`로 gzip 압축을
+    설정할 수 있습니다. 설정이 바뀌면 새 인스턴스를 만듭니다.
+    """
+    global _default_archive
+    root = os.path.abspath(os.getenv("BLOG_GENIE_ARCHIVE_DIR") or DEFAULT_ARCHIVE_DIR)
+    compress = os.getenv("BLOG_GENIE_ARCHIVE_COMPRESS", "").lower() in ("1", "true", "yes")
+    with _default_archive_lock:
+        if _default_archive is None or (_default_archive.root, _default_archive.compress) != (root, compress):
+            _default_archive = PostArchive(root, compress)
+        return _default_archive
@@ -0,0 +1,146 @@
+"""Gemini 응답을 디스크에 저장하는 콘텐츠 주소 기반 캐시입니다."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = ".blog_genie_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class ResponseCache:
+    """프롬프트, 모델명, 생성 설정의 해시를 키로 응답 텍스트를 SQLite에 저장합니다.
+
+    Args:
+        path: SQLite 데이터베이스 파일 경로.
+        ttl_seconds: 항목의 유효 기간(초). 0 이하이면 만료되지 않습니다.
+        max_entries: 보관할 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per operation keeps the cache usable from worker threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(prompt: str, model_name: str, generation_config: dict[str, any] | None = None) -> str:
+        """렌더링된 프롬프트, 모델명, 생성 설정으로 캐시 키를 계산합니다."""
+        payload = json.dumps(
+            {"prompt": prompt, "model": model_name, "config": generation_config or {}},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """캐시된 응답을 반환합니다. 없거나 만료된 경우 None을 반환합니다."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds > 0 and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+                with self._lock:
+                    self.evictions += 1
+            if row is not None:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """응답을 저장하고 크기 및 유효 기간 제한에 따라 오래된 항목을 제거합니다."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            evicted = 0
+            if self.ttl_seconds > 0:
+                evicted += conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+                ).rowcount
+            if self.max_entries > 0:
+                evicted += conn.execute(
+                    """DELETE FROM responses WHERE key IN (
+                        SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_entries,),
+                ).rowcount
+
+        with self._lock:
+            self.writes += 1
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> dict[str, int]:
+        """적중/미스/저장/제거 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+
+_default_cache: ResponseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """환경 변수 설정을 반영한 프로세스 공용 캐시 인스턴스를 반환합니다.
+
+    `BLOG_GENIE_CACHE_PATH`, `BLOG_GENIE_CACHE_TTL`, `BLOG_GENIE_CACHE_MAX_ENTRIES`로
+    경로, 유효 기간(초), 최대 항목 수를 변경할 수 있습니다.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(
+                path=os.getenv("BLOG_GENIE_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl_seconds=int(os.getenv("BLOG_GENIE_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv("BLOG_GENIE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            )
+        return _default_cache
@@ -0,0 +1,179 @@
+"""Blog-Genie 상주 서버(`--serve`)의 작업 API를 호출하는 가벼운 클라이언트입니다.
+
+CLI와 GUI가 서버 모드에서 불러오는 유일한 모듈이므로 표준 라이브러리만 사용합니다.
+"""
+
+import http.client
+import json
+import os
+import socket
+import time
+from collections.abc import Callable, Iterator
+from urllib.parse import quote
+
+DEFAULT_SERVER_ADDRESS = "127.0.0.1:8765"
+DEFAULT_CLIENT_TIMEOUT = 30.0
+DEFAULT_POLL_INTERVAL = 0.2
+FINISHED_JOB_STATES = ("done", "failed", "cancelled")
+
+
+class JobClientError(Exception):
+    """서버 요청 또는 작업 실행 관련 오류
+
+    Attributes:
+        status: HTTP 상태 코드 또는 작업 상태 ("failed", "cancelled").
+    """
+
+    def __init__(self, message: str, status: int | str | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+def get_server_address() -> str | None:
+    """`BLOG_GENIE_SERVER` 환경 변수에 설정된 서버 주소를 반환합니다."""
+    return os.getenv("BLOG_GENIE_SERVER") or None
+
+
+def parse_server_address(address: str) -> tuple[str, any]:
+    """`host:port`, `:port`, `unix:/path/to.sock` 형식의 주소를 해석합니다.
+
+    Returns:
+        ("tcp", (host, port)) 또는 ("unix", 소켓 경로).
+
+    Raises:
+        ValueError: 형식이 잘못된 경우.
+    """
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        if not path:
+            raise ValueError(f"유닉스 소켓 경로가 비어 있습니다: {address}")
+        return "unix", path
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"서버 주소 형식이 잘못되었습니다: {address} (예: 127.0.0.1:8765, unix:/tmp/blog_genie.sock)")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class JobClient:
+    """서버에 작업을 제출하고 상태와 결과를 가져옵니다.
+
+    Args:
+        address: 서버 주소. None이면 `BLOG_GENIE_SERVER` 또는 기본 주소를 사용합니다.
+        timeout: 요청 하나의 제한 시간(초).
+    """
+
+    def __init__(self, address: str | None = None, timeout: float = DEFAULT_CLIENT_TIMEOUT):
+        self.address = address or get_server_address() or DEFAULT_SERVER_ADDRESS
+        self.kind, self.target = parse_server_address(self.address)
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.kind == "unix":
+            return _UnixHTTPConnection(self.target, self.timeout)
+        return http.client.HTTPConnection(*self.target, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, body: dict[str, any] | None = None) -> tuple[int, str]:
+        conn = self._connection()
+        try:
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+            headers = {"Content-Type": "application/json"} if payload is not None else {}
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read().decode("utf-8")
+        except (OSError, http.client.HTTPException) as e:
+            raise JobClientError(f"서버({self.address})에 연결할 수 없습니다: {e}")
+        except ValueError as e:
+            raise JobClientError(f"서버({self.address})의 응답을 읽을 수 없습니다: {e}")
+        finally:
+            conn.close()
+
+    def _json(self, method: str, path: str, body: dict[str, any] | None = None) -> dict[str, any]:
+        status, text = self._request(method, path, body)
+        data = self._parse(status, text)
+        if status >= 400:
+            raise JobClientError(data.get("error", f"HTTP {status}"), status)
+        return data
+
+    def _parse(self, status: int, text: str) -> dict[str, any]:
+        """응답 본문을 JSON 객체로 해석합니다. 프록시 오류 페이지처럼 JSON이 아니면 `JobClientError`를 발생시킵니다."""
+        try:
+            data = json.loads(text) if text else {}
+        except ValueError:
+            raise JobClientError(f"서버({self.address})가 JSON이 아닌 응답을 보냈습니다 (HTTP {status})", status)
+        if not isinstance(data, dict):
+            raise JobClientError(f"서버({self.address})의 응답 형식이 올바르지 않습니다 (HTTP {status})", status)
+        return data
+
+    def health(self) -> dict[str, any]:
+        return self._json("GET", "/health")
+
+    def submit(
+        self,
+        user_input: dict[str, any],
+        engine: str = "single",
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        save_to_file: bool = True,
+    ) -> dict[str, any]:
+        """작업을 제출하고 작업 정보(`id`, `status` 등)를 반환합니다."""
+        body = {
+            "user_input": user_input,
+            "engine": engine,
+            "use_cache": use_cache,
+            "refresh_cache": refresh_cache,
+            "save_to_file": save_to_file,
+        }
+        return self._json("POST", "/jobs", body)
+
+    def status(self, job_id: str, offset: int = 0) -> dict[str, any]:
+        """작업 상태와 `offset`번째 이후의 출력 조각을 반환합니다."""
+        return self._json("GET", f"/jobs/{quote(job_id)}?offset={offset}")
+
+    def result(self, job_id: str) -> str:
+        """완료된 작업의 전체 마크다운을 반환합니다."""
+        status, text = self._request("GET", f"/jobs/{quote(job_id)}/result")
+        if status >= 400:
+            raise JobClientError(self._parse(status, text).get("error", f"HTTP {status}"), status)
+        return text
+
+    def cancel(self, job_id: str) -> dict[str, any]:
+        return self._json("DELETE", f"/jobs/{quote(job_id)}")
+
+    def stream(
+        self,
+        job_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> Iterator[str]:
+        """작업이 끝날 때까지 상태를 확인하며 새 출력 조각을 순서대로 반환합니다.
+
+        Raises:
+            JobClientError: 작업이 실패하거나 취소된 경우.
+        """
+        offset = 0
+        stage = None
+        while True:
+            job = self.status(job_id, offset)
+            yield from job["output"]
+            offset = job["next_offset"]
+            if progress_callback is not None and job["stage"] and job["stage"] != stage:
+                stage = job["stage"]
+                progress_callback(stage)
+            if job["status"] == "failed":
+                raise JobClientError(job["error"] or "작업이 실패했습니다.", "failed")
+            if job["status"] == "cancelled":
+                raise JobClientError("작업이 취소되었습니다.", "cancelled")
+            if job["status"] in FINISHED_JOB_STATES:
+                return
+            time.sleep(poll_interval)
@@ -0,0 +1,196 @@
+"""프로세스가 중단되어도 유실되지 않는 SQLite 기반 발행 작업 대기열입니다."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+DEFAULT_QUEUE_PATH = ".blog_genie_publish.sqlite3"
+DEFAULT_LEASE_SECONDS = 300
+
+JOB_STATUSES = ("pending", "in_progress", "done", "failed")
+
+
+@dataclass
+class PublishJob:
+    """대기열에 저장된 발행 작업 하나입니다."""
+
+    id: int
+    platform: str
+    payload: dict[str, any]
+    idempotency_key: str
+    attempts: int
+    status: str = "pending"
+    remote_url: str | None = None
+    last_error: str | None = None
+
+
+def make_idempotency_key(platform: str, payload: dict[str, any]) -> str:
+    """플랫폼과 요청 본문으로 작업의 멱등성 키를 계산합니다. 같은 게시물은 항상 같은 키를 가집니다."""
+    canonical = json.dumps({"platform": platform, "payload": payload}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class PublishQueue:
+    """발행 작업을 SQLite에 저장하고 임대(lease) 방식으로 작업자에게 나눠줍니다.
+
+    작업을 가져가면 `lease_seconds` 동안 다른 작업자가 가져갈 수 없으며, 작업자가
+    완료/실패를 기록하기 전에 중단되면 임대가 끝난 뒤 다시 처리됩니다.
+
+    Args:
+        path: SQLite 데이터베이스 파일 경로.
+        lease_seconds: 가져간 작업의 임대 시간(초).
+    """
+
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    locked_until REAL NOT NULL DEFAULT 0,
+                    remote_url TEXT,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs(status, next_attempt_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per operation keeps the queue usable from worker threads and processes
+        return sqlite3.connect(self.path, timeout=30)
+
+    def enqueue(self, platform: str, payload: dict[str, any], idempotency_key: str | None = None) -> int:
+        """작업을 추가하고 작업 ID를 반환합니다. 같은 멱등성 키의 작업이 이미 있으면 그 ID를 반환합니다."""
+        key = idempotency_key or make_idempotency_key(platform, payload)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT OR IGNORE INTO jobs (platform, payload, idempotency_key, next_attempt_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (platform, json.dumps(payload, ensure_ascii=False), key, now, now, now),
+            )
+            return conn.execute("SELECT id FROM jobs WHERE idempotency_key = ?", (key,)).fetchone()[0]
+
+    def claim(self, limit: int = 10, platform: str | None = None) -> list[PublishJob]:
+        """처리할 때가 된 작업을 최대 `limit`개 가져오고 임대합니다. 임대가 끝난 진행 중 작업도 포함합니다."""
+        now = time.time()
+        query = """SELECT id, platform, payload, idempotency_key, attempts FROM jobs
+            WHERE ((status = 'pending' AND next_attempt_at <= ?) OR (status = 'in_progress' AND locked_until <= ?))"""
+        params: list[any] = [now, now]
+        if platform is not None:
+            query += " AND platform = ?"
+            params.append(platform)
+        query += " ORDER BY next_attempt_at, id LIMIT ?"
+        params.append(limit)
+
+        with self._lock, self._connect() as conn:
+            # BEGIN IMMEDIATE keeps two processes from claiming the same rows
+            conn.isolation_level = None
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(query, params).fetchall()
+                conn.executemany(
+                    """UPDATE jobs SET status = 'in_progress', attempts = attempts + 1, locked_until = ?, updated_at = ?
+                    WHERE id = ?""",
+                    [(now + self.lease_seconds, now, row[0]) for row in rows],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return [
+            PublishJob(id=row[0], platform=row[1], payload=json.loads(row[2]), idempotency_key=row[3], attempts=row[4] + 1, status="in_progress")
+            for row in rows
+        ]
+
+    def complete(self, job_id: int, remote_url: str | None = None) -> None:
+        """작업을 완료로 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'done', remote_url = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+                (remote_url, time.time(), job_id),
+            )
+
+    def retry_later(self, job_id: int, error: str, delay_seconds: float) -> None:
+        """작업을 `delay_seconds` 뒤에 다시 처리하도록 대기 상태로 되돌립니다."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """UPDATE jobs SET status = 'pending', last_error = ?, next_attempt_at = ?, locked_until = 0, updated_at = ?
+                WHERE id = ?""",
+                (error, now + delay_seconds, now, job_id),
+            )
+
+    def fail(self, job_id: int, error: str) -> None:
+        """작업을 더 이상 재시도하지 않는 실패로 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', last_error = ?, locked_until = 0, updated_at = ? WHERE id = ?",
+                (error, time.time(), job_id),
+            )
+
+    def get(self, job_id: int) -> PublishJob | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                """SELECT id, platform, payload, idempotency_key, attempts, status, remote_url, last_error
+                FROM jobs WHERE id = ?""",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return PublishJob(row[0], row[1], json.loads(row[2]), row[3], row[4], row[5], row[6], row[7])
+
+    def next_due_in(self, platforms: Iterable[str] | None = None) -> float | None:
+        """다음으로 처리할 수 있는 작업까지 남은 시간(초)을 반환합니다. 남은 작업이 없으면 None입니다.
+
+        Args:
+            platforms: 지정하면 해당 플랫폼의 작업만 고려합니다.
+        """
+        query = """SELECT MIN(CASE WHEN status = 'pending' THEN next_attempt_at ELSE locked_until END)
+            FROM jobs WHERE status IN ('pending', 'in_progress')"""
+        params: list[str] = []
+        if platforms is not None:
+            params = list(platforms)
+            query += f" AND platform IN ({', '.join('?' * len(params))})"
+        with self._connect() as conn:
+            row = conn.execute(query, params).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def stats(self) -> dict[str, int]:
+        """상태별 작업 수를 반환합니다."""
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return {status: counts.get(status, 0) for status in JOB_STATUSES}
+
+
+_default_queue: PublishQueue | None = None
+_default_queue_lock = threading.Lock()
+
+
+def get_publish_queue() -> PublishQueue:
+    """`BLOG_GENIE_PUBLISH_QUEUE_PATH` 설정을 반영한 프로세스 공용 발행 대기열을 반환합니다."""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = PublishQueue(os.getenv("BLOG_GENIE_PUBLISH_QUEUE_PATH", DEFAULT_QUEUE_PATH))
+        return _default_queue
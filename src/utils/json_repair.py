@@ -0,0 +1,96 @@
+"""거의 유효한 JSON 응답을 복구하는 관대한 파서입니다."""
+
+import json
+
+
+def repair_json(text: str) -> tuple[any, bool]:
+    """앞뒤 설명 문장, 후행 쉼표, 잘린 출력을 가진 JSON 객체를 복구합니다.
+
+    첫 `{`부터 최상위 객체가 닫힐 때까지만 읽으며, 문자열 안의 줄바꿈은
+    이스케이프합니다. 출력이 중간에 잘린 경우 마지막으로 완성된 값까지만
+    남기고 열린 배열과 객체를 닫습니다.
+
+    Args:
+        text: 모델이 반환한 원본 응답 텍스트.
+
+    Returns:
+        `(파싱된 값, 잘림 여부)` 튜플. 잘림 여부가 True이면 일부 내용이 누락된 것입니다.
+
+    Raises:
+        ValueError: JSON 객체의 시작을 찾을 수 없거나 복구 후에도 파싱할 수 없는 경우.
+    """
+    start = text.find('{')
+    if start < 0:
+        raise ValueError("JSON 객체의 시작('{')을 찾을 수 없습니다.")
+
+    out: list[str] = []
+    # Each frame remembers where its last complete element ends in `out`
+    stack: list[dict[str, any]] = []
+    in_string = False
+    escape = False
+
+    for c in text[start:]:
+        if in_string:
+            if escape:
+                escape = False
+                out.append(c)
+            elif c == '\\':
+                escape = True
+                out.append(c)
+            elif c == '"':
+                in_string = False
+                out.append(c)
+                frame = stack[-1]
+                if not (frame['closer'] == '}' and frame['expect_key']):
+                    frame['safe'] = len(out)
+            elif c == '\n':
+                out.append('\\n')
+            elif c == '\r':
+                out.append('\\r')
+            elif c == '\t':
+                out.append('\\t')
+            else:
+                out.append(c)
+            continue
+
+        if c == '"':
+            in_string = True
+            out.append(c)
+        elif c == '{' or c == '[':
+            out.append(c)
+            stack.append({'closer': '}' if c == '{' else ']', 'safe': len(out), 'expect_key': c == '{'})
+        elif c == '}' or c == ']':
+            _strip_trailing_separators(out)
+            frame = stack.pop()
+            out.append(frame['closer'])
+            if not stack:
+                break
+            stack[-1]['safe'] = len(out)
+        elif c == ',':
+            _strip_trailing_separators(out)
+            stack[-1]['safe'] = len(out)
+            stack[-1]['expect_key'] = True
+            out.append(c)
+        elif c == ':':
+            stack[-1]['expect_key'] = False
+            out.append(c)
+        else:
+            out.append(c)
+
+    truncated = bool(stack)
+    if truncated:
+        del out[stack[-1]['safe']:]
+        _strip_trailing_separators(out)
+        for frame in reversed(stack):
+            out.append(frame['closer'])
+
+    try:
+        return json.loads(''.join(out)), truncated
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON 복구 실패: {e}")
+
+
+def _strip_trailing_separators(out: list[str]) -> None:
+    """출력 끝의 공백과 쉼표를 제거합니다. (후행 쉼표 처리)"""
+    while out and (out[-1] == ',' or out[-1].isspace()):
+        out.pop()
@@ -0,0 +1,143 @@
+"""스트리밍 응답에서 블로그 JSON을 점진적으로 파싱하는 유틸리티입니다."""
+
+import json
+
+from src.utils.json_repair import repair_json
+
+
+class IncrementalBlogParser:
+    """청크 단위로 도착하는 블로그 JSON에서 완성된 필드를 즉시 추출합니다.
+
+    전체 응답을 기다리지 않고 `title`, `meta_description`, `body`의 각 단락,
+    `tags`가 완성되는 시점마다 이벤트를 반환합니다. 첫 `{` 이전의 텍스트
+    (예: ```json 코드 펜스)와 최상위 객체가 닫힌 이후의 텍스트는 무시합니다.
+
+    이벤트는 `(종류, 값)` 튜플이며 종류는 "title", "meta_description",
+    "section", "tags" 중 하나입니다. 후행 쉼표나 이스케이프되지 않은 줄바꿈처럼
+    거의 유효한 값은 `repair_json`으로 복구하고, 복구할 수 없는 값은 이벤트 없이
+    건너뜁니다. 건너뛴 필드는 전체 응답을 받은 뒤의 복구 단계에서 다시 처리됩니다.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack: list[dict[str, any]] = []
+        self._started = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self.finished = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 입력된 전체 응답 텍스트입니다."""
+        return self._text
+
+    def feed(self, chunk: str) -> list[tuple[str, any]]:
+        """새 청크를 입력하고 이번 청크로 완성된 이벤트 목록을 반환합니다."""
+        self._text += chunk
+        events = []
+        text = self._text
+
+        while self._pos < len(text) and not self.finished:
+            i = self._pos
+            c = text[i]
+            self._pos += 1
+
+            if not self._started:
+                if c == '{':
+                    self._started = True
+                    self._push('object', (), i)
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._on_string_end(text[self._string_start:i + 1], events)
+                continue
+
+            frame = self._stack[-1]
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c == '{' or c == '[':
+                self._push('object' if c == '{' else 'array', self._child_path(), i)
+            elif c == '}' or c == ']':
+                self._stack.pop()
+                self._on_value(frame['path'], text[frame['start']:i + 1], events)
+                if not self._stack:
+                    self.finished = True
+            elif c == ':':
+                frame['expect_key'] = False
+            elif c == ',':
+                if frame['type'] == 'object':
+                    frame['expect_key'] = True
+                else:
+                    frame['index'] += 1
+
+        return events
+
+    def _push(self, container_type: str, path: tuple, start: int) -> None:
+        self._stack.append({
+            'type': container_type,
+            'path': path,
+            'start': start,
+            'key': None,
+            'index': 0,
+            'expect_key': container_type == 'object',
+        })
+
+    def _child_path(self) -> tuple:
+        frame = self._stack[-1]
+        if frame['type'] == 'object':
+            return frame['path'] + (frame['key'],)
+        return frame['path'] + (frame['index'],)
+
+    def _on_string_end(self, raw: str, events: list[tuple[str, any]]) -> None:
+        frame = self._stack[-1]
+        if frame['type'] == 'object' and frame['expect_key']:
+            try:
+                frame['key'] = _load_value(raw)
+            except ValueError:
+                frame['key'] = None
+        else:
+            self._on_value(self._child_path(), raw, events)
+
+    def _on_value(self, path: tuple, raw: str, events: list[tuple[str, any]]) -> None:
+        if path not in (('title',), ('meta_description',), ('tags',)) and not (
+            len(path) == 2 and path[0] == 'body' and isinstance(path[1], int)
+        ):
+            return
+        try:
+            value = _load_value(raw)
+        except ValueError:
+            return
+        if path[0] == 'body':
+            if isinstance(value, dict):
+                events.append(('section', value))
+        elif path == ('tags',):
+            if isinstance(value, str):
+                value = [tag.strip() for tag in value.split(',')]
+            events.append(('tags', value))
+        else:
+            events.append((path[0], value))
+
+
+def _load_value(raw: str) -> any:
+    """JSON 값 하나를 파싱하고, 실패하면 `repair_json`으로 복구합니다.
+
+    Raises:
+        ValueError: 복구 후에도 파싱할 수 없는 경우.
+    """
+    try:
+        return json.loads(raw)
+    except ValueError:
+        # repair_json only accepts objects, so wrap strings and arrays in one
+        value, _ = repair_json(f'{{"value": {raw}}}')
+        if not isinstance(value, dict) or 'value' not in value:
+            raise ValueError(f"JSON 값을 복구할 수 없습니다: {raw[:50]}")
+        return value['value']
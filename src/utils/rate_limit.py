@@ -0,0 +1,86 @@
+"""API 호출 빈도를 제한하기 위한 유틸리티입니다."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class AsyncRateLimiter:
+    """분당 요청 수를 제한하는 비동기 슬라이딩 윈도우 리미터입니다.
+
+    Args:
+        requests_per_minute: 60초 동안 허용되는 최대 요청 수. 0 이하이면 제한하지 않습니다.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, requests_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self._timestamps: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """요청 예산이 생길 때까지 대기한 뒤 요청 1회를 기록합니다."""
+        if self.requests_per_minute <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.WINDOW_SECONDS:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.requests_per_minute:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(self.WINDOW_SECONDS - (now - self._timestamps[0]))
+
+
+class TokenBucket:
+    """1분에 `rate_per_minute`만큼 채워지는 스레드 안전한 토큰 버킷입니다.
+
+    요청 수(RPM)와 토큰 수(TPM) 예산을 각각 버킷 하나로 나타냅니다. 기다리지 않고 남은 대기 시간만
+    계산하므로 호출자가 여러 버킷 중 여유가 있는 것을 고를 수 있습니다.
+
+    Args:
+        rate_per_minute: 1분 동안 채워지는 양이자 버킷 크기. 0 이하이면 제한하지 않습니다.
+        clock: 현재 시각(초)을 반환하는 함수.
+    """
+
+    def __init__(self, rate_per_minute: float, clock=time.monotonic):
+        self.capacity = float(rate_per_minute)
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.capacity / 60.0)
+        self._updated = now
+
+    def wait_time(self, amount: float = 1) -> float:
+        """`amount`만큼 꺼낼 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        if self.capacity <= 0:
+            return 0.0
+        # A request larger than the whole bucket would otherwise never fit
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            return max(0.0, (amount - self._level) * 60.0 / self.capacity)
+
+    def consume(self, amount: float = 1) -> None:
+        """`amount`만큼 꺼냅니다. 잔량은 음수가 될 수 있고 음수인 `amount`는 되돌려 받습니다."""
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._level = min(self.capacity, self._level - amount)
+
+    def utilisation(self) -> float:
+        """최근 1분 예산 중 사용 중인 비율(0~1)을 반환합니다."""
+        if self.capacity <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            return min(1.0, max(0.0, 1.0 - self._level / self.capacity))
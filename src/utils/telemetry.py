@@ -0,0 +1,260 @@
+"""파이프라인 단계별 소요 시간, 토큰 사용량, 재시도 횟수를 집계하고 구조화 로그로 남깁니다."""
+
+import contextvars
+import json
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "blog_genie"
+# Every logger in this project lives under the `src` package
+ROOT_LOGGER_NAME = "src"
+
+# Token usage of the current post; asyncio tasks and to_thread calls share the same dict
+_current_usage: contextvars.ContextVar[dict[str, any] | None] = contextvars.ContextVar("blog_genie_usage", default=None)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON 객체로 변환합니다. `extra={"fields": {...}}`의 값도 포함합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(verbose: bool = False, jsonl_path: str | None = None) -> None:
+    """콘솔 로그 수준을 설정하고, 경로가 주어지면 모든 로그와 단계 기록을 JSONL 파일로 남깁니다.
+
+    Args:
+        verbose: True이면 콘솔에 DEBUG 로그까지 출력합니다.
+        jsonl_path: 구조화 로그를 추가할 파일 경로. None이면 파일로 남기지 않습니다.
+    """
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(logging.DEBUG)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    console = logging.StreamHandler()
+    console.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    console.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    root.addHandler(console)
+
+    if jsonl_path:
+        file_handler = logging.FileHandler(jsonl_path, encoding="utf-8")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(JsonLinesFormatter())
+        root.addHandler(file_handler)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """표본의 q 백분위수(0~100)를 최근접 순위 방식으로 계산합니다. 표본이 없으면 0을 반환합니다."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels) + "}"
+
+
+class Telemetry:
+    """단계(span)별 소요 시간과 이름/레이블별 카운터를 스레드 안전하게 집계합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: dict[str, dict[str, float]] = {}
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._gauge_sources: dict[str, Callable[[], list[tuple[str, dict[str, any], float]]]] = {}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    @contextmanager
+    def span(self, name: str, **attributes: any) -> Iterator[None]:
+        """블록의 실행 시간을 `name` 단계로 기록하고 구조화 로그에 남깁니다. 예외는 그대로 전파됩니다."""
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                stats = self._spans.setdefault(name, {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+                stats["count"] += 1
+                stats["errors"] += status == "error"
+                stats["total_seconds"] += duration
+                stats["max_seconds"] = max(stats["max_seconds"], duration)
+            logger.debug(
+                "span %s %.1fms",
+                name,
+                duration * 1000,
+                extra={"fields": {"event": "span", "span": name, "duration_ms": round(duration * 1000, 3), "status": status, **attributes}},
+            )
+
+    def incr(self, name: str, value: float = 1, **labels: any) -> None:
+        """카운터 `name`을 `value`만큼 증가시킵니다."""
+        key = (name, tuple(sorted((label, str(label_value)) for label, label_value in labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def record_usage(self, response: any, stage: str, model_name: str | None = None) -> None:
+        """Gemini 응답의 `usage_metadata`에서 프롬프트/응답 토큰 수를 읽어 누적합니다.
+
+        `model_name`이 주어지면 `track_usage` 블록의 `models`에 응답한 모델로 기록합니다.
+        """
+        usage_totals = _current_usage.get()
+        if model_name and usage_totals is not None:
+            with self._lock:
+                if model_name not in usage_totals["models"]:
+                    usage_totals["models"].append(model_name)
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+        response_tokens = getattr(usage, "candidates_token_count", 0) or 0
+        self.incr("llm_tokens", prompt_tokens, stage=stage, kind="prompt")
+        self.incr("llm_tokens", response_tokens, stage=stage, kind="response")
+        if usage_totals is not None:
+            with self._lock:
+                usage_totals["prompt_tokens"] += prompt_tokens
+                usage_totals["response_tokens"] += response_tokens
+        logger.debug(
+            "usage %s prompt=%d response=%d",
+            stage,
+            prompt_tokens,
+            response_tokens,
+            extra={"fields": {"event": "usage", "stage": stage, "prompt_tokens": prompt_tokens, "response_tokens": response_tokens}},
+        )
+
+    def register_gauges(self, source_name: str, source: Callable[[], list[tuple[str, dict[str, any], float]]]) -> None:
+        """내보낼 때마다 현재 값을 읽어 올 게이지 목록 함수를 등록합니다. 같은 이름으로 다시 등록하면 교체됩니다.
+
+        `source`는 `(이름, 레이블, 값)` 튜플 목록을 반환하며, 집계를 초기화해도 등록은 유지됩니다.
+        """
+        with self._lock:
+            self._gauge_sources[source_name] = source
+
+    @contextmanager
+    def track_usage(self) -> Iterator[dict[str, any]]:
+        """블록 안에서 기록된 토큰 사용량만 따로 모은 딕셔너리를 제공합니다. (게시물 하나의 사용량 기록용)
+
+        `prompt_tokens`, `response_tokens`와 실제로 응답한 모델 이름 목록 `models`를 담습니다.
+        동시에 실행되는 다른 파이프라인의 사용량은 포함되지 않습니다.
+        """
+        usage_totals = {"prompt_tokens": 0, "response_tokens": 0, "models": []}
+        previous = _current_usage.get()
+        _current_usage.set(usage_totals)
+        try:
+            yield usage_totals
+        finally:
+            # set() instead of reset(): a streaming generator may be closed from another context
+            _current_usage.set(previous)
+
+    def snapshot(self) -> dict[str, any]:
+        """현재까지의 집계를 JSON으로 직렬화 가능한 딕셔너리로 반환합니다."""
+        with self._lock:
+            spans = {name: dict(stats) for name, stats in sorted(self._spans.items())}
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            sources = list(self._gauge_sources.values())
+        gauges = [
+            {"name": name, "labels": {label: str(value) for label, value in labels.items()}, "value": value}
+            for source in sources
+            for name, labels, value in source()
+        ]
+        return {"spans": spans, "counters": counters, "gauges": gauges}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 집계를 반환합니다."""
+        snapshot = self.snapshot()
+        span_metric = f"{METRIC_PREFIX}_span_seconds"
+        lines = [f"# TYPE {span_metric} summary"]
+        for name, stats in snapshot["spans"].items():
+            labels = _label_text((("span", name),))
+            lines.append(f"{span_metric}_count{labels} {stats['count']}")
+            lines.append(f"{span_metric}_sum{labels} {stats['total_seconds']:.6f}")
+        lines.append(f"# TYPE {span_metric}_max gauge")
+        for name, stats in snapshot["spans"].items():
+            lines.append(f"{span_metric}_max{_label_text((('span', name),))} {stats['max_seconds']:.6f}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_span_errors_total counter")
+        for name, stats in snapshot["spans"].items():
+            lines.append(f"{METRIC_PREFIX}_span_errors_total{_label_text((('span', name),))} {stats['errors']}")
+
+        declared = set()
+        for counter in snapshot["counters"]:
+            metric = f"{METRIC_PREFIX}_{counter['name']}_total"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} counter")
+                declared.add(metric)
+            value = counter["value"]
+            lines.append(f"{metric}{_label_text(tuple(counter['labels'].items()))} {int(value) if value == int(value) else value}")
+
+        declared = set()
+        # Samples of one metric must be contiguous, while sources list them per labelled object
+        for gauge in sorted(snapshot["gauges"], key=lambda gauge: gauge["name"]):
+            metric = f"{METRIC_PREFIX}_{gauge['name']}"
+            if metric not in declared:
+                lines.append(f"# TYPE {metric} gauge")
+                declared.add(metric)
+            lines.append(f"{metric}{_label_text(tuple(sorted(gauge['labels'].items())))} {gauge['value']:g}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """집계를 파일로 저장합니다. 확장자가 `.prom`/`.txt`이면 Prometheus 형식, 그 외에는 JSON입니다."""
+        content = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def format(self) -> str:
+        """사람이 읽기 쉬운 단계별 소요 시간과 토큰 사용량 요약을 반환합니다."""
+        snapshot = self.snapshot()
+        lines = ["단계별 소요 시간:"]
+        for name, stats in snapshot["spans"].items():
+            average_ms = stats["total_seconds"] / stats["count"] * 1000
+            lines.append(f"  {name}: {stats['count']}회, 평균 {average_ms:.1f}ms, 최대 {stats['max_seconds'] * 1000:.1f}ms")
+        tokens = {"prompt": 0, "response": 0}
+        for counter in snapshot["counters"]:
+            if counter["name"] == "llm_tokens":
+                tokens[counter["labels"]["kind"]] += counter["value"]
+        lines.append(f"토큰 사용량: 프롬프트 {int(tokens['prompt'])}, 응답 {int(tokens['response'])}")
+        if snapshot["gauges"]:
+            lines.append("현재 상태:")
+            for gauge in snapshot["gauges"]:
+                labels = ", ".join(f"{label}={value}" for label, value in gauge["labels"].items())
+                lines.append(f"  {gauge['name']}{f' ({labels})' if labels else ''}: {gauge['value']:g}")
+        return "\n".join(lines)
+
+
+TELEMETRY = Telemetry()
@@ -0,0 +1,44 @@
+"""대량 생성(batch) 기능에 대한 테스트 코드입니다."""
+
+import asyncio
+import json
+
+from src.core import batch
+
+
+def test_load_batch_rows_from_csv(tmp_path):
+    """CSV 행을 읽고 소제목 개수를 정수로 변환하는지 테스트합니다."""
+    path = tmp_path / "keywords.csv"
+    path.write_text("keyword,num_subheadings\n파이썬,3\n자바,\n", encoding="utf-8")
+
+    rows = batch.load_batch_rows(str(path))
+
+    assert rows == [{"keyword": "파이썬", "num_subheadings": 3}, {"keyword": "자바"}]
+
+
+def test_run_batch_skips_completed_rows(tmp_path, monkeypatch):
+    """진행 상황 파일에 완료로 기록된 행은 다시 실행하지 않는지 테스트합니다."""
+    calls = []
+
+    async def fake_pipeline(user_input, save_to_file, rate_limiter, use_cache, refresh_cache, engine):
+        calls.append(user_input["keyword"])
+        if user_input["keyword"] == "실패":
+            raise RuntimeError("boom")
+        return "# ok"
+
+    monkeypatch.setattr(batch, "run_blog_post_pipeline_async", fake_pipeline)
+    rows = [{"keyword": "파이썬"}, {"keyword": "자바"}, {"keyword": "실패"}]
+    progress_path = tmp_path / "progress.jsonl"
+    progress_path.write_text(
+        json.dumps({"key": batch.row_key(rows[0]), "status": "done"}) + "\n",
+        encoding="utf-8",
+    )
+
+    summary = asyncio.run(batch.run_batch_async(rows, concurrency=2, progress_path=str(progress_path)))
+
+    assert sorted(calls) == ["실패", "자바"]
+    assert (summary.skipped, summary.succeeded, summary.failed) == (1, 1, 1)
+    assert batch.BatchProgress(str(progress_path)).completed == {
+        batch.row_key(rows[0]),
+        batch.row_key(rows[1]),
+    }
@@ -0,0 +1,91 @@
+"""콘텐츠 생성 및 마크다운 변환 기능에 대한 테스트 코드입니다."""
+
+import json
+from types import SimpleNamespace
+
+from src.core import content_generator
+from src.utils.cache import ResponseCache
+
+POST = {
+    "title": "파이썬 입문",
+    "meta_description": "파이썬 안내",
+    "body": [
+        {"subtitle": "소개", "content": "내용 1", "image_keyword": None},
+        {"subtitle": "설치", "content": "내용 2", "image_keyword": "설치 화면"},
+    ],
+    "tags": ["파이썬", "입문"],
+}
+
+
+def test_markdown_stream_matches_markdown_content():
+    """스트리밍 마크다운 결과가 일괄 생성 결과와 같은지 테스트합니다."""
+    events = [
+        ("title", POST["title"]),
+        ("meta_description", POST["meta_description"]),
+        *[("section", section) for section in POST["body"]],
+        ("tags", POST["tags"]),
+        ("done", POST),
+    ]
+
+    streamed = "".join(content_generator.generate_markdown_stream(events)).strip()
+
+    assert streamed == content_generator.generate_markdown_content(POST)
+
+
+class FakeModel:
+    """미리 정한 응답을 순서대로 반환하고 호출된 프롬프트를 기록하는 가짜 모델입니다."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def generate_content(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        return SimpleNamespace(text=self.responses.pop(0))
+
+
+def test_truncated_response_requests_only_missing_sections(tmp_path, monkeypatch):
+    """잘린 응답은 완성된 단락을 유지하고 누락된 부분만 추가 요청하는지 테스트합니다."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(content_generator, "get_response_cache", lambda: cache)
+    truncated = (
+        '{"title": "파이썬", "meta_description": "설명", "body": ['
+        '{"subtitle": "소개", "content": "' + "가" * 200 + '", "image_keyword": null}, '
+        '{"subtitle": "설치", "content": "잘린 내'
+    )
+    continuation = json.dumps({
+        "body": [{"subtitle": "정리", "content": "나" * 200, "image_keyword": None}],
+        "tags": "파이썬, 입문",
+    }, ensure_ascii=False)
+    model = FakeModel([truncated, continuation])
+    monkeypatch.setattr(content_generator, "create_llm_model", lambda model_name=None: model)
+    stats = content_generator.GenerationStats()
+    monkeypatch.setattr(content_generator, "GENERATION_STATS", stats)
+
+    post = content_generator.generate_blog_content({"keyword": "파이썬", "num_subheadings": 0}, "", use_cache=False)
+
+    assert [section["subtitle"] for section in post["body"]] == ["소개", "정리"]
+    assert post["tags"] == ["파이썬", "입문"]
+    assert "단락 1개" in model.prompts[1] and "- 소개" in model.prompts[1]
+    assert (stats.continued, stats.retries) == (1, 0)
+
+
+
+def test_stream_continues_truncated_cached_response(tmp_path, monkeypatch):
+    """캐시된 응답이 잘려 있으면 그때 모델을 만들어 누락된 부분만 추가 요청하는지 테스트합니다."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(content_generator, "get_response_cache", lambda: cache)
+    user_input = {"keyword": "파이썬", "num_subheadings": 0}
+    prompt = content_generator.build_blog_prompt(user_input, "")
+    model_name = content_generator.current_model_name(content_generator.select_model_name(user_input))
+    key = ResponseCache.make_key(prompt, model_name, content_generator.GENERATION_CONFIG)
+    cache.put(key, '{"title": "파이썬", "meta_description": "설명", "body": [{"subtitle": "소개", "content": "' + "가" * 200 + '"}, {"subtitle": "설')
+    continuation = json.dumps({"body": [{"subtitle": "정리", "content": "나" * 200}], "tags": "파이썬"}, ensure_ascii=False)
+    model = FakeModel([continuation])
+    monkeypatch.setattr(content_generator, "create_llm_model", lambda model_name=None: model)
+
+    events = list(content_generator.generate_blog_content_stream(user_input, ""))
+
+    assert [value["subtitle"] for kind, value in events if kind == "section"] == ["소개", "정리"]
+    assert ("tags", ["파이썬"]) in events
+    assert len(model.prompts) == 1
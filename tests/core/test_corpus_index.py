@@ -0,0 +1,98 @@
+"""로컬 문서 색인 기능에 대한 테스트 코드입니다."""
+
+import os
+
+from src.core.corpus_index import (
+    CorpusIndex,
+    estimate_tokens,
+    get_corpus_index,
+    split_into_chunks,
+)
+
+
+def write(path, text, mtime):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_update_reindexes_changed_files_and_removes_deleted(tmp_path):
+    """변경된 문서만 다시 색인하고 삭제된 문서는 제거하며, 색인이 디스크에 유지되는지 테스트합니다."""
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    write(corpus / "python.md", "파이썬은 배우기 쉬운 언어입니다.\n\n가상 환경은 venv로 만듭니다.", 1000)
+    write(corpus / "rust.txt", "러스트는 메모리 안전성을 보장합니다.", 1000)
+    write(corpus / "image.png", "not indexed", 1000)
+
+    index = CorpusIndex(str(tmp_path / "index.sqlite3"))
+    assert index.update(str(corpus)) == (2, 0)
+    assert index.update(str(corpus)) == (0, 0)
+
+    write(corpus / "python.md", "파이썬 3.12에서 오류 메시지가 개선되었습니다.", 2000)
+    os.remove(corpus / "rust.txt")
+    assert index.update(str(corpus)) == (1, 1)
+    assert len(index) == 1
+    index.close()
+
+    # The index persists on disk, so a fresh instance has nothing to reindex
+    reopened = CorpusIndex(str(tmp_path / "index.sqlite3"))
+    assert reopened.update(str(corpus)) == (0, 0)
+    assert [path for _, path, _ in reopened.search("파이썬")] == [str(corpus / "python.md")]
+
+
+def test_search_matches_korean_words_with_particles_and_ranks_by_relevance():
+    """조사가 붙은 한글 단어도 찾고, 관련도 순으로 정렬하는지 테스트합니다."""
+    index = CorpusIndex()
+    index.add_document("a.md", "파이썬은 파이썬을 위한 파이썬의 언어입니다. asyncio 이벤트 루프.")
+    index.add_document("b.md", "자바스크립트와 파이썬을 비교합니다.")
+    index.add_document("c.md", "러스트 소유권 모델.")
+
+    results = index.search("파이썬 asyncio")
+    assert [path for _, path, _ in results] == ["a.md", "b.md"]
+    assert results[0][0] > results[1][0]
+    assert index.search("!!!") == []
+
+
+def test_build_context_respects_token_budget():
+    """검색된 청크로 만든 컨텍스트가 토큰 예산을 넘지 않는지 테스트합니다."""
+    index = CorpusIndex()
+    for i in range(20):
+        index.add_document(f"doc{i}.md", f"파이썬 문서 {i}번 " + "내용 " * 50)
+
+    context = index.build_context("파이썬", token_budget=300)
+    assert context.startswith("--- [Source: doc")
+    assert 0 < estimate_tokens(context) <= 300 + context.count("--- [Source:")
+    assert index.build_context("없는단어", token_budget=300) == ""
+
+
+def test_split_into_chunks_groups_paragraphs():
+    """문단을 모아 청크 크기를 넘지 않는 청크로 나누는지 테스트합니다."""
+    text = "\n\n".join("가" * 300 for _ in range(5))
+    chunks = split_into_chunks(text, chunk_chars=700)
+    assert len(chunks) == 3
+    assert all(len(chunk.replace("\n", "")) <= 700 for chunk in chunks)
+
+
+def test_split_into_chunks_splits_oversized_paragraphs():
+    """한 문단이 청크 크기보다 길면 문장 경계에서, 문장도 길면 글자 수로 잘리는지 테스트합니다."""
+    sentences = " ".join(f"{i}번째 문장은 여기서 끝납니다." for i in range(40))
+    chunks = split_into_chunks(sentences + "\n\n" + "나" * 1000, chunk_chars=200)
+
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert all(chunk.endswith("끝납니다.") for chunk in chunks if "문장" in chunk)
+    assert "".join(chunks).count("나") == 1000
+
+
+def test_get_corpus_index_picks_up_changes_on_each_call(tmp_path, monkeypatch):
+    """프로세스 안에서 색인을 다시 가져올 때마다 추가/삭제된 문서를 반영하는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_INDEX_DIR", str(tmp_path / "index"))
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    write(corpus / "python.md", "파이썬은 배우기 쉬운 언어입니다.", 1000)
+    assert len(get_corpus_index(str(corpus))) == 1
+
+    write(corpus / "rust.md", "러스트는 메모리 안전성을 보장합니다.", 1000)
+    assert [path for _, path, _ in get_corpus_index(str(corpus)).search("러스트")] == [str(corpus / "rust.md")]
+
+    os.remove(corpus / "python.md")
+    assert get_corpus_index(str(corpus)).search("파이썬") == []
@@ -0,0 +1,114 @@
+"""MinHash/LSH 기반 중복 요청 및 중복 게시물 탐지에 대한 테스트 코드입니다."""
+
+import asyncio
+
+import pytest
+
+from src.core import batch, dedup, pipeline
+
+SETTINGS = {"target_audience": "일반 대중", "tone_of_voice": "전문적", "desired_length": "보통 (800-1500 단어)"}
+
+
+def make_post(topic: str, sentence: str) -> dict:
+    return {
+        "title": f"{topic} 가이드",
+        "meta_description": f"{topic} 설명",
+        "body": [{"subtitle": f"{topic} {i}", "content": f"{sentence} {i}번째 예제를 살펴봅니다. " * 5} for i in range(5)],
+        "tags": [topic],
+    }
+
+
+PYTHON_POST = make_post("파이썬", "파이썬은 들여쓰기로 블록을 구분하고 가상 환경은 venv로 만듭니다.")
+RUST_POST = make_post("러스트", "러스트는 소유권과 빌림 검사기로 메모리 안전성을 보장합니다.")
+
+
+def test_minhash_estimates_jaccard_and_lsh_finds_candidates():
+    """MinHash 추정치가 실제 Jaccard 계수에 가깝고 비슷한 집합만 같은 버킷에 들어가는지 테스트합니다."""
+    hasher = dedup.MinHasher()
+    first = {f"단어{i}" for i in range(200)}
+    second = {f"단어{i}" for i in range(50, 250)}
+    estimate = dedup.MinHasher.similarity(hasher.signature(first), hasher.signature(second))
+    assert abs(estimate - dedup.jaccard(first, second)) < 0.15
+
+    assert dedup.jaccard(dedup.keyword_tokens("파이썬"), dedup.keyword_tokens("파이썬 입문")) == 0.75
+    python_keys = set(enumerate(hasher.band_keys(hasher.signature(dedup.post_shingles(PYTHON_POST)))))
+    rust_keys = set(enumerate(hasher.band_keys(hasher.signature(dedup.post_shingles(RUST_POST)))))
+    assert not python_keys & rust_keys
+
+
+def test_index_flags_similar_requests_and_reports_overlap(tmp_path):
+    """비슷한 키워드 요청과 내용이 겹치는 게시물을 찾고, 설정이 다르면 중복 요청으로 보지 않는지 테스트합니다."""
+    index = dedup.SimilarityIndex(str(tmp_path / "similarity.sqlite3"))
+    index.add_post("python.md", {"keyword": "파이썬", **SETTINGS}, PYTHON_POST)
+    index.add_post("rust.md", {"keyword": "러스트", **SETTINGS}, RUST_POST)
+    index.add_post("python.md", {"keyword": "파이썬", **SETTINGS}, PYTHON_POST)
+
+    [match] = index.find_similar_requests({"keyword": "파이썬 입문", **SETTINGS})
+    assert (match.ref, match.score, match.settings_match) == ("python.md", 0.75, True)
+    [casual] = index.find_similar_requests({"keyword": "파이썬 입문", **SETTINGS, "tone_of_voice": "친근한"})
+    assert not casual.settings_match
+    assert index.find_similar_requests({"keyword": "자바", **SETTINGS}) == []
+
+    [overlap] = index.find_similar_posts(PYTHON_POST)
+    assert (overlap.ref, overlap.score) == ("python.md", 1.0)
+    assert index.find_similar_posts(PYTHON_POST, exclude_ref="python.md") == []
+    assert index.count() == 2
+
+
+def test_pipeline_skips_duplicate_request_before_calling_model(monkeypatch, tmp_path):
+    """`duplicate_policy`가 "skip"이면 모델을 호출하지 않고 건너뛰고, "flag"이면 경고만 하는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    dedup.index_post(str(tmp_path / "python.md"), {"keyword": "파이썬", **SETTINGS}, PYTHON_POST)
+    calls = []
+
+    def fake_generate(user_input, context, use_cache, refresh_cache):
+        calls.append(user_input["keyword"])
+        return RUST_POST
+
+    monkeypatch.setattr(pipeline, "generate_blog_content", fake_generate)
+
+    skipped = pipeline.run_blog_post_pipeline({"keyword": "파이썬 입문", **SETTINGS, "duplicate_policy": "skip"}, save_to_file=False)
+    assert skipped.startswith("# 생성 건너뜀") and "python.md" in skipped and calls == []
+
+    pipeline.run_blog_post_pipeline({"keyword": "파이썬 입문", **SETTINGS, "duplicate_policy": "flag"}, save_to_file=False)
+    pipeline.run_blog_post_pipeline({"keyword": "러스트", **SETTINGS, "duplicate_policy": "skip"}, save_to_file=False)
+    assert calls == ["파이썬 입문", "러스트"]
+
+    with pytest.raises(ValueError):
+        dedup.duplicate_policy({"duplicate_policy": "maybe"})
+
+
+def test_batch_skips_near_duplicate_rows_within_the_batch(monkeypatch, tmp_path):
+    """같은 배치 안의 비슷한 요청은 실행 전에 행끼리 비교하여 건너뛰는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    calls = []
+
+    async def fake_pipeline(user_input, save_to_file, rate_limiter, use_cache, refresh_cache, engine):
+        calls.append(user_input["keyword"])
+        return "# ok"
+
+    monkeypatch.setattr(batch, "run_blog_post_pipeline_async", fake_pipeline)
+    rows = [
+        {"keyword": "파이썬 입문", **SETTINGS},
+        {"keyword": "파이썬", **SETTINGS},
+        {"keyword": "파이썬", **SETTINGS, "tone_of_voice": "친근한"},
+        {"keyword": "자바 입문", **SETTINGS},
+    ]
+
+    summary = asyncio.run(batch.run_batch_async(rows, concurrency=2, duplicate_policy_default="skip"))
+
+    assert sorted(calls) == ["자바 입문", "파이썬", "파이썬 입문"]
+    assert (summary.duplicates, summary.succeeded) == (1, 3)
+    assert dedup.find_similar_within(rows)[1].keyword == "파이썬 입문"
+
+
+def test_sibling_keywords_sharing_a_head_word_are_not_duplicates(tmp_path):
+    """앞 단어만 같은 다른 주제의 키워드는 Jaccard 계수가 기준값이어도 중복으로 보지 않는지 테스트합니다."""
+    siblings = [{"keyword": "파이썬 설치", **SETTINGS}, {"keyword": "파이썬 문법", **SETTINGS}, {"keyword": "파이썬 기초", **SETTINGS}]
+    assert dedup.jaccard(dedup.keyword_tokens("파이썬 설치"), dedup.keyword_tokens("파이썬 문법")) == 0.6
+    assert dedup.find_similar_within(siblings) == {}
+
+    index = dedup.SimilarityIndex(str(tmp_path / "similarity.sqlite3"))
+    index.add_post("install.md", siblings[0], PYTHON_POST)
+    assert index.find_similar_requests(siblings[1]) == []
+    assert [match.ref for match in index.find_similar_requests({"keyword": "파이썬 설치 방법", **SETTINGS})] == ["install.md"]
@@ -0,0 +1,84 @@
+"""개요 기반 병렬 생성 엔진에 대한 테스트 코드입니다."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import fanout
+from src.utils.cache import ResponseCache
+
+OUTLINE = {
+    "title": "파이썬 입문",
+    "meta_description": "파이썬 안내",
+    "sections": [
+        {"subtitle": "소개", "summary": "개요", "image_keyword": None},
+        {"subtitle": "설치", "summary": "설치 방법", "image_keyword": "설치 화면"},
+        {"subtitle": "정리", "summary": "마무리", "image_keyword": None},
+    ],
+    "tags": "파이썬, 입문",
+}
+
+
+class FakeModel:
+    """단락별 호출 횟수를 기록하고, '설치' 단락은 첫 시도에 짧은 응답을 주는 가짜 모델입니다."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        await asyncio.sleep(0.05)
+        if "개요만" in prompt:
+            self.calls.append("outline")
+            return SimpleNamespace(text=json.dumps(OUTLINE, ensure_ascii=False))
+        subtitle = prompt.split("**작성할 단락:** ")[1].split("\n")[0]
+        self.calls.append(subtitle)
+        if subtitle.endswith("설치") and self.calls.count(subtitle) == 1:
+            return SimpleNamespace(text="짧음")
+        return SimpleNamespace(text=f"{subtitle} 내용 " * 20)
+
+
+def test_fanout_regenerates_only_failed_section(tmp_path, monkeypatch):
+    """짧은 단락만 다시 생성하고 결과를 기존 스키마로 조합하는지 테스트합니다."""
+    model = FakeModel()
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(fanout, "create_llm_model", lambda model_name=None: model)
+    monkeypatch.setattr(fanout, "get_response_cache", lambda: cache)
+
+    post = asyncio.run(fanout.generate_blog_content_fanout({"keyword": "파이썬", "num_subheadings": 1}, "파이썬"))
+
+    assert [section["subtitle"] for section in post["body"]] == ["소개", "설치", "정리"]
+    assert post["body"][1]["image_keyword"] == "설치 화면"
+    assert post["tags"] == ["파이썬", "입문"]
+    assert sorted(model.calls) == sorted(["outline", "1. 소개", "2. 설치", "2. 설치", "3. 정리"])
+
+
+def test_failed_section_cancels_the_remaining_sections(tmp_path, monkeypatch):
+    """한 단락이 최종 실패하면 나머지 단락 호출을 취소해 더 이상 모델을 호출하지 않는지 테스트합니다."""
+    calls = []
+    outline = {**OUTLINE, "sections": [{"subtitle": f"단락 {i}", "summary": "요약"} for i in range(6)]}
+
+    class FailingModel:
+        async def generate_content_async(self, prompt, generation_config=None):
+            if "개요만" in prompt:
+                return SimpleNamespace(text=json.dumps(outline, ensure_ascii=False))
+            subtitle = prompt.split("**작성할 단락:** ")[1].split("\n")[0]
+            calls.append(subtitle)
+            if subtitle.endswith("단락 0"):
+                raise RuntimeError("API 오류")
+            await asyncio.sleep(0.2)
+            return SimpleNamespace(text=f"{subtitle} 내용 " * 20)
+
+    monkeypatch.setattr(fanout, "create_llm_model", lambda model_name=None: FailingModel())
+    monkeypatch.setattr(fanout, "get_response_cache", lambda: ResponseCache(str(tmp_path / "cache.sqlite3")))
+
+    async def run():
+        with pytest.raises(fanout.ContentGenerationError):
+            await fanout.generate_blog_content_fanout({"keyword": "파이썬"}, "파이썬", max_parallel=2, use_cache=False)
+        calls_at_failure = len(calls)
+        # The event loop keeps running, as it does for the other posts of a batch
+        await asyncio.sleep(0.5)
+        return calls_at_failure
+
+    assert asyncio.run(run()) == len(calls)
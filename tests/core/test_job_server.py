@@ -0,0 +1,144 @@
+"""상주 서버의 작업 API와 클라이언트에 대한 테스트 코드입니다."""
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from src.core import job_server, pipeline
+from src.utils.job_client import JobClient, JobClientError
+
+# Holds the "실행 중" job inside the single worker until the test releases it
+GATE = threading.Event()
+
+
+def fake_stream(user_input, save_to_file=True, use_cache=True, refresh_cache=False, progress_callback=None, cancel_event=None):
+    for i in range(3):
+        if user_input["keyword"] == "실행 중":
+            GATE.wait(5)
+        if cancel_event.is_set():
+            raise job_server.PipelineCancelledError("취소됨")
+        progress_callback(f"단계 {i}")
+        yield f"조각 {i} "
+    if user_input["keyword"] == "실패":
+        raise ValueError("생성 실패")
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path, request):
+    monkeypatch.setattr(job_server, "run_blog_post_pipeline_stream", fake_stream)
+    manager = job_server.JobManager(workers=1, max_pending=1)
+    address = getattr(request, "param", "127.0.0.1:0")
+    if address == "unix":
+        address = f"unix:{tmp_path / 'blog_genie.sock'}"
+    httpd = job_server.create_server(address, manager)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    if not address.startswith("unix:"):
+        address = f"127.0.0.1:{httpd.server_address[1]}"
+    yield JobClient(address, timeout=5)
+    httpd.shutdown()
+    httpd.server_close()
+    manager.shutdown()
+
+
+@pytest.mark.parametrize("server", ["127.0.0.1:0", "unix"], indirect=True)
+def test_submit_stream_and_fetch_result(server):
+    """작업을 제출하고 출력 조각을 순서대로 받은 뒤 전체 결과를 가져오는지 테스트합니다."""
+    job = server.submit({"keyword": "파이썬"})
+    stages = []
+    chunks = list(server.stream(job["id"], poll_interval=0.01, progress_callback=stages.append))
+
+    assert chunks == ["조각 0 ", "조각 1 ", "조각 2 "]
+    assert stages[-1] == "완료"
+    assert server.result(job["id"]) == "조각 0 조각 1 조각 2"
+    assert server.health()["done"] == 1
+
+
+def test_failures_cancellation_and_backpressure(server):
+    """실패한 작업, 대기 중인 작업 취소, 대기열 초과 시 503 응답을 테스트합니다."""
+    with pytest.raises(JobClientError, match="생성 실패"):
+        list(server.stream(server.submit({"keyword": "실패"})["id"], poll_interval=0.01))
+
+    GATE.clear()
+    running = server.submit({"keyword": "실행 중"})
+    while server.status(running["id"])["status"] != "running":
+        time.sleep(0.01)
+    queued = server.submit({"keyword": "대기"})
+    with pytest.raises(JobClientError) as busy:
+        server.submit({"keyword": "초과"})
+    assert busy.value.status == 503
+
+    assert server.cancel(queued["id"])["status"] == "cancelled"
+    with pytest.raises(JobClientError) as cancelled:
+        list(server.stream(queued["id"], poll_interval=0.01))
+    assert cancelled.value.status == "cancelled"
+
+    GATE.set()
+    assert len(list(server.stream(running["id"], poll_interval=0.01))) == 3
+
+    with pytest.raises(JobClientError) as missing:
+        server.status("999")
+    assert missing.value.status == 404
+    with pytest.raises(JobClientError) as invalid:
+        server.submit({"keyword": ""})
+    assert invalid.value.status == 400
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [b"garbage\r\n\r\n", b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 13\r\n\r\n<html></html>"],
+)
+def test_malformed_responses_raise_job_client_error(reply):
+    """잘못된 상태 줄이나 JSON이 아닌 프록시 오류 페이지도 `JobClientError`로 바뀌는지 테스트합니다."""
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    def reply_once():
+        conn, _ = listener.accept()
+        with conn:
+            conn.recv(65536)
+            conn.sendall(reply)
+
+    thread = threading.Thread(target=reply_once, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(JobClientError):
+            JobClient(f"127.0.0.1:{listener.getsockname()[1]}", timeout=5).health()
+    finally:
+        thread.join(5)
+        listener.close()
+
+
+def test_cancelling_a_running_fanout_job_stops_it_before_saving(monkeypatch):
+    """실행 중인 병렬 생성 작업을 취소하면 진행 중인 호출이 취소되고 저장 없이 "cancelled"로 끝나는지 테스트합니다."""
+    started = threading.Event()
+    stopped = threading.Event()
+    saved = []
+
+    async def slow_fanout(user_input, context, rate_limiter=None, use_cache=True, refresh_cache=False):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        finally:
+            stopped.set()
+
+    async def no_context(user_input):
+        return ""
+
+    monkeypatch.setattr(pipeline, "generate_blog_content_fanout", slow_fanout)
+    monkeypatch.setattr(pipeline, "collect_context_async", no_context)
+    monkeypatch.setattr(pipeline, "save_output", lambda *args: saved.append(args))
+    manager = job_server.JobManager(workers=1)
+    try:
+        job = manager.submit({"keyword": "파이썬", "duplicate_policy": "off"}, engine="fanout")
+        assert started.wait(5)
+        manager.cancel(job.id)
+        job.future.result(5)
+    finally:
+        manager.shutdown()
+
+    assert stopped.is_set()
+    assert job.status == "cancelled"
+    assert saved == [] and job.output == []
@@ -0,0 +1,112 @@
+"""LLM 백엔드와 벤치마크 기능에 대한 테스트 코드입니다."""
+
+import asyncio
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+
+from src.core import content_generator, fanout, llm_backend
+from src.core.benchmark import run_benchmarks
+from src.core.fanout import generate_blog_content_fanout
+from src.utils.cache import ResponseCache
+
+PROMPT = content_generator.build_blog_prompt({"keyword": "파이썬", "num_subheadings": 2}, "파이썬")
+
+
+@pytest.fixture
+def fake_backend(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(content_generator, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(fanout, "get_response_cache", lambda: cache)
+    llm_backend.configure_backend("fake")
+    yield
+    llm_backend.configure_backend("gemini")
+
+
+def test_fake_backend_is_deterministic_and_returns_valid_posts():
+    """같은 시드의 가짜 백엔드가 같은 응답을 내고, 응답이 유효한 게시물인지 테스트합니다."""
+    first = llm_backend.FakeBackend(seed=1).generate_content(PROMPT)
+    second = llm_backend.FakeBackend(seed=1).generate_content(PROMPT)
+
+    assert first.text == second.text
+    post = content_generator.parse_blog_response(first.text)
+    assert len(post["body"]) == 4
+    assert "파이썬" in post["title"]
+    assert first.usage_metadata.prompt_token_count > 0
+
+
+def test_fake_backend_injects_malformed_output_and_rate_limit_errors():
+    """가짜 백엔드가 설정한 비율로 잘못된 출력과 호출 한도 초과 오류를 내는지 테스트합니다."""
+    malformed = llm_backend.FakeBackend(malformed_rate=1.0)
+    outcomes = set()
+    for seed in range(20):
+        malformed.seed = seed
+        _, _, outcome = content_generator._parse_or_salvage(malformed.generate_content(PROMPT).text, {"num_subheadings": 2})
+        outcomes.add(outcome)
+    assert outcomes - {"direct"}
+
+    with pytest.raises(ResourceExhausted):
+        llm_backend.FakeBackend(rate_limit_rate=1.0).generate_content(PROMPT)
+    with pytest.raises(ValueError):
+        llm_backend.configure_backend("unknown")
+
+
+def test_pipeline_generators_run_on_the_fake_backend(fake_backend):
+    """단일/병렬 생성 엔진이 가짜 백엔드로 API 호출 없이 게시물을 생성하는지 테스트합니다."""
+    post = content_generator.generate_blog_content({"keyword": "러스트", "num_subheadings": 1}, "러스트", use_cache=False)
+    assert [section["subtitle"] for section in post["body"]] == ["러스트 소개", "러스트 핵심 1", "러스트 정리"]
+
+    fanout_post = asyncio.run(
+        generate_blog_content_fanout({"keyword": "러스트", "num_subheadings": 1}, "러스트", use_cache=False)
+    )
+    assert len(fanout_post["body"]) == 3
+    assert all(len(section["content"]) >= 100 for section in fanout_post["body"])
+    assert content_generator.current_model_name() == llm_backend.FAKE_MODEL_NAME
+
+
+def test_benchmark_reports_every_scenario(tmp_path, fake_backend):
+    """벤치마크가 모든 시나리오의 결과를 실패 없이 보고하고 파일로 저장하는지 테스트합니다."""
+    output_path = tmp_path / "bench.json"
+    results = run_benchmarks((3,), output_path=str(output_path))
+
+    assert [result.scenario for result in results] == ["single", "batch", "parse", "render", "render:html"]
+    assert all(result.failures == 0 and result.throughput_per_second > 0 for result in results)
+    assert results[0].p95_ms >= results[0].p50_ms
+    assert output_path.exists()
+
+
+def test_backend_is_initialised_once_until_reconfigured(fake_backend):
+    """백엔드가 한 번만 초기화되고, 다시 설정하면 새로 만들어지는지 테스트합니다."""
+    first = content_generator.create_llm_model()
+    assert content_generator.create_llm_model() is first
+
+    llm_backend.configure_backend("fake", seed=3)
+    assert content_generator.create_llm_model() is not first
+
+
+def test_pooled_gemini_keys_use_separate_clients(monkeypatch):
+    """다른 `api_key`로 만든 Gemini 백엔드가 클라이언트를 공유하지 않고 각자의 키로 요청하는지 테스트합니다."""
+    import google.generativeai as genai
+    from google.ai import generativelanguage
+
+    class RecordingClient:
+        def __init__(self, client_options):
+            self.api_key = client_options["api_key"]
+            self.requests = []
+
+        def generate_content(self, request):
+            self.requests.append(request)
+            part = genai.protos.Part(text=f"{self.api_key} 응답")
+            return genai.protos.GenerateContentResponse(candidates=[{"content": {"parts": [part], "role": "model"}}])
+
+    monkeypatch.setattr(generativelanguage, "GenerativeServiceClient", RecordingClient)
+    first = llm_backend.GeminiBackend("gemini-1.5-flash", api_key="key-aaaa")
+    second = llm_backend.GeminiBackend("gemini-1.5-flash", api_key="key-bbbb")
+
+    assert first._client is not second._client
+    assert first.generate_content(PROMPT, content_generator.GENERATION_CONFIG).text == "key-aaaa 응답"
+    assert second.generate_content(PROMPT).text == "key-bbbb 응답"
+    [request] = first._client.requests
+    assert request.model == "models/gemini-1.5-flash"
+    assert request.generation_config.response_mime_type == "application/json"
+    assert len(second._client.requests) == 1
@@ -0,0 +1,155 @@
+"""API 키/모델 라우터의 토큰 버킷 예산, 경로 선택, 장애 시 다른 경로로 다시 보내기에 대한 테스트 코드입니다."""
+
+import asyncio
+
+import pytest
+
+from src.core import content_generator, llm_backend, model_router
+from src.core.llm_backend import FakeBackend
+from src.core.model_router import (
+    ModelBudget,
+    ModelRouter,
+    RoutedBackend,
+    parse_model_budgets,
+)
+from src.utils.cache import ResponseCache
+from src.utils.rate_limit import TokenBucket
+from src.utils.telemetry import TELEMETRY
+
+PROMPT = content_generator.build_blog_prompt({"keyword": "파이썬", "num_subheadings": 2}, "파이썬")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_router(clock, budgets, failing_keys=()):
+    return ModelRouter(
+        ["key-aaaa", "key-bbbb"],
+        budgets,
+        lambda model_name, api_key: FakeBackend(rate_limit_rate=1.0 if api_key in failing_keys else 0.0),
+        clock,
+    )
+
+
+def test_token_bucket_refills_over_a_minute_and_refunds_unused_tokens():
+    """버킷이 1분에 걸쳐 다시 채워지고, 미리 차감한 양보다 적게 쓰면 되돌려 받는지 테스트합니다."""
+    clock = FakeClock()
+    bucket = TokenBucket(1000, clock)
+    bucket.consume(1000)
+    assert bucket.wait_time(500) == pytest.approx(30.0)
+    assert bucket.utilisation() == 1.0
+
+    clock.advance(15)
+    bucket.consume(-250)
+    assert bucket.wait_time(500) == 0.0 and bucket.utilisation() == pytest.approx(0.5)
+    assert TokenBucket(0, clock).wait_time(10 ** 9) == 0.0
+    assert parse_model_budgets("gemini-1.5-flash, gemini-1.5-pro:5, my-model::100") == [
+        ModelBudget("gemini-1.5-flash", 15, 1_000_000),
+        ModelBudget("gemini-1.5-pro", 5, 32_000),
+        ModelBudget("my-model", 15, 100),
+    ]
+
+
+def test_rate_limited_key_fails_over_to_another_key():
+    """한 키가 호출 한도 초과(429)를 내면 해당 키를 쉬게 하고 다른 키로 보내 호출이 성공하는지 테스트합니다."""
+    clock = FakeClock()
+    router = make_router(clock, [ModelBudget("flash", 10, 0)], failing_keys=("key-aaaa",))
+
+    for _ in range(3):
+        assert router.generate_content("flash", PROMPT).text
+
+    first, second = router.stats()
+    assert (first["key"], first["failures"], first["cooldown_seconds"]) == ("key1-aaaa", 1, model_router.RATE_LIMIT_COOLDOWN_SECONDS)
+    assert (second["key"], second["calls"], second["failures"], second["in_flight"]) == ("key2-bbbb", 3, 0, 0)
+    assert second["request_utilisation"] == pytest.approx(0.3)
+
+    all_failing = make_router(clock, [ModelBudget("flash", 10, 0)], failing_keys=("key-aaaa", "key-bbbb"))
+    with pytest.raises(Exception, match="exhausted"):
+        all_failing.generate_content("flash", PROMPT)
+
+
+def test_router_prefers_requested_model_then_falls_back_and_queues(monkeypatch):
+    """요청한 모델의 예산이 바닥나면 다른 모델로 보내고, 모든 경로가 바닥나면 여유가 생길 때까지 기다리는지 테스트합니다."""
+    clock = FakeClock()
+    monkeypatch.setattr(model_router.time, "sleep", clock.advance)
+    router = ModelRouter(["key-aaaa"], [ModelBudget("flash", 1, 0), ModelBudget("pro", 1, 0)], lambda m, k: FakeBackend(), clock)
+    used = []
+    original_pick = router._pick
+
+    def recording_pick(model_name, tokens, tried):
+        route, wait = original_pick(model_name, tokens, tried)
+        if wait <= 0:
+            used.append(route.model_name)
+        return route, wait
+
+    router._pick = recording_pick
+    for model_name in ("pro", "pro", "pro"):
+        router.generate_content(model_name, PROMPT)
+
+    assert used == ["pro", "flash", "pro"]
+    assert clock.now == pytest.approx(1060.0)
+
+    async def generate_async():
+        return await RoutedBackend(router, "flash").generate_content_async(PROMPT)
+
+    assert asyncio.run(generate_async()).text
+
+
+def test_environment_enables_router_and_long_posts_use_long_model(monkeypatch):
+    """`GEMINI_API_KEYS`가 있으면 라우터 백엔드를 쓰고, "길게" 요청은 `GEMINI_LONG_MODEL`을 우선하는지 테스트합니다."""
+    monkeypatch.setenv("GEMINI_API_KEYS", "key-aaaa, key-bbbb")
+    monkeypatch.setenv("GEMINI_MODELS", "gemini-1.5-flash:15:1000000")
+    monkeypatch.setenv("GEMINI_LONG_MODEL", "gemini-1.5-pro")
+    llm_backend.configure_backend("gemini")
+    try:
+        model_name = content_generator.select_model_name({"desired_length": "길게 (1500+ 단어)"})
+        assert model_name == "gemini-1.5-pro"
+        assert content_generator.select_model_name({"desired_length": "짧게 (500-800 단어)"}) == content_generator.MODEL_NAME
+
+        backend = content_generator.create_llm_model(model_name)
+        assert isinstance(backend, RoutedBackend) and backend.model_name == "gemini-1.5-pro"
+        assert [(s["key"], s["model"]) for s in backend.router.stats()] == [
+            ("key1-aaaa", "gemini-1.5-flash"),
+            ("key2-bbbb", "gemini-1.5-flash"),
+            ("key1-aaaa", "gemini-1.5-pro"),
+            ("key2-bbbb", "gemini-1.5-pro"),
+        ]
+        metrics = TELEMETRY.to_prometheus()
+        assert 'blog_genie_route_queue_depth{key="key2-bbbb",model="gemini-1.5-pro"} 0' in metrics
+    finally:
+        llm_backend.configure_backend("gemini")
+
+
+def test_failover_records_the_model_that_actually_served(tmp_path, monkeypatch):
+    """다른 모델로 다시 보낸 응답은 실제로 응답한 모델 이름으로 캐시에 저장되고 게시물에 기록되는지 테스트합니다."""
+    requested = content_generator.MODEL_NAME
+    router = ModelRouter(
+        ["key-aaaa"],
+        [ModelBudget(requested, 10, 0), ModelBudget("backup-model", 10, 0)],
+        lambda model_name, api_key: FakeBackend(rate_limit_rate=1.0 if model_name == requested else 0.0),
+        FakeClock(),
+    )
+    backend = RoutedBackend(router, requested)
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path / "archive"))
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(content_generator, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(content_generator, "create_llm_model", lambda model_name=None: backend)
+    user_input = {"keyword": "파이썬", "num_subheadings": 2}
+
+    with TELEMETRY.track_usage() as usage:
+        post = content_generator.generate_blog_content(user_input, "파이썬")
+    state_path = content_generator.save_post_state(str(tmp_path / "post.md"), user_input, "파이썬", post, usage)
+
+    assert usage["models"] == ["backup-model"]
+    assert content_generator.load_post_state(state_path)["model"] == "backup-model"
+    prompt = content_generator.build_blog_prompt(user_input, "파이썬")
+    assert cache.get(ResponseCache.make_key(prompt, "backup-model", content_generator.GENERATION_CONFIG)) is not None
+    assert cache.get(ResponseCache.make_key(prompt, requested, content_generator.GENERATION_CONFIG)) is None
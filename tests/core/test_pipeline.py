@@ -0,0 +1,87 @@
+"""파이프라인 실행 기능에 대한 테스트 코드입니다."""
+
+import threading
+
+import pytest
+
+from src.core import pipeline
+from src.core.content_generator import load_post_state
+from src.utils.archive import get_post_archive
+
+
+def fake_stream(user_input, context, use_cache, refresh_cache):
+    yield ("title", "제목")
+    yield ("meta_description", "설명")
+    yield ("section", {"subtitle": "소개", "content": "내용", "image_keyword": None})
+    yield ("section", {"subtitle": "정리", "content": "내용", "image_keyword": None})
+    yield ("tags", ["태그"])
+
+
+def test_stream_pipeline_reports_progress_and_can_be_cancelled(monkeypatch):
+    """진행 단계를 알리고, 취소 요청 시 다음 조각 전에 중단하는지 테스트합니다."""
+    monkeypatch.setattr(pipeline, "generate_blog_content_stream", fake_stream)
+    cancel_event = threading.Event()
+    stages = []
+    received = []
+
+    with pytest.raises(pipeline.PipelineCancelledError):
+        for chunk in pipeline.run_blog_post_pipeline_stream(
+            {"keyword": "파이썬"},
+            save_to_file=False,
+            progress_callback=stages.append,
+            cancel_event=cancel_event,
+        ):
+            received.append(chunk)
+            cancel_event.set()
+
+    assert len(received) == 1
+    assert stages == ["웹 자료 수집 중", "콘텐츠 생성 중", "콘텐츠 생성 중 (1개 조각 수신)"]
+
+
+def test_collect_context_uses_local_corpus_within_budget(tmp_path, monkeypatch):
+    """로컬 문서 디렉터리가 지정되면 관련 청크를 참고 자료로 사용하는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_INDEX_DIR", str(tmp_path / "index"))
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    (corpus / "python.md").write_text("파이썬은 들여쓰기로 블록을 구분합니다.", encoding="utf-8")
+    (corpus / "rust.md").write_text("러스트는 빌림 검사기를 사용합니다.", encoding="utf-8")
+
+    context = pipeline.collect_context({"keyword": "파이썬", "corpus_dir": str(corpus), "context_token_budget": 500})
+    assert "들여쓰기" in context
+    assert "러스트" not in context
+    assert pipeline.collect_context({"keyword": "파이썬"}) == "파이썬"
+
+
+def test_stream_pipeline_saves_post_without_done_event(monkeypatch, tmp_path):
+    """스트리밍 파이프라인이 저장한 구조화된 게시물에 `done` 이벤트가 섞이지 않는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    post = {
+        "title": "제목",
+        "meta_description": "설명",
+        "body": [{"subtitle": "소개", "content": "내용", "image_keyword": None}],
+        "tags": ["태그"],
+    }
+
+    def stream_with_done(user_input, context, use_cache, refresh_cache):
+        yield from fake_stream(user_input, context, use_cache, refresh_cache)
+        yield ("done", post)
+
+    monkeypatch.setattr(pipeline, "generate_blog_content_stream", stream_with_done)
+    list(pipeline.run_blog_post_pipeline_stream({"keyword": "파이썬", "duplicate_policy": "off"}))
+
+    [entry] = get_post_archive().find()
+    saved = load_post_state(entry.path)["post"]
+    assert sorted(saved) == ["body", "meta_description", "tags", "title"]
+    assert saved == post
+
+
+def test_stream_pipeline_saves_in_requested_output_format(monkeypatch, tmp_path):
+    """스트리밍 파이프라인도 `output_format`에 맞는 렌더러로 게시물을 저장하는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(pipeline, "generate_blog_content_stream", fake_stream)
+    list(pipeline.run_blog_post_pipeline_stream({"keyword": "파이썬", "output_format": "html", "duplicate_policy": "off"}))
+
+    [entry] = get_post_archive().find()
+    assert entry.path.endswith(".html") and entry.output_format == "html"
+    with open(entry.path, encoding="utf-8") as f:
+        assert "<h1>제목</h1>" in f.read()
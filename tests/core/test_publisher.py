@@ -0,0 +1,171 @@
+"""Tistory/WordPress 발행 기능을 로컬 스텁 API 서버로 테스트합니다."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.core.publisher import (
+    TistoryClient,
+    WordPressClient,
+    enqueue_post,
+    run_publisher,
+)
+from src.utils.job_queue import PublishQueue
+
+POST = {
+    "title": "파이썬 비동기 프로그래밍",
+    "meta_description": "asyncio 입문",
+    "body": [{"subtitle": "소개", "content": "본문입니다.", "image_keyword": None}],
+    "tags": ["파이썬", "asyncio"],
+}
+
+
+class StubPlatform:
+    """WordPress/Tistory API의 필요한 부분만 흉내 내는 상태 저장소입니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.posts: list[dict] = []
+        self.tags: dict[str, int] = {"파이썬": 7}
+        # Scripted responses for post creation: status code, and whether the post is stored anyway
+        self.create_script: list[tuple[int, bool]] = []
+        self.create_requests = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    platform: StubPlatform
+
+    def _send(self, status: int, body: object | None = None, headers: dict[str, str] | None = None):
+        data = json.dumps(body if body is not None else {}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        platform = self.platform
+        with platform.lock:
+            if url.path == "/wp-json/wp/v2/posts":
+                self._send(200, [post for post in platform.posts if post.get("slug") == query.get("slug")])
+            elif url.path == "/wp-json/wp/v2/tags":
+                self._send(200, [{"id": i, "name": n} for n, i in platform.tags.items() if query["search"] in n])
+            elif url.path == "/apis/post/list":
+                posts = [{"title": post["title"], "postUrl": post["link"]} for post in platform.posts]
+                self._send(200, {"tistory": {"status": "200", "item": {"posts": posts}}})
+            else:
+                self._send(404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._body()
+        platform = self.platform
+        with platform.lock:
+            if url.path == "/wp-json/wp/v2/tags":
+                name = json.loads(body)["name"]
+                platform.tags[name] = 100 + len(platform.tags)
+                self._send(201, {"id": platform.tags[name], "name": name})
+                return
+            if url.path == "/wp-json/wp/v2/posts":
+                post = json.loads(body)
+            elif url.path == "/apis/post/write":
+                post = {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()}
+            else:
+                self._send(404)
+                return
+            platform.create_requests += 1
+            status, stored = platform.create_script.pop(0) if platform.create_script else (201, True)
+            if stored:
+                post["link"] = f"http://blog.example.com/{len(platform.posts) + 1}"
+                platform.posts.append(post)
+            if status == 429:
+                self._send(429, {"code": "rate_limited"}, {"Retry-After": "0"})
+            elif status >= 400:
+                self._send(status, {"code": "error"})
+            elif url.path == "/apis/post/write":
+                self._send(200, {"tistory": {"status": "200", "url": post["link"]}})
+            else:
+                self._send(201, post)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_platform():
+    platform = StubPlatform()
+    handler = type("Handler", (StubHandler,), {"platform": platform})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    platform.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield platform
+    server.shutdown()
+
+
+def _publish(queue, clients, **options):
+    return asyncio.run(run_publisher(queue, clients, backoff_base=0.01, poll_interval=0.05, **options))
+
+
+def test_wordpress_retries_without_double_posting(stub_platform, tmp_path):
+    """429/5xx 응답을 재시도하되, 응답만 유실된 요청이 있어도 게시물이 한 번만 올라가는지 테스트합니다."""
+    # 429, then a 500 after the post was actually stored, then the retry must find it instead of posting again
+    stub_platform.create_script = [(429, False), (500, True)]
+    queue = PublishQueue(str(tmp_path / "queue.sqlite3"))
+    job_id = enqueue_post(POST, "WordPress", queue)
+    assert enqueue_post(POST, "WordPress", queue) == job_id
+
+    client = WordPressClient(stub_platform.url, "editor", "app-password")
+    summary = _publish(queue, {"wordpress": client})
+
+    assert (summary.published, summary.retried, summary.failed) == (1, 2, 0)
+    assert stub_platform.create_requests == 2
+    [post] = stub_platform.posts
+    assert post["title"] == POST["title"] and post["status"] == "draft"
+    assert post["tags"] == [7, stub_platform.tags["asyncio"]]
+    job = queue.get(job_id)
+    assert (job.status, job.remote_url) == ("done", post["link"])
+
+
+def test_permanent_errors_and_exhausted_retries_fail_the_job(stub_platform, tmp_path):
+    """4xx 오류는 즉시, 계속되는 5xx 오류는 최대 시도 횟수 뒤에 실패로 기록되는지 테스트합니다."""
+    stub_platform.create_script = [(400, False), (503, False), (503, False)]
+    queue = PublishQueue(str(tmp_path / "queue.sqlite3"))
+    bad = enqueue_post(POST, "WordPress", queue)
+    flaky = enqueue_post(dict(POST, title="다른 게시물"), "WordPress", queue)
+
+    client = WordPressClient(stub_platform.url, "editor", "app-password")
+    summary = _publish(queue, {"wordpress": client}, concurrency={"wordpress": 1}, max_attempts=2)
+
+    assert (summary.published, summary.failed) == (0, 2)
+    assert stub_platform.posts == []
+    assert queue.get(bad).attempts == 1 and queue.get(flaky).attempts == 2
+    assert queue.stats()["failed"] == 2
+
+
+def test_tistory_uploads_run_concurrently_with_form_parameters(stub_platform, tmp_path):
+    """Tistory 작업이 여러 건 동시에 폼 파라미터로 발행되는지 테스트합니다."""
+    queue = PublishQueue(str(tmp_path / "queue.sqlite3"))
+    for i in range(5):
+        enqueue_post(dict(POST, title=f"게시물 {i}"), "Tistory", queue)
+
+    client = TistoryClient("token", "myblog", stub_platform.url)
+    summary = _publish(queue, {"tistory": client})
+
+    assert summary.published == 5
+    assert sorted(post["title"] for post in stub_platform.posts) == [f"게시물 {i}" for i in range(5)]
+    post = stub_platform.posts[0]
+    assert (post["blogName"], post["access_token"], post["tag"], post["visibility"]) == ("myblog", "token", "파이썬,asyncio", "0")
+    assert queue.stats()["done"] == 5
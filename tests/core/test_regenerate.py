@@ -0,0 +1,81 @@
+"""저장된 게시물의 부분 재생성 기능에 대한 테스트 코드입니다."""
+
+import json
+
+from src.core import fanout, regenerate
+from src.core.content_generator import load_post_state, save_post_state
+from src.utils.cache import ResponseCache
+
+USER_INPUT = {"keyword": "파이썬", "num_subheadings": 5, "tone_of_voice": "전문적", "seo_optimization_level": "강화"}
+POST = {
+    "title": "파이썬 가이드",
+    "meta_description": "파이썬 입문",
+    "body": [{"subtitle": f"소제목 {i}", "content": f"기존 단락 {i} " * 20, "image_keyword": None} for i in range(7)],
+    "tags": ["파이썬", "입문"],
+}
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+def test_plan_regeneration_only_touches_affected_parts():
+    """설정 변경과 수정 요청에 따라 필요한 부분만 재생성 계획에 포함되는지 테스트합니다."""
+    plan = regenerate.plan_regeneration(USER_INPUT, dict(USER_INPUT, output_format="html"), 7)
+    assert plan.model_calls == 0
+
+    plan = regenerate.plan_regeneration(USER_INPUT, USER_INPUT, 7, {3: "예제 추가"}, regenerate_tags=True)
+    assert (plan.sections, plan.header, plan.tags, plan.model_calls) == ({3: "예제 추가"}, False, True, 2)
+
+    plan = regenerate.plan_regeneration(USER_INPUT, dict(USER_INPUT, seo_optimization_level="기본"), 7)
+    assert (plan.sections, plan.header, plan.tags, plan.model_calls) == ({}, True, True, 1)
+
+    assert regenerate.plan_regeneration(USER_INPUT, dict(USER_INPUT, tone_of_voice="친근한"), 7).model_calls == 8
+    assert regenerate.plan_regeneration(USER_INPUT, dict(USER_INPUT, num_subheadings=3), 7).full
+
+
+def test_editing_one_section_costs_one_call(monkeypatch, tmp_path):
+    """단락 하나를 수정하면 모델을 한 번만 호출하고 나머지 단락은 그대로 유지하는지 테스트합니다."""
+    prompts = []
+
+    async def fake_call(model, prompt, generation_config, stage):
+        prompts.append((stage, prompt))
+        return FakeResponse("예제 코드가 추가된 새 단락입니다. " * 10)
+
+    monkeypatch.setattr(fanout, "create_llm_model", lambda model_name=None: object())
+    monkeypatch.setattr(fanout, "call_gemini_async", fake_call)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(fanout, "get_response_cache", lambda: cache)
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path / "archive"))
+
+    output_path = str(tmp_path / "post.md")
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("old")
+    save_post_state(output_path, USER_INPUT, "참고 자료", POST)
+
+    result = regenerate.regenerate_post(output_path, section_edits={2: "예제 코드 추가"}, use_cache=False)
+
+    assert result == output_path
+    [(stage, prompt)] = prompts
+    assert stage == "section"
+    assert "**작성할 단락:** 3. 소제목 2" in prompt and "**수정 요청:** 예제 코드 추가" in prompt
+    assert POST["body"][2]["content"] in prompt and "참고 자료" in prompt
+
+    state = load_post_state(output_path)
+    assert state["post"]["body"][2]["content"].startswith("예제 코드가 추가된")
+    assert [s["content"] for i, s in enumerate(state["post"]["body"]) if i != 2] == [
+        s["content"] for i, s in enumerate(POST["body"]) if i != 2
+    ]
+    with open(output_path, encoding="utf-8") as f:
+        rendered = f.read()
+    assert rendered.startswith("# 파이썬 가이드") and "예제 코드가 추가된" in rendered
+
+
+def test_section_prompt_without_edits_is_unchanged():
+    """수정 요청이 없으면 단락 프롬프트(캐시 키)가 기존과 같은지 테스트합니다."""
+    outline = regenerate.outline_from_post(POST)
+    prompt = fanout.build_section_prompt(USER_INPUT, "참고 자료", outline, 0)
+    assert "수정 요청" not in prompt and "기존 단락 내용" not in prompt
+    assert "참고 자료\n\n이 단락의 본문 내용만" in prompt
+    assert json.loads(json.dumps(outline))["sections"][0]["summary"] == "소제목 0"
@@ -0,0 +1,89 @@
+"""다중 형식 렌더링 엔진에 대한 테스트 코드입니다."""
+
+import io
+import json
+
+import pytest
+
+from src.core.renderer import TemplateRenderer, get_renderer, markdown_to_html
+
+POST = {
+    "title": "파이썬 <입문>",
+    "meta_description": "파이썬 \"안내\"",
+    "body": [
+        {"subtitle": "소개", "content": "파이썬은 **쉽습니다**.\n\n* 설치\n* `pip` 사용", "image_keyword": None},
+        {"subtitle": "정리", "content": "마무리합니다.", "image_keyword": "요약 -- 도표"},
+    ],
+    "tags": ["파이썬", "입문"],
+}
+
+
+def test_markdown_renderer_streams_the_same_output_it_renders():
+    """파일로 바로 쓴 마크다운이 `render` 결과와 같은지 테스트합니다."""
+    renderer = TemplateRenderer("markdown")
+    handle = io.StringIO()
+    renderer.render_to(POST, handle)
+
+    assert handle.getvalue() == renderer.render(POST)
+    assert handle.getvalue().startswith("# 파이썬 <입문>\n\n> **Meta Description:** 파이썬 \"안내\"")
+    assert "<!-- Recommended image query: \"요약 -- 도표\" -->" in handle.getvalue()
+    assert handle.getvalue().endswith("**Tags:** #파이썬, #입문")
+
+
+def test_html_renderer_escapes_fields_and_converts_markdown():
+    """HTML 렌더러가 필드를 이스케이프하고 본문 마크다운을 HTML로 변환하는지 테스트합니다."""
+    rendered = TemplateRenderer("html").render(POST)
+
+    assert "<h1>파이썬 &lt;입문&gt;</h1>" in rendered
+    assert '<meta name="description" content="파이썬 &quot;안내&quot;">' in rendered
+    assert "<p>파이썬은 <strong>쉽습니다</strong>.</p>\n<ul>\n<li>설치</li>\n<li><code>pip</code> 사용</li>\n</ul>" in rendered
+    assert "요약 - - 도표" in rendered
+
+
+@pytest.mark.parametrize("output_format", ["tistory", "wordpress"])
+def test_platform_payloads_are_valid_json_with_html_content(output_format):
+    """발행 플랫폼 형식이 HTML 본문을 담은 유효한 JSON 요청 본문인지 테스트합니다."""
+    payload = json.loads(TemplateRenderer(output_format).render(POST))
+
+    assert payload["title"] == "파이썬 <입문>"
+    assert payload["content"].startswith("<section>\n<h2>소개</h2>\n<p>")
+    if output_format == "tistory":
+        assert payload["tag"] == "파이썬,입문"
+    else:
+        assert payload["tags"] == ["파이썬", "입문"]
+        assert payload["excerpt"] == "파이썬 \"안내\""
+
+
+def test_custom_templates_are_compiled_once_and_validated(tmp_path):
+    """사용자 템플릿을 한 번만 컴파일하고, 잘못된 템플릿과 형식은 거부하는지 테스트합니다."""
+    document = tmp_path / "document.txt"
+    section = tmp_path / "section.txt"
+    document.write_text("{title}\n{sections}-- {tags}", encoding="utf-8")
+    section.write_text("{index}. {subtitle}\n", encoding="utf-8")
+
+    renderer = get_renderer("markdown", str(document), str(section))
+    assert renderer is get_renderer("markdown", str(document), str(section))
+    assert renderer.render(POST) == "파이썬 <입문>\n1. 소개\n2. 정리\n-- #파이썬, #입문"
+
+    with pytest.raises(ValueError):
+        TemplateRenderer("markdown", document_template="{title} {author} {sections}")
+    with pytest.raises(ValueError):
+        TemplateRenderer("markdown", document_template="{title} 본문 없음")
+    with pytest.raises(ValueError):
+        TemplateRenderer("pdf")
+
+
+def test_markdown_to_html_handles_code_blocks_and_ordered_lists():
+    """코드 블록과 번호 목록을 HTML로 변환하는지 테스트합니다."""
+    rendered = markdown_to_html("1. 첫째\n2. 둘째\n\n```\nprint('<hi>')\n```")
+
+    assert rendered == "<ol>\n<li>첫째</li>\n<li>둘째</li>\n</ol>\n<pre><code>print('&lt;hi&gt;')</code></pre>"
+
+
+def test_markdown_links_cannot_add_html_attributes():
+    """링크 주소의 따옴표가 이스케이프되어 HTML 속성을 추가할 수 없는지 테스트합니다."""
+    rendered = markdown_to_html('[x](https://a.com/"onmouseover="alert(1))')
+
+    assert 'onmouseover="' not in rendered
+    assert rendered == '<p><a href="https://a.com/&quot;onmouseover=&quot;alert(1">x</a>)</p>'
+    assert markdown_to_html("[문서](https://a.com/?a=1&b=2)") == '<p><a href="https://a.com/?a=1&amp;b=2">문서</a></p>'
@@ -0,0 +1,70 @@
+"""웹 자료 수집 기능에 대한 테스트 코드입니다."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.content_generator import WebContentError
+from src.core.web_collector import collect_web_context
+
+SHARED = "파이썬은 읽기 쉬운 문법과 방대한 표준 라이브러리를 갖춘 범용 프로그래밍 언어입니다."
+PAGES = {
+    "/a": f"<html><head><script>var x = 'ignored script text that is long enough';</script></head>"
+          f"<body><nav>메뉴 메뉴 메뉴 메뉴 메뉴 메뉴 메뉴 메뉴 메뉴 메뉴 메뉴</nav>"
+          f"<p>{SHARED}</p><p>가상 환경은 venv 모듈로 만들 수 있으며 프로젝트별 의존성을 격리합니다.</p></body></html>",
+    "/b": f"<html><body><div>{SHARED}  </div><p>pip는 파이썬 패키지를 설치하고 관리하는 표준 도구로, 대부분의 프로젝트에서 널리 쓰입니다.</p></body></html>",
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/hang":
+            time.sleep(3)
+        if self.path not in PAGES:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = PAGES[self.path].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_collect_skips_failures_dedupes_and_bounds_time(stub_server):
+    """실패/지연 출처를 건너뛰고, 중복 문단을 제거하며, 전체 시간 제한을 지키는지 테스트합니다."""
+    urls = [f"{stub_server}/a", f"{stub_server}/missing", f"{stub_server}/hang", f"{stub_server}/b"]
+
+    start = time.perf_counter()
+    context = asyncio.run(collect_web_context(urls, total_timeout=1.0))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0
+    assert context.startswith(f"--- [Source: {stub_server}/a] ---\n")
+    assert f"--- [Source: {stub_server}/b] ---" in context
+    assert context.count(SHARED) == 1
+    assert "ignored script" not in context and "메뉴" not in context
+    assert "pip는" in context
+
+
+def test_collect_raises_when_every_source_fails(stub_server):
+    """모든 출처가 실패하면 WebContentError를 발생시키는지 테스트합니다."""
+    with pytest.raises(WebContentError):
+        asyncio.run(collect_web_context([f"{stub_server}/missing"]))
@@ -0,0 +1,79 @@
+"""게시물 보관소의 원자적 저장, 압축, 색인 조회에 대한 테스트 코드입니다."""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core import content_generator
+from src.utils.archive import PostArchive, get_post_archive, read_text
+
+POST = {"title": "파이썬 가이드", "meta_description": "입문", "body": [], "tags": ["파이썬", "#입문"]}
+
+
+def test_same_day_reruns_do_not_overwrite(tmp_path):
+    """같은 날 같은 키워드로 다시 저장하면 번호가 붙은 새 파일이 만들어지는지 테스트합니다."""
+    archive = PostArchive(tmp_path)
+    first = archive.save("파이썬 입문", ".md", lambda f: f.write("첫 번째"))
+    second = archive.save("파이썬 입문", ".md", lambda f: f.write("두 번째"))
+
+    today = datetime.now()
+    assert os.path.dirname(first) == str(tmp_path / today.strftime("%Y") / today.strftime("%m"))
+    assert os.path.basename(first) == f"{today:%Y%m%d}_파이썬_입문.md"
+    assert os.path.basename(second) == f"{today:%Y%m%d}_파이썬_입문_2.md"
+    assert read_text(first) == "첫 번째" and read_text(second) == "두 번째"
+    assert archive.get(first).content_hash != archive.get(second).content_hash
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    """기록 중 오류가 나면 기존 파일이 그대로 남고 임시 파일도 남지 않는지 테스트합니다."""
+    archive = PostArchive(tmp_path)
+    path = archive.save("파이썬", ".md", lambda f: f.write("기존 내용"))
+
+    def broken(f):
+        f.write("반쯤 기록된 ")
+        raise RuntimeError("렌더링 실패")
+
+    with pytest.raises(RuntimeError):
+        archive.save("파이썬", ".md", broken, path=path)
+    assert read_text(path) == "기존 내용"
+    assert [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".tmp")] == []
+
+
+def test_compressed_posts_round_trip(monkeypatch, tmp_path):
+    """압축 설정이면 게시물과 구조화된 게시물 파일을 gzip으로 저장하고 다시 읽을 수 있는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_COMPRESS", "1")
+    path = content_generator.save_post_to_file(POST, "파이썬", "Markdown File Only")
+    state_path = content_generator.save_post_state(path, {"keyword": "파이썬"}, "참고 자료", POST, {"prompt_tokens": 10})
+
+    assert path.endswith(".md.gz") and state_path.endswith(".md.post.json.gz")
+    assert read_text(path).startswith("# 파이썬 가이드")
+    assert content_generator.load_post_state(path)["post"] == POST
+    with open(path, "rb") as f:
+        assert f.read(2) == b"\x1f\x8b"
+
+
+def test_index_answers_keyword_tag_and_period_queries(monkeypatch, tmp_path):
+    """색인으로 키워드 생성 여부, 태그와 기간 조건의 게시물을 찾고 설정/토큰 사용량을 기록하는지 테스트합니다."""
+    monkeypatch.setenv("BLOG_GENIE_ARCHIVE_DIR", str(tmp_path))
+    path = content_generator.save_post_to_file(POST, "파이썬", "Markdown File Only")
+    content_generator.save_post_state(
+        path, {"keyword": "파이썬", "tone_of_voice": "전문적"}, "참고 자료", POST, {"prompt_tokens": 120, "response_tokens": 800}
+    )
+    content_generator.save_post_state(path, {"keyword": "파이썬"}, "참고 자료", POST, {"prompt_tokens": 30, "response_tokens": 50})
+    other = get_post_archive().save("러스트", ".md", lambda f: f.write("러스트"))
+    get_post_archive().record(other, post={"title": "러스트", "tags": ["러스트"]})
+
+    archive = get_post_archive()
+    assert archive.has_keyword(" 파이썬 ") and not archive.has_keyword("자바")
+
+    month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    [entry] = archive.find(tag="입문", since=month_start)
+    assert entry.path == path and entry.title == "파이썬 가이드" and entry.tags == ["파이썬", "입문"]
+    assert (entry.prompt_tokens, entry.response_tokens) == (150, 850)
+    assert entry.settings == {"keyword": "파이썬"} and entry.output_format == "markdown"
+    assert archive.find(tag="입문", until=month_start) == []
+    assert [e.keyword for e in archive.find()] == ["러스트", "파이썬"]
+    assert [e.keyword for e in archive.find(keyword="파이썬", since=datetime.now() - timedelta(hours=1))] == ["파이썬"]
+    assert archive.stats()["posts"] == 2
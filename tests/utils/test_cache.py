@@ -0,0 +1,73 @@
+"""응답 캐시에 대한 테스트 코드입니다."""
+
+import asyncio
+import json
+
+from src.core import content_generator, fanout
+from src.core.llm_backend import FakeBackend
+from src.utils.cache import ResponseCache
+
+
+def test_cache_hit_miss_and_eviction(tmp_path):
+    """적중/미스 횟수와 최대 항목 수 기반 제거를 테스트합니다."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    keys = [ResponseCache.make_key(f"prompt {i}", "model") for i in range(3)]
+
+    assert cache.get(keys[0]) is None
+    for i, key in enumerate(keys):
+        cache.put(key, f"response {i}")
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == "response 2"
+    assert cache.stats() == {"hits": 1, "misses": 2, "writes": 3, "evictions": 1}
+
+
+def test_cache_key_depends_on_model_and_config():
+    """모델명이나 생성 설정이 다르면 다른 키가 만들어지는지 테스트합니다."""
+    base = ResponseCache.make_key("prompt", "model-a", {"temperature": 0.1})
+
+    assert base == ResponseCache.make_key("prompt", "model-a", {"temperature": 0.1})
+    assert base != ResponseCache.make_key("prompt", "model-b", {"temperature": 0.1})
+    assert base != ResponseCache.make_key("prompt", "model-a", {"temperature": 0.9})
+
+
+def test_generate_blog_content_skips_model_on_cache_hit(tmp_path, monkeypatch):
+    """캐시 적중 시 Gemini 모델을 생성하지 않는지 테스트합니다."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(content_generator, "get_response_cache", lambda: cache)
+
+    def fail_create_model():
+        raise AssertionError("model should not be created on a cache hit")
+
+    monkeypatch.setattr(content_generator, "create_llm_model", fail_create_model)
+    user_input = {"keyword": "파이썬"}
+    prompt = content_generator.build_blog_prompt(user_input, "파이썬")
+    post = {
+        "title": "파이썬",
+        "meta_description": "설명",
+        "body": [{"subtitle": "소개", "content": "가" * 400, "image_keyword": None}],
+        "tags": "파이썬, 코딩",
+    }
+    key = cache.make_key(prompt, content_generator.MODEL_NAME, content_generator.GENERATION_CONFIG)
+    cache.put(key, json.dumps(post, ensure_ascii=False))
+
+    result = content_generator.generate_blog_content(user_input, "파이썬")
+
+    assert result["tags"] == ["파이썬", "코딩"]
+
+
+def test_disabled_cache_is_never_opened(monkeypatch):
+    """`use_cache=False`이면 캐시 파일을 열거나 만들지 않는지 테스트합니다."""
+    def fail_open_cache():
+        raise AssertionError("cache should not be opened when use_cache is False")
+
+    monkeypatch.setattr(content_generator, "get_response_cache", fail_open_cache)
+    monkeypatch.setattr(fanout, "get_response_cache", fail_open_cache)
+    monkeypatch.setattr(content_generator, "create_llm_model", lambda model_name=None: FakeBackend())
+    monkeypatch.setattr(fanout, "create_llm_model", lambda model_name=None: FakeBackend())
+    user_input = {"keyword": "파이썬", "num_subheadings": 2}
+
+    assert content_generator.generate_blog_content(user_input, "파이썬", use_cache=False)["body"]
+    assert asyncio.run(content_generator.generate_blog_content_async(user_input, "파이썬", use_cache=False))["body"]
+    assert list(content_generator.generate_blog_content_stream(user_input, "파이썬", use_cache=False))[-1][0] == "done"
+    assert asyncio.run(fanout.generate_blog_content_fanout(user_input, "파이썬", use_cache=False))["body"]
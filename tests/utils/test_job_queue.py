@@ -0,0 +1,43 @@
+"""발행 작업 대기열에 대한 테스트 코드입니다."""
+
+import time
+
+from src.utils.job_queue import PublishQueue
+
+PAYLOAD = {"title": "파이썬 가이드", "content": "<p>본문</p>"}
+
+
+def test_enqueue_is_idempotent_and_survives_reopen(tmp_path):
+    """같은 게시물은 한 번만 저장되고, 대기열을 다시 열어도 작업이 남아 있는지 테스트합니다."""
+    path = str(tmp_path / "queue.sqlite3")
+    queue = PublishQueue(path)
+    first = queue.enqueue("wordpress", PAYLOAD)
+    assert queue.enqueue("wordpress", dict(PAYLOAD)) == first
+    assert queue.enqueue("tistory", PAYLOAD) != first
+
+    reopened = PublishQueue(path)
+    assert reopened.stats()["pending"] == 2
+
+
+def test_claimed_job_is_leased_until_it_expires(tmp_path):
+    """가져간 작업은 임대 중에 다시 나오지 않고, 작업자가 중단되어 임대가 끝나면 다시 처리되는지 테스트합니다."""
+    queue = PublishQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.2)
+    job_id = queue.enqueue("wordpress", PAYLOAD)
+
+    [job] = queue.claim(5)
+    assert (job.id, job.attempts) == (job_id, 1)
+    assert queue.claim(5) == []
+
+    time.sleep(0.25)
+    [reclaimed] = queue.claim(5)
+    assert (reclaimed.id, reclaimed.attempts) == (job_id, 2)
+
+    queue.retry_later(job_id, "HTTP 503", delay_seconds=60)
+    assert queue.claim(5) == []
+    assert 0 < queue.next_due_in() <= 60
+    assert queue.next_due_in(["tistory"]) is None
+
+    queue.complete(job_id, "https://blog.example.com/1")
+    assert queue.next_due_in() is None
+    assert queue.get(job_id).remote_url == "https://blog.example.com/1"
+    assert queue.stats() == {"pending": 0, "in_progress": 0, "done": 1, "failed": 0}
@@ -0,0 +1,31 @@
+"""JSON 복구 파서에 대한 테스트 코드입니다."""
+
+import pytest
+
+from src.utils.json_repair import repair_json
+
+
+def test_repair_trailing_commas_and_surrounding_prose():
+    """후행 쉼표와 앞뒤 설명 문장을 제거하는지 테스트합니다."""
+    text = '결과입니다:\n```json\n{"title": "제목", "tags": ["a", "b",],}\n```\n감사합니다.'
+
+    assert repair_json(text) == ({"title": "제목", "tags": ["a", "b"]}, False)
+
+
+def test_repair_truncated_output_keeps_completed_values():
+    """잘린 출력에서 완성된 값만 남기고 열린 괄호를 닫는지 테스트합니다."""
+    text = '{"title": "제목", "body": [{"subtitle": "하나", "content": "내용\n1"}, {"subtitle": "둘", "content": "중간에 잘'
+
+    repaired, truncated = repair_json(text)
+
+    assert truncated
+    assert repaired == {
+        "title": "제목",
+        "body": [{"subtitle": "하나", "content": "내용\n1"}, {"subtitle": "둘"}],
+    }
+
+
+def test_repair_without_object_raises():
+    """JSON 객체가 없는 응답은 ValueError를 발생시키는지 테스트합니다."""
+    with pytest.raises(ValueError):
+        repair_json("죄송합니다. 요청을 처리할 수 없습니다.")
@@ -0,0 +1,53 @@
+"""점진적 JSON 파서에 대한 테스트 코드입니다."""
+
+import json
+
+from src.utils.json_stream import IncrementalBlogParser
+
+POST = {
+    "title": "파이썬 \"입문\" 가이드",
+    "meta_description": "파이썬을 {처음} 배우는 분들을 위한 안내",
+    "body": [
+        {"subtitle": "소개", "content": "* 리스트 [1, 2]\n* 중괄호 }", "image_keyword": None},
+        {"subtitle": "설치", "content": "pip install", "image_keyword": "파이썬 설치 화면"},
+    ],
+    "tags": "파이썬, 입문",
+}
+
+
+def test_sections_are_emitted_as_soon_as_they_close():
+    """단락 객체가 닫히는 청크에서 바로 이벤트가 나오는지 테스트합니다."""
+    text = "```json\n" + json.dumps(POST, ensure_ascii=False) + "\n```"
+    parser = IncrementalBlogParser()
+    first_section_end = text.index("}", text.index('"image_keyword"')) + 1
+
+    early_events = parser.feed(text[:first_section_end])
+    late_events = [event for char in text[first_section_end:] for event in parser.feed(char)]
+
+    assert early_events == [
+        ("title", POST["title"]),
+        ("meta_description", POST["meta_description"]),
+        ("section", POST["body"][0]),
+    ]
+    assert late_events == [("section", POST["body"][1]), ("tags", ["파이썬", "입문"])]
+    assert parser.finished
+
+
+def test_near_valid_values_are_repaired_instead_of_raising():
+    """후행 쉼표나 줄바꿈이 섞인 값은 복구해서 내보내고, 복구할 수 없는 값은 건너뛰는지 테스트합니다."""
+    text = (
+        '{"title": "파이썬\n입문", "body": ['
+        '{"subtitle": "소개", "content": "내용",}, '
+        '{"subtitle": "설치", "content": "내용" "끝"}, '
+        '{"subtitle": "정리", "content": "내용"}'
+        '], "tags": ["파이썬", "입문",]}'
+    )
+
+    events = IncrementalBlogParser().feed(text)
+
+    assert events == [
+        ("title", "파이썬\n입문"),
+        ("section", {"subtitle": "소개", "content": "내용"}),
+        ("section", {"subtitle": "정리", "content": "내용"}),
+        ("tags", ["파이썬", "입문"]),
+    ]
@@ -0,0 +1,56 @@
+"""계측 기능에 대한 테스트 코드입니다."""
+
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.telemetry import Telemetry, configure_logging
+
+
+def test_span_and_counters_are_exported_as_json_and_prometheus(tmp_path):
+    """단계 기록과 카운터, 토큰 사용량이 JSON과 Prometheus 형식으로 내보내지는지 테스트합니다."""
+    telemetry = Telemetry()
+    with telemetry.span("llm_call", stage="blog"):
+        pass
+    with pytest.raises(ValueError), telemetry.span("llm_call", stage="blog"):
+        raise ValueError("실패")
+    telemetry.incr("llm_retries", stage="blog")
+    usage = SimpleNamespace(prompt_token_count=120, candidates_token_count=800)
+    telemetry.record_usage(SimpleNamespace(usage_metadata=usage), "blog")
+    telemetry.record_usage(SimpleNamespace(), "blog")
+
+    snapshot = telemetry.snapshot()
+    assert snapshot["spans"]["llm_call"]["count"] == 2
+    assert snapshot["spans"]["llm_call"]["errors"] == 1
+    assert {"name": "llm_tokens", "labels": {"kind": "response", "stage": "blog"}, "value": 800} in snapshot["counters"]
+
+    prometheus = telemetry.to_prometheus()
+    assert 'blog_genie_span_seconds_count{span="llm_call"} 2' in prometheus
+    assert 'blog_genie_llm_retries_total{stage="blog"} 1' in prometheus
+    assert 'blog_genie_llm_tokens_total{kind="prompt",stage="blog"} 120' in prometheus
+
+    telemetry.export(str(tmp_path / "metrics.json"))
+    assert json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8")) == snapshot
+    assert "토큰 사용량: 프롬프트 120, 응답 800" in telemetry.format()
+
+
+def test_structured_log_writes_span_fields_as_jsonl(tmp_path):
+    """단계 기록의 필드와 일반 로그가 JSONL 파일에 한 줄씩 남는지 테스트합니다."""
+    log_path = tmp_path / "run.jsonl"
+    configure_logging(jsonl_path=str(log_path))
+    try:
+        with Telemetry().span("render", engine="single"):
+            pass
+        logging.getLogger("src.core.pipeline").warning("경고 메시지")
+    finally:
+        configure_logging()
+
+    entries = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert entries[0]["event"] == "span"
+    assert entries[0]["span"] == "render"
+    assert entries[0]["engine"] == "single"
+    assert entries[0]["status"] == "ok"
+    assert entries[1]["level"] == "WARNING"
+    assert entries[1]["message"] == "경고 메시지"